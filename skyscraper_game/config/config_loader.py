@@ -0,0 +1,298 @@
+"""Загрузка, проверка и компиляция JSON-конфигураций игры.
+
+Файлы ищутся рядом с этим модулем, а не относительно рабочего каталога.
+Каждый файл проверяется по схеме, ключи словарей интернируются, по
+конфигурациям строится таблица ставок (RateTable). Скомпилированный
+результат кэшируется на диске: кэш действителен, пока у файлов те же
+время изменения и размер, а при их изменении - тот же хэш содержимого.
+"""
+import hashlib
+import json
+import os
+import pickle
+import sys
+import tempfile
+
+from .rate_table import RateTable
+
+CONFIG_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_PATH = os.path.join(CONFIG_DIR, "__pycache__", "compiled_config.pickle")
+CACHE_VERSION = 1
+
+
+def code_fingerprint():
+    """Хэш исходного кода компиляции конфигураций (этот модуль и таблица ставок).
+
+    Входит в ключ дискового кэша: после изменения схем, компиляции или
+    RateTable старый pickle не подходит, даже если JSON-файлы те же.
+    """
+    digest = hashlib.sha256()
+    for module_path in (__file__, os.path.join(CONFIG_DIR, "rate_table.py")):
+        with open(module_path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+CODE_FINGERPRINT = code_fingerprint()
+
+NUMBER = (int, float)
+
+# Схемы: словарь - объект с полями ("?" в начале - необязательное поле,
+# "*" - любые ключи), список из одного элемента - список таких элементов,
+# тип или кортеж типов - значение
+FLOOR_SCHEMA = {
+    "base_floor_cost": NUMBER,
+    "cost_increase_per_floor": NUMBER,
+    "max_floors": int,
+    "floor_types": {
+        "*": {
+            "name": str,
+            "base_income": NUMBER,
+            "income_growth": NUMBER,
+            "repair_cost_multiplier": NUMBER,
+            "maintenance_cost": NUMBER,
+            "unlock_at_floor": int
+        }
+    },
+    "repair_levels": {
+        "*": {
+            "cost_multiplier": NUMBER,
+            "income_multiplier": NUMBER
+        }
+    }
+}
+
+MANAGER_SCHEMA = {
+    "managers": {
+        "*": {
+            "name": str,
+            "cost": NUMBER,
+            "income_bonus": NUMBER,
+            "auto_collect": bool,
+            "unlock_at_floor": int,
+            "?repair_cost_reduction": NUMBER,
+            "?maintenance_reduction": NUMBER
+        }
+    }
+}
+
+UPGRADE_SCHEMA = {
+    "global_upgrades": {
+        "*": {
+            "name": str,
+            "description": str,
+            "levels": [{
+                "cost": NUMBER,
+                "?income_bonus": NUMBER,
+                "?attraction_bonus": NUMBER,
+                "?maintenance_reduction": NUMBER
+            }]
+        }
+    }
+}
+
+# (атрибут GameConfig, файл, схема)
+CONFIG_FILES = (
+    ("FLOOR_CONFIG", "floor_prices.json", FLOOR_SCHEMA),
+    ("MANAGER_CONFIG", "manager_prices.json", MANAGER_SCHEMA),
+    ("UPGRADE_CONFIG", "upgrade_costs.json", UPGRADE_SCHEMA),
+)
+
+
+class ConfigError(Exception):
+    """Конфигурация не загружена или не прошла проверку"""
+    def __init__(self, errors):
+        super().__init__("; ".join(errors))
+        self.errors = errors
+
+
+def validate(value, schema, path=""):
+    """Проверить значение по схеме, вернуть список ошибок"""
+    if isinstance(schema, dict):
+        if not isinstance(value, dict):
+            return [f"{path or '/'}: ожидается объект"]
+        errors = []
+        for key, field_schema in schema.items():
+            if key == "*":
+                if not value:
+                    errors.append(f"{path or '/'}: пустой объект")
+                for name, item in value.items():
+                    errors.extend(validate(item, field_schema, f"{path}/{name}"))
+                continue
+            optional = key.startswith("?")
+            key = key.lstrip("?")
+            if key not in value:
+                if not optional:
+                    errors.append(f"{path}/{key}: отсутствует поле")
+                continue
+            errors.extend(validate(value[key], field_schema, f"{path}/{key}"))
+        return errors
+
+    if isinstance(schema, list):
+        if not isinstance(value, list) or not value:
+            return [f"{path}: ожидается непустой список"]
+        errors = []
+        for position, item in enumerate(value):
+            errors.extend(validate(item, schema[0], f"{path}[{position}]"))
+        return errors
+
+    # bool в Python - подкласс int, но числом в конфиге не считается
+    if isinstance(value, bool) and schema is not bool:
+        return [f"{path}: ожидается число, получено {value!r}"]
+    if not isinstance(value, schema):
+        return [f"{path}: неверный тип значения {value!r}"]
+    if isinstance(value, NUMBER) and not isinstance(value, bool) and value < 0:
+        return [f"{path}: отрицательное значение {value!r}"]
+    return []
+
+
+def intern_keys(pairs):
+    """object_pairs_hook для json: интернирует ключи словарей"""
+    return {sys.intern(key): value for key, value in pairs}
+
+
+class CompiledConfig:
+    """Проверенные конфигурации и построенная по ним таблица ставок"""
+    def __init__(self, sections, rate_table, files):
+        self.sections = sections      # атрибут GameConfig -> данные JSON
+        self.rate_table = rate_table
+        self.files = files            # файл -> (время изменения, размер, sha256)
+
+
+class ConfigLoader:
+    """Загрузчик конфигураций с дисковым кэшем скомпилированного вида"""
+    def __init__(self, config_dir=CONFIG_DIR, cache_path=CACHE_PATH):
+        self.config_dir = config_dir
+        self.cache_path = cache_path
+        self.loaded_stats = None  # файл -> (время изменения, размер) последней загрузки
+
+    def path(self, filename):
+        return os.path.join(self.config_dir, filename)
+
+    def file_stats(self):
+        """Время изменения и размер файлов конфигурации"""
+        stats = {}
+        for _, filename, _ in CONFIG_FILES:
+            try:
+                stat = os.stat(self.path(filename))
+                stats[filename] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                stats[filename] = None
+        return stats
+
+    def changed(self):
+        """Изменились ли файлы с последней загрузки"""
+        return self.loaded_stats is not None and self.file_stats() != self.loaded_stats
+
+    def load(self):
+        """Скомпилированная конфигурация (из кэша, если файлы не менялись)"""
+        stats = self.file_stats()
+        compiled = self.load_cache(stats)
+        if compiled is None:
+            compiled = self.compile(stats)
+            self.write_cache(compiled)
+        self.loaded_stats = stats
+        return compiled
+
+    def read_files(self):
+        """Содержимое файлов конфигурации (байты)"""
+        contents = {}
+        errors = []
+        for _, filename, _ in CONFIG_FILES:
+            try:
+                with open(self.path(filename), 'rb') as f:
+                    contents[filename] = f.read()
+            except OSError as e:
+                errors.append(f"{filename}: {e}")
+        if errors:
+            raise ConfigError(errors)
+        return contents
+
+    def compile(self, stats, contents=None):
+        """Прочитать, проверить и скомпилировать конфигурации"""
+        if contents is None:
+            contents = self.read_files()
+        sections = {}
+        errors = []
+        for attribute, filename, schema in CONFIG_FILES:
+            try:
+                data = json.loads(contents[filename].decode('utf-8'), object_pairs_hook=intern_keys)
+            except ValueError as e:
+                errors.append(f"{filename}: {e}")
+                continue
+            errors.extend(f"{filename}{error}" for error in validate(data, schema))
+            sections[attribute] = data
+        if errors:
+            raise ConfigError(errors)
+
+        rate_table = RateTable(sections["FLOOR_CONFIG"], sections["MANAGER_CONFIG"])
+        files = {filename: stats[filename] + (hashlib.sha256(contents[filename]).hexdigest(),)
+                 for filename in contents}
+        return CompiledConfig(sections, rate_table, files)
+
+    def compile_overlay(self, directory):
+        """Конфигурация, в которой файлы из directory заменяют базовые (без дискового кэша)"""
+        stats = self.file_stats()
+        contents = self.read_files()
+        for _, filename, _ in CONFIG_FILES:
+            path = os.path.join(directory, filename)
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    contents[filename] = f.read()
+                stat = os.stat(path)
+                stats[filename] = (stat.st_mtime_ns, stat.st_size)
+        return self.compile(stats, contents)
+
+    def load_cache(self, stats):
+        """Конфигурация из дискового кэша или None, если кэш устарел"""
+        # Любая ошибка чтения или распаковки (в том числе от старых классов) - промах кэша
+        try:
+            with open(self.cache_path, 'rb') as f:
+                cached = pickle.load(f)
+            if (cached.get("version") != CACHE_VERSION or cached.get("code") != CODE_FINGERPRINT
+                    or not isinstance(cached.get("config"), CompiledConfig)):
+                return None
+            compiled = cached["config"]
+            files = dict(compiled.files)
+        except Exception:
+            return None
+
+        # Быстрая проверка по времени изменения и размеру, затем по хэшу
+        if all(files.get(filename, ())[:2] == stat for filename, stat in stats.items()):
+            return compiled
+        try:
+            contents = self.read_files()
+        except ConfigError:
+            return None
+        for filename, data in contents.items():
+            if files.get(filename, (None, None, None))[2] != hashlib.sha256(data).hexdigest():
+                return None
+        compiled.files = {filename: stats[filename] + (files[filename][2],) for filename in contents}
+        self.write_cache(compiled)
+        return compiled
+
+    def write_cache(self, compiled):
+        """Записать кэш через уникальный временный файл и os.replace.
+
+        Кэш общий для игры, симуляции и процессов Монте-Карло: у каждой
+        записи свой временный файл, поэтому одновременные записи не
+        смешиваются, и на месте кэша всегда оказывается цельный pickle.
+        """
+        directory = os.path.dirname(self.cache_path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(self.cache_path) + ".",
+                                             suffix=".tmp")
+        except OSError as e:
+            print(f"⚠️ Не удалось записать кэш конфигурации: {e}")
+            return
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump({"version": CACHE_VERSION, "code": CODE_FINGERPRINT, "config": compiled},
+                            f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            print(f"⚠️ Не удалось записать кэш конфигурации: {e}")
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
@@ -1,56 +1,85 @@
-import json
-import os
+from .config_loader import ConfigError, ConfigLoader
 
 class GameConfig:
-    def __init__(self):
+    # Размер окна (нужен заставке еще до загрузки конфигураций)
+    SCREEN_WIDTH = 1200
+    SCREEN_HEIGHT = 800
+
+    def __init__(self, compiled=None):
+        """compiled - готовая CompiledConfig (без чтения JSON-файлов)"""
         # Основные настройки
-        self.SCREEN_WIDTH = 1200
-        self.SCREEN_HEIGHT = 800
         self.STARTING_MONEY = 10000
         self.DAY_DURATION = 5  # секунд на игровой день
         
+        # Главный цикл: симуляция фиксированными шагами, отрисовка отдельно
+        self.SIMULATION_RATE = 60  # шагов симуляции в секунду
+        self.MAX_CATCH_UP_STEPS = 15  # шагов за кадр при отставании (остальное время отбрасывается)
+        self.RENDER_FPS = 60
+        self.IDLE_FPS = 20  # частота цикла, когда на экране ничего не меняется
+        
+        # Профилировщик кадра (F3 - показать/скрыть, замеры сохраняются при выходе)
+        self.PROFILER_ENABLED = False
+        self.PROFILER_FRAMES = 600  # кадров в кольцевом буфере
+        self.PROFILER_DUMP_DIR = 'data/profiles'
+        
+        # Сохранения: "binary" - компактный формат .sky, "json" - для экспорта и отладки
+        self.SAVE_FORMAT = "binary"
+        self.SAVE_COMPRESSION = True
+        
+        # Журнал действий между снимками авто-сохранения
+        self.JOURNAL_ENABLED = True
+        self.JOURNAL_COMPACT_RECORDS = 500  # свернуть журнал в снимок после стольких записей
+        self.JOURNAL_FSYNC = False  # fsync каждой записи (медленнее, защищает и от сбоя ОС)
+        
+        # Оффлайн-прогресс при авто-загрузке
+        self.OFFLINE_PROGRESS = True
+        self.OFFLINE_MAX_DAYS = 720  # максимум дней за время отсутствия (1 час реального времени)
+        
         # Настройки отладки
         self.DEBUG_MODE = True
         self.DEBUG_LEVEL = 3  # 1-ERROR, 2-WARNING, 3-INFO, 4-DEBUG
+        self.DEBUG_ECONOMY_TOTALS = False  # сверять кэш итогов с полным пересчетом
         
-        # Загрузка конфигураций из JSON
-        self.FLOOR_CONFIG = self.load_json_config('config/floor_prices.json')
-        self.MANAGER_CONFIG = self.load_json_config('config/manager_prices.json')
-        self.UPGRADE_CONFIG = self.load_json_config('config/upgrade_costs.json')
+        # Горячая перезагрузка JSON-конфигураций во время игры
+        self.CONFIG_HOT_RELOAD = True
+        self.CONFIG_RELOAD_INTERVAL = 1.0  # секунд между проверками файлов
         
-        # Проверка загрузки конфигураций
-        self.validate_configs()
+        # Загрузка конфигураций из JSON (проверка по схеме, компиляция, дисковый кэш)
+        self.config_loader = ConfigLoader()
+        if compiled is not None:
+            self.apply_compiled(compiled)
+        else:
+            self.load_configs()
     
-    def load_json_config(self, filepath):
-        """Загрузка конфигурации из JSON файла"""
+    def load_configs(self):
+        """Загрузка и проверка конфигураций (ConfigError, если они неверны)"""
         try:
-            if os.path.exists(filepath):
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            else:
-                print(f"⚠️ Файл конфигурации не найден: {filepath}")
-                return {}
-        except Exception as e:
-            print(f"❌ Ошибка загрузки {filepath}: {e}")
-            return {}
+            compiled = self.config_loader.load()
+        except ConfigError as e:
+            for error in e.errors:
+                print(f"❌ Ошибка конфигурации: {error}")
+            raise
+        self.apply_compiled(compiled)
     
-    def validate_configs(self):
-        """Проверка корректности загруженных конфигураций"""
-        required_configs = [
-            ('FLOOR_CONFIG', ['base_floor_cost', 'floor_types']),
-            ('MANAGER_CONFIG', ['managers']),
-            ('UPGRADE_CONFIG', ['global_upgrades'])
-        ]
-        
-        for config_name, required_fields in required_configs:
-            config = getattr(self, config_name)
-            if not config:
-                print(f"❌ Конфигурация {config_name} не загружена")
-                continue
-                
-            for field in required_fields:
-                if field not in config:
-                    print(f"⚠️ В {config_name} отсутствует поле: {field}")
+    def apply_compiled(self, compiled):
+        """Подставить скомпилированные конфигурации"""
+        for attribute, data in compiled.sections.items():
+            setattr(self, attribute, data)
+        # Скомпилированная таблица ставок доходов и расходов
+        self.rate_table = compiled.rate_table
+    
+    def check_reload(self):
+        """Новая скомпилированная конфигурация, если файлы изменились (иначе None)"""
+        if not self.config_loader.changed():
+            return None
+        try:
+            return self.config_loader.load()
+        except ConfigError as e:
+            # Неверный файл не применяется; повторная попытка - после следующего изменения
+            for error in e.errors:
+                print(f"❌ Ошибка конфигурации: {error}")
+            self.config_loader.loaded_stats = self.config_loader.file_stats()
+            return None
     
     def log(self, message, level='INFO'):
         """Логирование с уровнями"""
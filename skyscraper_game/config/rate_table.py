@@ -0,0 +1,99 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен: без него таблица хранится в списках
+    np = None
+
+# Индекс 0 в измерении менеджеров означает "без менеджера"
+NO_MANAGER = 0
+
+# Множители расходов по уровню ремонта
+REPAIR_MAINTENANCE_MULTIPLIERS = {"quality": 1.2, "luxury": 1.5}
+
+
+class RateTable:
+    """Скомпилированная таблица доходов и расходов этажей.
+
+    Строится один раз из FLOOR_CONFIG/MANAGER_CONFIG. Ставки лежат в
+    плоских массивах по ключу (тип, ремонт, менеджер), бонус высоты -
+    в векторе по этажам для каждого уровня лифтов. Таблица не зависит
+    от состояния конкретной игры, поэтому её можно разделять между
+    несколькими Game с одним конфигом.
+    """
+    def __init__(self, floor_config, manager_config):
+        managers_config = manager_config.get("managers", {})
+        self.max_floors = floor_config.get("max_floors", 0)
+
+        # Справочники "ключ <-> индекс"
+        self.type_keys = list(floor_config["floor_types"].keys())
+        self.repair_keys = list(floor_config["repair_levels"].keys())
+        self.manager_keys = [None] + list(managers_config.keys())
+        self.type_index_of = {key: i for i, key in enumerate(self.type_keys)}
+        self.repair_index_of = {key: i for i, key in enumerate(self.repair_keys)}
+        self.manager_index_of = {key: i for i, key in enumerate(self.manager_keys)}
+        self.default_type = self.type_index_of.get("office", 0)
+        self.default_repair = self.repair_index_of.get("basic", 0)
+
+        self.repair_count = len(self.repair_keys)
+        self.manager_count = len(self.manager_keys)
+
+        types = [floor_config["floor_types"][key] for key in self.type_keys]
+        repairs = [floor_config["repair_levels"][key] for key in self.repair_keys]
+        managers = [{}] + [managers_config[key] for key in self.manager_keys[1:]]
+
+        # Плоские таблицы по ключу (тип, ремонт, менеджер)
+        self.gross_rate = []       # валовой доход без бонуса высоты
+        self.gross_income = []     # int(валовой доход) при бонусе высоты 1.0
+        self.maintenance = []      # операционные расходы
+        self.net_income = []       # чистый доход при бонусе высоты 1.0
+        for floor_type in types:
+            for repair_key, repair in zip(self.repair_keys, repairs):
+                repair_maintenance = REPAIR_MAINTENANCE_MULTIPLIERS.get(repair_key, 1.0)
+                for manager in managers:
+                    gross_rate = (floor_type["base_income"] * repair["income_multiplier"]
+                                  * (1.0 + manager.get("income_bonus", 0)))
+                    maintenance = int(floor_type["maintenance_cost"]
+                                      * (1.0 - manager.get("maintenance_reduction", 0))
+                                      * repair_maintenance)
+                    self.gross_rate.append(gross_rate)
+                    self.gross_income.append(int(gross_rate))
+                    self.maintenance.append(maintenance)
+                    self.net_income.append(max(0, int(gross_rate) - maintenance))
+
+        self.auto_collect = [bool(m.get("auto_collect", False)) for m in managers]
+
+        if np is not None:
+            self.gross_rate_array = np.array(self.gross_rate, dtype=np.float64)
+            self.gross_income_array = np.array(self.gross_income, dtype=np.int64)
+            self.maintenance_array = np.array(self.maintenance, dtype=np.int64)
+            self.auto_collect_array = np.array(self.auto_collect, dtype=bool)
+
+        self._height_bonus = {}
+
+    def encode_type(self, floor_type):
+        """Индекс типа этажа (неизвестный тип становится офисом)"""
+        return self.type_index_of.get(floor_type, self.default_type)
+
+    def encode_repair(self, repair_level):
+        """Индекс уровня ремонта (неизвестный уровень становится basic)"""
+        return self.repair_index_of.get(repair_level, self.default_repair)
+
+    def encode_manager(self, manager):
+        """Индекс менеджера (None и неизвестные менеджеры -> NO_MANAGER)"""
+        return self.manager_index_of.get(manager, NO_MANAGER)
+
+    def key(self, type_index, repair_index, manager_index):
+        """Плоский ключ ставки для (тип, ремонт, менеджер)"""
+        return (type_index * self.repair_count + repair_index) * self.manager_count + manager_index
+
+    def height_bonus(self, elevator_level):
+        """Вектор бонусов высоты по этажам для уровня лифтов (кэшируется)"""
+        vector = self._height_bonus.get(elevator_level)
+        if vector is None:
+            vector = [1.0] * self.max_floors
+            if elevator_level > 0:
+                for index in range(10, self.max_floors):
+                    vector[index] = 1.0 + min(0.5, (index + 1 - 10) * 0.02 * elevator_level)
+            if np is not None:
+                vector = np.array(vector, dtype=np.float64)
+            self._height_bonus[elevator_level] = vector
+        return vector
@@ -0,0 +1,106 @@
+import threading
+import time
+
+
+class BackgroundSaver:
+    """Фоновое сохранение: снимок на главном потоке, запись на рабочем.
+
+    request() делает дешевый неизменяемый снимок состояния игры и сразу
+    возвращает управление. Рабочий поток сериализует снимок, записывает
+    его во временный файл с fsync и атомарно подменяет файл сохранения.
+    Если запись в тот же файл еще не началась, новый снимок заменяет
+    старый (запросы объединяются).
+    """
+    def __init__(self, save_system):
+        self.save_system = save_system
+        self._condition = threading.Condition()
+        self._pending = {}  # имя файла -> (заголовок, колонки, время запроса, on_saved)
+        self._busy = False
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="BackgroundSaver", daemon=True)
+        self._thread.start()
+
+        # Статистика сохранений
+        self.saves_completed = 0
+        self.saves_failed = 0
+        self.results = {}  # имя файла -> успех последней записи этого файла
+        self.requests_merged = 0
+        self.last_latency = None     # от запроса до записи на диск, секунд
+        self.last_write_time = None  # сериализация + запись, секунд
+        self.last_snapshot_time = None  # снимок на главном потоке, секунд
+
+    def request(self, game, filename, on_saved=None):
+        """Запросить сохранение игры в файл (не блокирует главный поток).
+
+        on_saved вызывается на рабочем потоке после успешной записи.
+        """
+        started = time.perf_counter()
+        header, records = self.save_system.capture_state(game)
+        self.last_snapshot_time = time.perf_counter() - started
+
+        with self._condition:
+            if filename in self._pending:
+                self.requests_merged += 1
+            self._pending[filename] = (header, records, started, on_saved)
+            self._condition.notify()
+
+    def flush(self, timeout=None):
+        """Дождаться записи всех запрошенных сохранений"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._pending or self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def result(self, filename):
+        """Успех последней записи файла filename (None - файл еще не записывался)"""
+        with self._condition:
+            return self.results.get(filename)
+
+    def stop(self, timeout=None):
+        """Записать оставшиеся сохранения и остановить рабочий поток"""
+        flushed = self.flush(timeout)
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        return flushed
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopped:
+                    self._condition.wait()
+                if self._stopped and not self._pending:
+                    return
+                filename, (header, records, requested_at, on_saved) = self._pending.popitem()
+                self._busy = True
+
+            write_started = time.perf_counter()
+            success = self.save_system.write_state(header, records, filename)
+            finished = time.perf_counter()
+            if success and on_saved is not None:
+                try:
+                    on_saved()
+                except Exception as e:
+                    print(f"⚠️ Ошибка после фонового сохранения {filename}: {e}")
+
+            with self._condition:
+                self._busy = False
+                self.results[filename] = success
+                if success:
+                    self.saves_completed += 1
+                    self.last_write_time = finished - write_started
+                    self.last_latency = finished - requested_at
+                else:
+                    self.saves_failed += 1
+                self._condition.notify_all()
+
+            if success:
+                print(f"💾 Фоновое сохранение {filename}: "
+                      f"снимок {self.last_snapshot_time * 1000:.1f} мс, "
+                      f"запись {self.last_write_time * 1000:.1f} мс, "
+                      f"задержка {self.last_latency * 1000:.1f} мс")
@@ -1,81 +1,69 @@
+from .economy import FloorPriceTable
+from .floor_store import FloorStore
+
+
 class Floor:
-    def __init__(self, floor_number, floor_type="office"):
-        self.floor_number = floor_number
-        self.floor_type = floor_type
-        self.owned = False
-        self.manager = None
-        self.repair_level = "basic"
-        self.income_collected = 0  # ЧИСТЫЙ доход (доход за вычетом расходов)
-        
+    """Представление этажа поверх колонок FloorStore (для UI и сохранений)"""
+    __slots__ = ('_store', '_index', 'floor_number')
+
+    def __init__(self, store, index):
+        self._store = store
+        self._index = index
+        self.floor_number = index + 1
+
+    @property
+    def owned(self):
+        return bool(self._store.owned[self._index])
+
+    @owned.setter
+    def owned(self, value):
+        self._store.owned[self._index] = bool(value)
+        self._store.version += 1
+
+    @property
+    def floor_type(self):
+        return self._store.type_keys[self._store.type_index[self._index]]
+
+    @floor_type.setter
+    def floor_type(self, value):
+        self._store.type_index[self._index] = self._store.encode_type(value)
+        self._store.version += 1
+
+    @property
+    def repair_level(self):
+        return self._store.repair_keys[self._store.repair_index[self._index]]
+
+    @repair_level.setter
+    def repair_level(self, value):
+        self._store.repair_index[self._index] = self._store.encode_repair(value)
+        self._store.version += 1
+
+    @property
+    def manager(self):
+        return self._store.manager_keys[self._store.manager_index[self._index]]
+
+    @manager.setter
+    def manager(self, value):
+        self._store.manager_index[self._index] = self._store.encode_manager(value)
+        self._store.version += 1
+
+    @property
+    def income_collected(self):
+        """ЧИСТЫЙ доход (доход за вычетом расходов), ожидающий сбора"""
+        return int(self._store.income_collected[self._index])
+
+    @income_collected.setter
+    def income_collected(self, value):
+        self._store.income_collected[self._index] = int(value)
+        self._store.version += 1
+
     def calculate_income(self, config):
         """Рассчитываем ЧИСТЫЙ доход для этажа (доход минус расходы)"""
-        if not self.owned:
-            return 0
-            
-        # Проверка на существование типа этажа
-        if self.floor_type not in config.FLOOR_CONFIG["floor_types"]:
-            self.floor_type = "office"
-            
-        floor_config = config.FLOOR_CONFIG["floor_types"][self.floor_type]
-        
-        # Проверка на существование уровня ремонта
-        if self.repair_level not in config.FLOOR_CONFIG["repair_levels"]:
-            self.repair_level = "basic"
-            
-        repair_config = config.FLOOR_CONFIG["repair_levels"][self.repair_level]
-        
-        base_income = floor_config["base_income"]
-        income_multiplier = repair_config["income_multiplier"]
-        
-        # Бонус от менеджера
-        manager_bonus = 1.0
-        if self.manager and self.manager in config.MANAGER_CONFIG["managers"]:
-            manager_config = config.MANAGER_CONFIG["managers"][self.manager]
-            manager_bonus += manager_config.get("income_bonus", 0)
-        
-        # Бонус от высоты этажа
-        height_bonus = 1.0
-        if hasattr(config, '_game') and hasattr(config._game, 'elevator_system_level') and config._game.elevator_system_level > 0:
-            if self.floor_number > 10:
-                height_bonus += min(0.5, (self.floor_number - 10) * 0.02 * config._game.elevator_system_level)
-        
-        # ВАЛОВОЙ доход
-        gross_income = base_income * income_multiplier * manager_bonus * height_bonus
-        
-        # Операционные расходы
-        maintenance_cost = self.calculate_maintenance_cost(config)
-        
-        # ЧИСТЫЙ доход (доход минус расходы)
-        net_income = gross_income - maintenance_cost
-        
-        # Убеждаемся, что доход не отрицательный
-        return max(0, int(net_income))
+        return self._store.floor_income(self._index)
 
     def calculate_maintenance_cost(self, config):
         """Рассчитываем операционные расходы этажа"""
-        if not self.owned:
-            return 0
-            
-        if self.floor_type not in config.FLOOR_CONFIG["floor_types"]:
-            return 0
-            
-        floor_config = config.FLOOR_CONFIG["floor_types"][self.floor_type]
-        base_cost = floor_config["maintenance_cost"]
-        
-        # Скидка от менеджера
-        manager_discount = 1.0
-        if self.manager and self.manager in config.MANAGER_CONFIG["managers"]:
-            manager_config = config.MANAGER_CONFIG["managers"][self.manager]
-            manager_discount -= manager_config.get("maintenance_reduction", 0)
-        
-        # Учет уровня ремонта
-        repair_multiplier = 1.0
-        if self.repair_level == "quality":
-            repair_multiplier = 1.2
-        elif self.repair_level == "luxury":
-            repair_multiplier = 1.5
-        
-        return int(base_cost * manager_discount * repair_multiplier)
+        return self._store.floor_maintenance(self._index)
 
     def calculate_repair_cost(self, config, target_repair_level=None):
         """Рассчитываем стоимость ремонта"""
@@ -106,17 +94,41 @@ class Floor:
         return int(cost)
     
     
+class FloorList:
+    """Ленивая последовательность представлений Floor над FloorStore"""
+    def __init__(self, store):
+        self._store = store
+
+    def __len__(self):
+        return self._store.size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [Floor(self._store, i) for i in range(*index.indices(self._store.size))]
+        if index < 0:
+            index += self._store.size
+        if not 0 <= index < self._store.size:
+            raise IndexError("floor index out of range")
+        return Floor(self._store, index)
+
+    def __iter__(self):
+        for i in range(self._store.size):
+            yield Floor(self._store, i)
+
+
 class Building:
     def __init__(self, config):
         self.config = config
+        self.store = None
         self.floors = []
+        self.prices = FloorPriceTable(config.FLOOR_CONFIG)
         self.initialize_floors()
         
     def initialize_floors(self):
         """Создаём все этажи здания"""
         max_floors = self.config.FLOOR_CONFIG["max_floors"]
-        for i in range(max_floors):
-            self.floors.append(Floor(i + 1))
+        self.store = FloorStore(self.config, max_floors)
+        self.floors = FloorList(self.store)
         
         # Первый этаж покупается автоматически
         if self.floors:
@@ -125,23 +137,53 @@ class Building:
     
     def get_floor_cost(self, floor_number):
         """Получаем стоимость этажа"""
-        if floor_number < 1 or floor_number > len(self.floors):
-            return 0
-            
-        base_cost = self.config.FLOOR_CONFIG["base_floor_cost"]
-        increase_rate = self.config.FLOOR_CONFIG["cost_increase_per_floor"]
-        
-        # Нелинейный рост после определенных этапов
-        milestone_multiplier = 1.0
-        if floor_number > 50:
-            milestone_multiplier = 1.3
-        elif floor_number > 25:
-            milestone_multiplier = 1.15
-        elif floor_number > 10:
-            milestone_multiplier = 1.05
-            
-        return int(base_cost * (increase_rate ** (floor_number - 1)) * milestone_multiplier)
+        return self.prices.cost(floor_number)
+    
+    def get_floors_cost(self, first_floor, last_floor):
+        """Суммарная стоимость этажей first_floor..last_floor"""
+        return self.prices.range_cost(first_floor, last_floor)
+    
+    def get_next_unowned(self, first_floor):
+        """Первый некупленный этаж, начиная с first_floor (None, если таких нет)"""
+        store = self.store
+        index = max(first_floor, 1) - 1
+        if index >= store.size:
+            return None
+        if store.use_numpy:
+            free_after = (~store.owned[index:]).nonzero()[0]
+            return index + int(free_after[0]) + 1 if len(free_after) else None
+        while index < store.size and store.owned[index]:
+            index += 1
+        return index + 1 if index < store.size else None
+
+    def get_unowned_run(self, first_floor):
+        """Последний этаж непрерывной цепочки некупленных этажей, начиная с first_floor"""
+        store = self.store
+        index = first_floor - 1
+        if index < 0 or index >= store.size or store.owned[index]:
+            return None
+        if store.use_numpy:
+            owned_after = store.owned[index:].nonzero()[0]
+            return index + int(owned_after[0]) if len(owned_after) else store.size
+        while index < store.size and not store.owned[index]:
+            index += 1
+        return index
     
     def get_owned_floors(self):
         """Получаем список купленных этажей"""
-        return [floor for floor in self.floors if floor.owned]
\ No newline at end of file
+        return [Floor(self.store, i) for i in self.store.owned_indices()]
+
+    def get_total_income(self):
+        """Суммарный чистый доход всех этажей за день"""
+        return self.store.total_income()
+
+    def get_total_maintenance(self):
+        """Суммарные операционные расходы всех этажей за день"""
+        return self.store.total_maintenance()
+
+    def collect_daily_income(self, days=1):
+        """Начисляет доход за days дней.
+
+        Возвращает (сумма авто-сбора, сумма, оставшаяся на этажах).
+        """
+        return self.store.collect_days(days)
\ No newline at end of file
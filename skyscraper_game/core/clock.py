@@ -0,0 +1,25 @@
+import time
+
+
+class SystemClock:
+    """Часы реального времени (по умолчанию для окна игры)"""
+    def __call__(self):
+        return time.time()
+
+
+class ManualClock:
+    """Управляемые часы для симуляции без окна и для тестов.
+
+    Время идет только при вызове advance(), поэтому игра полностью
+    детерминирована и не зависит от скорости компьютера.
+    """
+    def __init__(self, start=0.0):
+        self.now = float(start)
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        """Сдвинуть часы вперед на seconds секунд"""
+        self.now += seconds
+        return self.now
@@ -0,0 +1,149 @@
+import sys
+from bisect import bisect_right
+from itertools import accumulate
+
+# Цена этажа, которую невозможно оплатить (переполнение степенного роста)
+UNAFFORDABLE_FLOOR_COST = int(sys.float_info.max)
+
+
+class FloorPriceTable:
+    """Предрасчитанные цены этажей и их префиксные суммы.
+
+    costs[i] - цена этажа i + 1, prefix[i] - суммарная цена этажей 1..i.
+    Цены хранятся целыми числами Python, поэтому префиксные суммы точны
+    при любом количестве этажей.
+    """
+    def __init__(self, floor_config):
+        base_cost = floor_config["base_floor_cost"]
+        increase_rate = floor_config["cost_increase_per_floor"]
+        max_floors = floor_config.get("max_floors", 0)
+
+        self.costs = [self.compute_cost(base_cost, increase_rate, n) for n in range(1, max_floors + 1)]
+        self.prefix = [0] + list(accumulate(self.costs))
+
+    @staticmethod
+    def compute_cost(base_cost, increase_rate, floor_number):
+        """Цена одного этажа по формуле из конфигурации"""
+        # Нелинейный рост после определенных этапов
+        milestone_multiplier = 1.0
+        if floor_number > 50:
+            milestone_multiplier = 1.3
+        elif floor_number > 25:
+            milestone_multiplier = 1.15
+        elif floor_number > 10:
+            milestone_multiplier = 1.05
+
+        try:
+            return int(base_cost * (increase_rate ** (floor_number - 1)) * milestone_multiplier)
+        except (OverflowError, ValueError):
+            return UNAFFORDABLE_FLOOR_COST
+
+    def cost(self, floor_number):
+        """Цена этажа (0 для несуществующего этажа)"""
+        if floor_number < 1 or floor_number > len(self.costs):
+            return 0
+        return self.costs[floor_number - 1]
+
+    def range_cost(self, first_floor, last_floor):
+        """Суммарная цена этажей first_floor..last_floor включительно за O(1)"""
+        first_floor = max(1, first_floor)
+        last_floor = min(len(self.costs), last_floor)
+        if last_floor < first_floor:
+            return 0
+        return self.prefix[last_floor] - self.prefix[first_floor - 1]
+
+    def max_affordable(self, first_floor, money, last_floor=None):
+        """Сколько этажей подряд начиная с first_floor можно купить на money (O(log n))"""
+        if last_floor is None:
+            last_floor = len(self.costs)
+        last_floor = min(len(self.costs), last_floor)
+        if first_floor < 1 or first_floor > last_floor:
+            return 0
+        budget = self.prefix[first_floor - 1] + int(money)
+        reachable = bisect_right(self.prefix, budget, first_floor - 1, last_floor + 1) - 1
+        return max(0, reachable - (first_floor - 1))
+
+
+class EconomyTotals:
+    """Инкрементальные суммарные показатели экономики здания.
+
+    Хранит валовой доход, расходы, чистый доход, количество купленных
+    этажей и несобранный доход. Итоги обновляются только при изменении
+    состояния этажей, а не полным проходом на каждом кадре.
+    """
+    def __init__(self, store, config):
+        self.store = store
+        self.config = config
+        self.gross_income = 0
+        self.maintenance = 0
+        self.net_income = 0
+        self.owned_count = 0
+        self.pending_income = 0
+        self.dirty = True
+
+    def invalidate(self):
+        """Пометить итоги устаревшими (полный пересчет при следующем чтении)"""
+        self.dirty = True
+
+    def recompute(self):
+        """Полный пересчет итогов по всем этажам"""
+        (self.gross_income, self.maintenance, self.net_income,
+         self.owned_count, self.pending_income) = self.store.summary()
+        self.dirty = False
+
+    def ensure_fresh(self):
+        """Пересчитать итоги, если они помечены устаревшими"""
+        if self.dirty:
+            self.recompute()
+        elif getattr(self.config, 'DEBUG_ECONOMY_TOTALS', False):
+            self.verify()
+
+    def verify(self):
+        """Сверить кэшированные итоги с полным пересчетом (режим отладки)"""
+        cached = (self.gross_income, self.maintenance, self.net_income,
+                  self.owned_count, self.pending_income)
+        actual = self.store.summary()
+        if cached != actual:
+            self.config.log(f"Рассинхронизация итогов экономики: кэш {cached}, пересчет {actual}", 'ERROR')
+            self.recompute()
+            return False
+        return True
+
+    def _floor_contribution(self, index):
+        """Вклад одного этажа в итоги"""
+        store = self.store
+        if not store.owned[index]:
+            return 0, 0, 0, 0, 0
+        gross_income = store.floor_gross_income(index)
+        maintenance = store.floor_maintenance(index)
+        return (gross_income, maintenance, max(0, gross_income - maintenance),
+                1, int(store.income_collected[index]))
+
+    def _apply(self, contribution, sign):
+        gross_income, maintenance, net_income, owned, pending = contribution
+        self.gross_income += sign * gross_income
+        self.maintenance += sign * maintenance
+        self.net_income += sign * net_income
+        self.owned_count += sign * owned
+        self.pending_income += sign * pending
+
+    def begin_floor_update(self, index):
+        """Вычесть вклад этажа перед изменением его состояния"""
+        if not self.dirty:
+            self._apply(self._floor_contribution(index), -1)
+
+    def end_floor_update(self, index):
+        """Добавить вклад этажа после изменения его состояния"""
+        if not self.dirty:
+            self._apply(self._floor_contribution(index), 1)
+
+    def add_floors(self, indices):
+        """Добавить вклад только что купленных этажей"""
+        if not self.dirty:
+            for index in indices:
+                self._apply(self._floor_contribution(index), 1)
+
+    def add_pending(self, amount):
+        """Доход, оставшийся на этажах после дневного начисления"""
+        if not self.dirty:
+            self.pending_income += amount
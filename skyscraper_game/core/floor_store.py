@@ -0,0 +1,278 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен: без него работает обычный Python-путь
+    np = None
+
+from config.rate_table import NO_MANAGER
+
+
+class FloorStore:
+    """Колоночное хранилище этажей (struct-of-arrays).
+
+    Вместо объекта на каждый этаж хранит колонки: owned, индекс типа,
+    индекс ремонта, индекс менеджера и накопленный доход. Ставки берутся
+    из скомпилированной таблицы config.rate_table. Если доступен NumPy,
+    дневной доход, расходы и авто-сбор считаются одним проходом по массивам.
+    """
+    def __init__(self, config, size):
+        self.config = config
+        self.size = size
+        self.use_numpy = np is not None
+
+        # Уровень лифтов задает игра (Game.sync_upgrades)
+        self.elevator_level = 0
+        # Множители дохода и расходов от модификаторов событий (Game.sync_modifiers)
+        self.income_multiplier = 1.0
+        self.maintenance_multiplier = 1.0
+        self.bind_rates(config.rate_table)
+
+        # Счетчик изменений этажей: интерфейс перерисовывает кэш только при его смене
+        self.version = 0
+
+        self.reset()
+
+    def bind_rates(self, rates):
+        """Подключить таблицу ставок"""
+        self.rates = rates
+        self.type_keys = rates.type_keys
+        self.repair_keys = rates.repair_keys
+        self.manager_keys = rates.manager_keys
+        self.encode_type = rates.encode_type
+        self.encode_repair = rates.encode_repair
+        self.encode_manager = rates.encode_manager
+        self.height_bonus = rates.height_bonus(self.elevator_level)
+
+    def rebind_rates(self, rates):
+        """Перейти на новую таблицу ставок (перезагрузка конфигурации).
+
+        Индексы этажей перекодируются через ключи: тип, ремонт и менеджер
+        этажа сохраняются, если они есть в новой таблице.
+        """
+        old = self.rates
+        type_map = [rates.encode_type(key) for key in old.type_keys]
+        repair_map = [rates.encode_repair(key) for key in old.repair_keys]
+        manager_map = [rates.encode_manager(key) for key in old.manager_keys]
+        if self.use_numpy:
+            self.type_index = np.array(type_map, dtype=np.int16)[self.type_index]
+            self.repair_index = np.array(repair_map, dtype=np.int16)[self.repair_index]
+            self.manager_index = np.array(manager_map, dtype=np.int16)[self.manager_index]
+        else:
+            self.type_index = [type_map[i] for i in self.type_index]
+            self.repair_index = [repair_map[i] for i in self.repair_index]
+            self.manager_index = [manager_map[i] for i in self.manager_index]
+        self.bind_rates(rates)
+        self.version += 1
+
+    def reset(self):
+        """Сбрасывает все этажи в состояние по умолчанию"""
+        self.version += 1
+        size = self.size
+        default_type = self.rates.default_type
+        default_repair = self.rates.default_repair
+        if self.use_numpy:
+            self.owned = np.zeros(size, dtype=bool)
+            self.type_index = np.full(size, default_type, dtype=np.int16)
+            self.repair_index = np.full(size, default_repair, dtype=np.int16)
+            self.manager_index = np.full(size, NO_MANAGER, dtype=np.int16)
+            self.income_collected = np.zeros(size, dtype=np.int64)
+        else:
+            self.owned = [False] * size
+            self.type_index = [default_type] * size
+            self.repair_index = [default_repair] * size
+            self.manager_index = [NO_MANAGER] * size
+            self.income_collected = [0] * size
+
+    def buy_range(self, start, stop, type_index):
+        """Отметить этажи с индексами start..stop-1 купленными с типом type_index"""
+        if self.use_numpy:
+            self.owned[start:stop] = True
+            self.type_index[start:stop] = type_index
+        else:
+            count = stop - start
+            self.owned[start:stop] = [True] * count
+            self.type_index[start:stop] = [type_index] * count
+        self.version += 1
+
+    def set_elevator_level(self, level):
+        """Переключает вектор бонусов высоты при смене уровня лифтов"""
+        if level != self.elevator_level:
+            self.version += 1
+            self.elevator_level = level
+            self.height_bonus = self.rates.height_bonus(level)
+
+    def set_modifiers(self, income_multiplier, maintenance_multiplier):
+        """Множители дохода и расходов от активных модификаторов событий"""
+        if (income_multiplier, maintenance_multiplier) != (self.income_multiplier, self.maintenance_multiplier):
+            self.version += 1
+            self.income_multiplier = income_multiplier
+            self.maintenance_multiplier = maintenance_multiplier
+
+    # ------------------------------------------------------------------
+    # Расчеты для одного этажа (используются представлением Floor)
+    # ------------------------------------------------------------------
+    def rate_key(self, index):
+        """Ключ ставки этажа в таблице"""
+        return self.rates.key(self.type_index[index], self.repair_index[index], self.manager_index[index])
+
+    def floor_maintenance(self, index):
+        """Операционные расходы одного этажа"""
+        if not self.owned[index]:
+            return 0
+        maintenance = self.rates.maintenance[self.rate_key(index)]
+        if self.maintenance_multiplier != 1.0:
+            return int(maintenance * self.maintenance_multiplier)
+        return maintenance
+
+    def floor_gross_income(self, index):
+        """ВАЛОВОЙ доход одного этажа (до вычета расходов)"""
+        if not self.owned[index]:
+            return 0
+        key = self.rate_key(index)
+        scale = self.height_bonus[index] * self.income_multiplier
+        if scale == 1.0:
+            return self.rates.gross_income[key]
+        return int(self.rates.gross_rate[key] * scale)
+
+    def floor_income(self, index, height_bonus=None):
+        """ЧИСТЫЙ доход одного этажа (height_bonus - другой вектор бонусов высоты)"""
+        if not self.owned[index]:
+            return 0
+        if height_bonus is None:
+            height_bonus = self.height_bonus
+        key = self.rate_key(index)
+        scale = height_bonus[index] * self.income_multiplier
+        if scale == 1.0 and self.maintenance_multiplier == 1.0:
+            return self.rates.net_income[key]
+        gross_income = self.rates.gross_income[key] if scale == 1.0 else int(self.rates.gross_rate[key] * scale)
+        maintenance = self.rates.maintenance[key]
+        if self.maintenance_multiplier != 1.0:
+            maintenance = int(maintenance * self.maintenance_multiplier)
+        return max(0, gross_income - maintenance)
+
+    def is_auto_collect(self, index):
+        """Есть ли у этажа менеджер с авто-сбором"""
+        return self.rates.auto_collect[self.manager_index[index]]
+
+    # ------------------------------------------------------------------
+    # Векторные проходы по всем этажам
+    # ------------------------------------------------------------------
+    def rate_key_vector(self):
+        """Ключи ставок всех этажей"""
+        rates = self.rates
+        return ((self.type_index.astype(np.int64) * rates.repair_count + self.repair_index)
+                * rates.manager_count + self.manager_index)
+
+    def maintenance_vector(self, keys=None):
+        """Расходы всех этажей (0 для некупленных)"""
+        if keys is None:
+            keys = self.rate_key_vector()
+        cost = self.rates.maintenance_array[keys]
+        if self.maintenance_multiplier != 1.0:
+            cost = (cost * self.maintenance_multiplier).astype(np.int64)
+        cost[~self.owned] = 0
+        return cost
+
+    def gross_income_vector(self, keys=None, height_bonus=None):
+        """Валовой доход всех этажей (0 для некупленных)"""
+        if keys is None:
+            keys = self.rate_key_vector()
+        if height_bonus is not None or self.elevator_level > 0 or self.income_multiplier != 1.0:
+            if height_bonus is None:
+                height_bonus = self.height_bonus
+            scale = height_bonus * self.income_multiplier
+            gross_income = (self.rates.gross_rate_array[keys] * scale).astype(np.int64)
+        else:
+            gross_income = self.rates.gross_income_array[keys]
+        gross_income[~self.owned] = 0
+        return gross_income
+
+    def income_vector(self, height_bonus=None):
+        """Чистый доход всех этажей (0 для некупленных)"""
+        keys = self.rate_key_vector()
+        net_income = self.gross_income_vector(keys, height_bonus) - self.maintenance_vector(keys)
+        np.maximum(net_income, 0, out=net_income)
+        return net_income
+
+    def total_income(self, height_bonus=None):
+        """Суммарный чистый доход в день.
+
+        height_bonus - вектор бонусов высоты другого уровня лифтов
+        (RateTable.height_bonus): доход считается для него, а состояние
+        хранилища не меняется.
+        """
+        if self.use_numpy:
+            return int(self.income_vector(height_bonus).sum())
+        return sum(self.floor_income(i, height_bonus) for i in self.owned_indices())
+
+    def total_maintenance(self):
+        """Суммарные операционные расходы в день"""
+        if self.use_numpy:
+            return int(self.maintenance_vector().sum())
+        return sum(self.floor_maintenance(i) for i in self.owned_indices())
+
+    def summary(self):
+        """Полный пересчет суммарных показателей за один проход.
+
+        Возвращает (валовой доход, расходы, чистый доход, купленные этажи,
+        несобранный доход).
+        """
+        if self.use_numpy:
+            keys = self.rate_key_vector()
+            gross_income = self.gross_income_vector(keys)
+            maintenance = self.maintenance_vector(keys)
+            net_income = np.maximum(gross_income - maintenance, 0)
+            return (int(gross_income.sum()), int(maintenance.sum()), int(net_income.sum()),
+                    self.owned_count(), int(self.income_collected[self.owned].sum()))
+
+        gross_total = maintenance_total = net_total = pending_total = owned_total = 0
+        for i in self.owned_indices():
+            gross_income = self.floor_gross_income(i)
+            maintenance = self.floor_maintenance(i)
+            gross_total += gross_income
+            maintenance_total += maintenance
+            net_total += max(0, gross_income - maintenance)
+            pending_total += self.income_collected[i]
+            owned_total += 1
+        return gross_total, maintenance_total, net_total, owned_total, pending_total
+
+    def collect_days(self, days=1):
+        """Начисляет доход за days дней одним проходом.
+
+        Пока состояние этажей не меняется, доход каждого дня одинаков,
+        поэтому n дней считаются как доход за день, умноженный на n.
+        Авто-сбор возвращается, остальное копится на этажах.
+        Возвращает (сумма авто-сбора, сумма, оставшаяся на этажах).
+        """
+        self.version += 1
+        if self.use_numpy:
+            income = self.income_vector() * days
+            auto = self.rates.auto_collect_array[self.manager_index]
+            accumulated = np.where(auto, 0, income)
+            self.income_collected += accumulated
+            return int(income[auto].sum()), int(accumulated.sum())
+
+        auto_income = accumulated_income = 0
+        for i in self.owned_indices():
+            income = self.floor_income(i) * days
+            if self.is_auto_collect(i):
+                auto_income += income
+            else:
+                self.income_collected[i] += income
+                accumulated_income += income
+        return auto_income, accumulated_income
+
+    def collect_day(self):
+        """Начисляет дневной доход (см. collect_days)"""
+        return self.collect_days(1)
+
+    def owned_indices(self):
+        """Индексы купленных этажей"""
+        if self.use_numpy:
+            return np.flatnonzero(self.owned).tolist()
+        return [i for i, owned in enumerate(self.owned) if owned]
+
+    def owned_count(self):
+        """Количество купленных этажей"""
+        if self.use_numpy:
+            return int(np.count_nonzero(self.owned))
+        return sum(1 for owned in self.owned if owned)
@@ -1,22 +1,28 @@
-import pygame
-import time
+import math
+import os
+import random
 from .building import Building
+from .clock import SystemClock
+from .economy import EconomyTotals, FloorPriceTable
+from .journal import ActionJournal
+from .modifiers import INCOME, MAINTENANCE, ModifierStack
 from .save_system import SaveSystem
 
 class GameStatistics:
     """Класс для отслеживания статистики игры"""
-    def __init__(self):
+    def __init__(self, clock=None):
+        self.clock = clock or SystemClock()
         self.total_earned = 0
         self.total_spent = 0
         self.floors_purchased = 0
         self.managers_hired = 0
         self.upgrades_bought = 0
-        self.start_time = time.time()
-        self.last_save_time = time.time()
+        self.start_time = self.clock()
+        self.last_save_time = self.clock()
     
     def get_play_time(self):
         """Возвращает время игры в секундах"""
-        return time.time() - self.start_time
+        return self.clock() - self.start_time
     
     def get_play_time_formatted(self):
         """Возвращает отформатированное время игры"""
@@ -35,51 +41,195 @@ class GameStatistics:
         self.total_spent += amount
 
 class Game:
-    def __init__(self):
-        from config.game_config import GameConfig
-        self.config = GameConfig()
+    def __init__(self, config=None, clock=None, seed=None, autosave=True, wall_clock=None):
+        """
+        config - готовый GameConfig (по умолчанию загружается из JSON)
+        clock - часы симуляции: по ним идут игровые дни (по умолчанию time.time)
+        seed - зерно генератора случайных событий (None - случайное)
+        autosave - включить авто-сохранение каждые 5 минут
+        wall_clock - часы реального времени для того, что переживает сессию:
+            время сохранения, отметки журнала, статистика (по умолчанию time.time).
+            Часы симуляции могут отставать от реального времени, поэтому
+            сохраняемые отметки по ним не берутся
+        """
+        if config is None:
+            from config.game_config import GameConfig
+            config = GameConfig()
+        self.config = config
+        self.clock = clock or SystemClock()
+        self.wall_clock = wall_clock or SystemClock()
+        self.rng = random.Random(seed)
+        self.autosave_enabled = autosave
         self.building = Building(self.config)
-        self.save_system = SaveSystem()
+        
+        # Система сохранений (без авто-сохранения, например в симуляции, не создается
+        # и не трогает data/saves; её можно подставить вручную)
+        self.save_system = None
+        if autosave:
+            self.save_system = SaveSystem(
+                save_format=getattr(self.config, 'SAVE_FORMAT', "binary"),
+                compress=getattr(self.config, 'SAVE_COMPRESSION', True)
+            )
+        
+        # Журнал действий между снимками авто-сохранения
+        self.journal = None
+        if autosave and getattr(self.config, 'JOURNAL_ENABLED', False):
+            self.journal = ActionJournal(
+                os.path.join(self.save_system.save_dir, "journal"),
+                fsync=getattr(self.config, 'JOURNAL_FSYNC', False)
+            )
+        
+        # Кэшированные итоги экономики (обновляются только при изменениях)
+        self.totals = EconomyTotals(self.building.store, self.config)
         
         # Игровая экономика
         self.money = self.config.STARTING_MONEY
         self.day = 1
-        self.last_day_time = time.time()
+        self.last_day_time = self.clock()
         self.selected_floor = None
         self.game_speed = 1.0
         
         # Статистика
-        self.stats = GameStatistics()
+        self.stats = GameStatistics(self.wall_clock)
         
         # Глобальные улучшения
         self.elevator_system_level = 0  
         self.facade_renovation_level = 0  
         self.infrastructure_level = 0
         
-        # Система событий
+        # Система событий и временные модификаторы дохода/расходов от них
+        self.modifiers = ModifierStack()
         self.random_events = RandomEvents(self)
         
+        # Горячая перезагрузка конфигураций (только в игре с окном и сохранениями)
+        self.config_watch = autosave and getattr(self.config, 'CONFIG_HOT_RELOAD', False)
+        self.last_config_check = self.clock()
+        
     def update(self):
         """Обновление игрового состояния"""
-        current_time = time.time()
+        current_time = self.clock()
         
-        # Обновление дней
-        if current_time - self.last_day_time >= self.config.DAY_DURATION / self.game_speed:
-            self.day += 1
-            self.last_day_time = current_time
-            self.collect_income()
+        # Проверка изменений файлов конфигурации
+        if self.config_watch and current_time - self.last_config_check >= self.config.CONFIG_RELOAD_INTERVAL:
+            self.last_config_check = current_time
+            compiled = self.config.check_reload()
+            if compiled is not None:
+                self.apply_config(compiled)
+        
+        # Обновление дней: все прошедшие дни обрабатываются одной пачкой,
+        # начало дня сдвигается ровно на их длительность, поэтому дни не
+        # теряются и не отстают даже на больших скоростях игры
+        day_length = self.config.DAY_DURATION / self.game_speed
+        elapsed_days = int((current_time - self.last_day_time) // day_length)
+        if elapsed_days > 0:
+            self.last_day_time += elapsed_days * day_length
+            self.tick_days(elapsed_days)
             
-            # Случайные события
-            self.random_events.trigger_random_event()
+            # Авто-сохранение каждые 5 минут реального времени (или раньше, если журнал вырос)
+            now = self.wall_clock()
+            if self.autosave_enabled and (now - self.stats.last_save_time >= 300
+                                          or self.journal_needs_compaction()):
+                self.autosave()
+                self.stats.last_save_time = now
+
+    def tick_day(self):
+        """Один игровой день: начисление дохода и случайные события"""
+        self.tick_days(1)
+
+    def tick_days(self, days):
+        """Несколько игровых дней пачкой.
+
+        Доход начисляется одним проходом по этажам на каждый отрезок
+        между днями событий, а не проходом на каждый день. Дни событий
+        разыгрываются заранее (RandomEvents.next_event_day), поэтому
+        вероятность события в каждый день та же, что и при тике по одному дню.
+        """
+        events = self.random_events
+        last_event = None
+        while days > 0:
+            event_day = events.next_event_day(self.day)
+            span = days if event_day is None else min(days, event_day - self.day)
+            self.accrue_days(span)
+            self.record_action("day", span)
+            days -= span
             
-            # Авто-сохранение каждые 5 минут
-            if current_time - self.stats.last_save_time >= 300:
-                self.save_system.save_game(self, "autosave.json")
-                self.stats.last_save_time = current_time
+            # Случайные события (модификаторы действуют со следующего дня)
+            if self.day == event_day:
+                last_event = events.trigger_random_event(notify=False) or last_event
+        
+        # За пачку дней показывается только последнее событие
+        if last_event is not None:
+            events.notify(last_event)
+
+    def accrue_days(self, days):
+        """Начисление дохода за days дней с учетом модификаторов событий.
+
+        Дни идут отрезками, на которых набор модификаторов не меняется:
+        каждый отрезок начисляется одним проходом по этажам, а между
+        отрезками снимаются истекшие модификаторы.
+        Возвращает (сумма авто-сбора, сумма, оставшаяся на этажах).
+        """
+        auto_total = accumulated_total = 0
+        while days > 0:
+            if self.modifiers.expire(self.day + 1):
+                self.sync_modifiers()
+            span = self.modifiers.days_active(self.day + 1, days)
+            auto_income, accumulated_income = self.collect_income(span)
+            auto_total += auto_income
+            accumulated_total += accumulated_income
+            self.day += span
+            days -= span
+        return auto_total, accumulated_total
+
+    def add_modifier(self, kind, value, duration, name=""):
+        """Временный модификатор дохода или расходов на duration дней, начиная с завтрашнего"""
+        modifier = self.modifiers.add(kind, value, self.day, duration, name)
+        self.sync_modifiers()
+        return modifier
+
+    def sync_modifiers(self):
+        """Применяет множители активных модификаторов к расчету доходов"""
+        self.building.store.set_modifiers(self.modifiers.income_multiplier,
+                                          self.modifiers.maintenance_multiplier)
+        # Модификаторы влияют на все этажи сразу
+        self.totals.invalidate()
+
+    def record_action(self, op, *args):
+        """Записать действие в журнал (если журнал ведется)"""
+        if self.journal is not None:
+            self.journal.append(op, self, *args)
+
+    def journal_needs_compaction(self):
+        """Журнал набрал достаточно записей для сворачивания в снимок"""
+        if self.journal is None:
+            return False
+        limit = getattr(self.config, 'JOURNAL_COMPACT_RECORDS', 500)
+        return self.journal.records_since_compaction >= limit
+
+    def autosave(self):
+        """Фоновое авто-сохранение; заодно сворачивает журнал в снимок"""
+        if self.save_system is None:
+            return
+        filename = self.save_system.autosave_filename()
+        if self.journal is None:
+            self.save_system.save_game_async(self, filename)
+            return
+        
+        # Сегменты журнала до снимка удаляются только после записи снимка на диск
+        journal = self.journal
+        seq = journal.rotate()
+        self.save_system.save_game_async(self, filename, lambda: journal.discard_through(seq))
 
     def save_on_exit(self):
         """Сохранение при выходе из игры"""
-        success = self.save_system.save_game(self, "autosave.json")
+        # Снимок делается сразу, запись идет на рабочем потоке; ждем её завершения,
+        # чтобы процесс не завершился раньше, чем файл окажется на диске
+        if self.save_system is None:
+            return False
+        self.autosave()
+        # Результат берется именно для файла авто-сохранения: запись других слотов его не подменяет
+        flushed = self.save_system.flush(timeout=10)
+        success = flushed and self.save_system.background_result(self.save_system.autosave_filename()) is True
         if success:
             print("💾 Игра сохранена при выходе")
         else:
@@ -88,12 +238,8 @@ class Game:
 
     def calculate_operational_costs(self):
         """Расчет операционных расходов"""
-        total_costs = 0
-        for floor in self.building.floors:
-            if floor.owned:
-                cost = floor.calculate_maintenance_cost(self.config)
-                total_costs += cost
-        return int(total_costs)
+        self.totals.ensure_fresh()
+        return self.totals.maintenance
 
     def buy_global_upgrade(self, upgrade_type):
         """Покупка глобального улучшения"""
@@ -116,6 +262,8 @@ class Game:
             self.stats.add_expense(next_level_cost)
             self.stats.upgrades_bought += 1
             setattr(self, f"{upgrade_type}_level", current_level + 1)
+            self.sync_upgrades()
+            self.record_action("buy_global_upgrade", upgrade_type)
             
             # Показываем сообщение об успехе
             if hasattr(self, 'window'):
@@ -133,6 +281,29 @@ class Game:
                 )
             return False
     
+    def apply_config(self, compiled):
+        """Подменить конфигурацию в запущенной игре (без перезапуска)"""
+        max_floors = compiled.sections["FLOOR_CONFIG"]["max_floors"]
+        if max_floors != self.building.store.size:
+            print("⚠️ Изменение max_floors применяется только после перезапуска игры")
+            return False
+        
+        self.config.apply_compiled(compiled)
+        self.building.store.rebind_rates(compiled.rate_table)
+        self.building.prices = FloorPriceTable(self.config.FLOOR_CONFIG)
+        self.sync_upgrades()
+        
+        print("⚙️ Конфигурация перезагружена")
+        if hasattr(self, 'window'):
+            self.window.on_config_reloaded()
+        return True
+
+    def sync_upgrades(self):
+        """Применяет уровни глобальных улучшений к расчету доходов"""
+        self.building.store.set_elevator_level(self.elevator_system_level)
+        # Улучшения влияют на все этажи сразу
+        self.totals.invalidate()
+
     def get_global_upgrade_info(self, upgrade_type):
         """Возвращает информацию о глобальном улучшении"""
         if not hasattr(self.config, 'UPGRADE_CONFIG') or not self.config.UPGRADE_CONFIG:
@@ -177,17 +348,33 @@ class Game:
         
         return info
 
-    def collect_income(self):
+    def collect_income(self, days=1):
         """Сбор дохода со всех этажей (доход уже за вычетом расходов)"""
-        for floor in self.building.floors:
-            if floor.owned:
-                income = floor.calculate_income(self.config)
-                # Авто-сбор если есть менеджер с авто-сбором
-                if floor.manager and self.config.MANAGER_CONFIG["managers"][floor.manager].get("auto_collect", False):
-                    self.money += income
-                    self.stats.add_income(income)
-                else:
-                    floor.income_collected += income
+        # Авто-сбор с этажей, где есть менеджер с авто-сбором,
+        # остальной доход копится на этажах
+        auto_income, accumulated_income = self.building.collect_daily_income(days)
+        self.money += auto_income
+        self.stats.add_income(auto_income)
+        self.totals.add_pending(accumulated_income)
+        return auto_income, accumulated_income
+
+    def advance_days(self, days):
+        """Перемотка игры на days дней за один проход по этажам.
+
+        Состояние этажей между днями не меняется, поэтому доход за n дней
+        равен дневному доходу, умноженному на n (отдельно для каждого
+        отрезка между окончаниями модификаторов). Случайные события при
+        перемотке не разыгрываются (оффлайн-прогресс идет без событий),
+        действующие модификаторы истекают как обычно. Возвращает весь
+        начисленный доход (авто-сбор + накопленное на этажах).
+        """
+        days = int(days)
+        if days <= 0:
+            return 0
+        
+        auto_income, accumulated_income = self.accrue_days(days)
+        self.record_action("day", days)
+        return auto_income + accumulated_income
 
     def collect_floor_income(self, floor_number):
         """Ручной сбор дохода с конкретного этажа"""
@@ -199,7 +386,10 @@ class Game:
             collected_amount = floor.income_collected
             self.money += collected_amount
             self.stats.add_income(collected_amount)
+            self.totals.begin_floor_update(floor_number - 1)
             floor.income_collected = 0
+            self.totals.end_floor_update(floor_number - 1)
+            self.record_action("collect_floor_income", floor_number)
             
             # Показываем сообщение о собранной сумме
             if hasattr(self, 'window'):
@@ -221,8 +411,11 @@ class Game:
                     self.money = money_int - cost
                     self.stats.add_expense(cost)
                     self.stats.floors_purchased += 1
+                    self.totals.begin_floor_update(floor_number - 1)
                     floor.owned = True
                     floor.floor_type = floor_type
+                    self.totals.end_floor_update(floor_number - 1)
+                    self.record_action("buy_floor", floor_number, floor_type)
                     return True
                 else:
                     # Показываем сообщение об ошибке
@@ -233,6 +426,75 @@ class Game:
                         )
         return False
 
+    def buy_floors_bulk(self, first_floor=None, count=None, floor_type="office"):
+        """Покупка нескольких этажей подряд за одно действие.
+
+        Начиная с first_floor (по умолчанию первый некупленный этаж),
+        покупает некупленные этажи по порядку, пока хватает денег или
+        пока не куплено count этажей. Возвращает количество купленных этажей.
+        """
+        store = self.building.store
+        floor_number = first_floor or 1
+        remaining = count if count is not None else store.size
+        money = int(self.money)
+        type_index = store.encode_type(floor_type)
+        bought = []  # диапазоны индексов купленных этажей
+        total_cost = 0
+        
+        while remaining > 0:
+            # Начало следующей цепочки некупленных этажей
+            floor_number = self.building.get_next_unowned(floor_number)
+            if floor_number is None:
+                break
+            run_end = self.building.get_unowned_run(floor_number)
+            affordable = self.building.prices.max_affordable(floor_number, money - total_cost, run_end)
+            take = min(affordable, remaining)
+            if take <= 0:
+                break
+            
+            last_floor = floor_number + take - 1
+            total_cost += self.building.get_floors_cost(floor_number, last_floor)
+            store.buy_range(floor_number - 1, last_floor, type_index)
+            bought.append(range(floor_number - 1, last_floor))
+            
+            remaining -= take
+            floor_number = last_floor + 1
+            if take < affordable or last_floor < run_end:
+                break
+        
+        bought_count = sum(len(indices) for indices in bought)
+        if not bought_count:
+            if hasattr(self, 'window'):
+                next_cost = self.building.get_floor_cost(floor_number or store.size + 1)
+                self.window.show_message(
+                    f"❌ Недостаточно денег! Нужно: {next_cost} руб.",
+                    self.window.colors['error']
+                )
+            return 0
+        
+        # Доступность считалась по целой части, а списывается сумма с дробной частью денег
+        self.money -= total_cost
+        self.stats.add_expense(total_cost)
+        self.stats.floors_purchased += bought_count
+        for indices in bought:
+            self.totals.add_floors(indices)
+        self.record_action("buy_floors_bulk", first_floor, bought_count, floor_type)
+        
+        if hasattr(self, 'window'):
+            self.window.show_message(
+                f"🏗️ Куплено этажей: {bought_count} за {total_cost} руб.!",
+                self.window.colors['success']
+            )
+        return bought_count
+
+    def get_bulk_buy_preview(self, first_floor):
+        """Сколько этажей подряд от first_floor можно купить и за сколько"""
+        run_end = self.building.get_unowned_run(first_floor)
+        if run_end is None:
+            return 0, 0
+        count = self.building.prices.max_affordable(first_floor, int(self.money), run_end)
+        return count, self.building.get_floors_cost(first_floor, first_floor + count - 1)
+
     def hire_manager(self, floor_number, manager_type):
         """Найм менеджера на этаж"""
         if floor_number < 1 or floor_number > len(self.building.floors):
@@ -245,7 +507,10 @@ class Game:
                 self.money -= manager_config["cost"]
                 self.stats.add_expense(manager_config["cost"])
                 self.stats.managers_hired += 1
+                self.totals.begin_floor_update(floor_number - 1)
                 floor.manager = manager_type
+                self.totals.end_floor_update(floor_number - 1)
+                self.record_action("hire_manager", floor_number, manager_type)
                 return True
         return False
 
@@ -261,17 +526,32 @@ class Game:
             if self.money >= cost:
                 self.money -= cost
                 self.stats.add_expense(cost)
+                self.totals.begin_floor_update(floor_number - 1)
                 floor.repair_level = repair_level
+                self.totals.end_floor_update(floor_number - 1)
+                self.record_action("repair_floor", floor_number, repair_level)
                 return True
         return False
     
     def get_total_income_per_day(self):
         """Общий доход в день (уже за вычетом расходов)"""
-        total = 0
-        for floor in self.building.floors:
-            if floor.owned:
-                total += floor.calculate_income(self.config)
-        return int(total)
+        self.totals.ensure_fresh()
+        return self.totals.net_income
+
+    def get_gross_income_per_day(self):
+        """Валовой доход в день (до вычета расходов)"""
+        self.totals.ensure_fresh()
+        return self.totals.gross_income
+
+    def get_owned_floor_count(self):
+        """Количество купленных этажей"""
+        self.totals.ensure_fresh()
+        return self.totals.owned_count
+
+    def get_pending_income(self):
+        """Несобранный доход, накопленный на этажах"""
+        self.totals.ensure_fresh()
+        return self.totals.pending_income
     
     def get_available_managers(self, floor_number):
         """Получить доступных менеджеров для этажа"""
@@ -288,39 +568,83 @@ class Game:
         return available
 
 class RandomEvents:
-    """Система случайных событий"""
+    """Система случайных событий.
+
+    События выбираются генератором игры (Game.rng), поэтому при одном
+    зерне последовательность событий повторяется. Событие добавляет
+    временные модификаторы дохода и расходов в Game.modifiers.
+    """
+    EVENT_CHANCE = 0.02  # 2% шанс каждый день
+    
+    EVENTS = {
+        "boom": {
+            "name": "Экономический бум",
+            "modifiers": [(INCOME, 0.2)],
+            "duration": 1,
+            "message": "📈 Экономический бум! Доход увеличен на 20% на сегодня!"
+        },
+        "crisis": {
+            "name": "Кризис",
+            "modifiers": [(INCOME, -0.15)],
+            "duration": 1,
+            "message": "📉 Экономический кризис! Доход уменьшен на 15% на сегодня!"
+        },
+        "utility_prices": {
+            "name": "Рост тарифов",
+            "modifiers": [(MAINTENANCE, 0.3)],
+            "duration": 3,
+            "message": "💡 Тарифы выросли! Расходы увеличены на 30% на 3 дня!"
+        }
+    }
+    
     def __init__(self, game):
         self.game = game
-        self.events = [
-            {
-                "name": "Экономический бум", 
-                "effect": lambda: self.modify_income(0.2),
-                "message": "📈 Экономический бум! Доход увеличен на 20% на сегодня!"
-            },
-            {
-                "name": "Кризис", 
-                "effect": lambda: self.modify_income(-0.15),
-                "message": "📉 Экономический кризис! Доход уменьшен на 15% на сегодня!"
-            }
-        ]
-        self.active_events = []
+        self.rng = game.rng
+        self.event_ids = list(self.EVENTS)
+        self.event_day = None  # ближайший день события (разыгрывается заранее)
     
-    def modify_income(self, multiplier):
-        """Временное изменение дохода"""
-        pass
+    def next_event_day(self, day):
+        """Ближайший после day день, в конце которого произойдет событие (None - событий нет).
+
+        Число дней до события с шансом EVENT_CHANCE в день распределено
+        геометрически, поэтому разыгрывается одним вызовом генератора.
+        """
+        if self.event_day is None or self.event_day <= day:
+            chance = self.EVENT_CHANCE
+            if chance <= 0:
+                return None
+            gap = 1
+            if chance < 1:
+                gap += int(math.log(1.0 - self.rng.random()) / math.log(1.0 - chance))
+            self.event_day = day + gap
+        return self.event_day
     
-    def trigger_random_event(self):
-        """Активировать случайное событие"""
-        if len(self.game.building.get_owned_floors()) < 3:
-            return
-            
-        if pygame.time.get_ticks() % 100 < 2:  # 2% шанс каждый день
-            event = pygame.time.get_ticks() % len(self.events)
-            event_data = self.events[event]
-            event_data["effect"]()
+    def apply_event(self, event_id):
+        """Добавить модификаторы события"""
+        event_data = self.EVENTS.get(event_id)
+        if event_data is None:
+            return False
+        for kind, value in event_data["modifiers"]:
+            self.game.add_modifier(kind, value, event_data["duration"], event_data["name"])
+        return True
+    
+    def trigger_random_event(self, notify=True):
+        """Активировать случайное событие, вернуть его id (None - события нет)"""
+        self.event_day = None
+        if self.game.get_owned_floor_count() < 3:
+            return None
             
-            if hasattr(self.game, 'window'):
-                self.game.window.show_message(
-                    event_data["message"], 
-                    self.game.window.colors['warning']
-                )
\ No newline at end of file
+        event_id = self.rng.choice(self.event_ids)
+        self.apply_event(event_id)
+        self.game.record_action("event", event_id)
+        if notify:
+            self.notify(event_id)
+        return event_id
+    
+    def notify(self, event_id):
+        """Сообщение о событии в окне игры"""
+        if hasattr(self.game, 'window'):
+            self.game.window.show_message(
+                self.EVENTS[event_id]["message"], 
+                self.game.window.colors['warning']
+            )
@@ -0,0 +1,196 @@
+"""Журнал действий игры (append-only).
+
+Каждое действие игрока и каждый игровой день записываются отдельной
+строкой JSON в текущий сегмент журнала сразу при выполнении. Сегменты
+называются по номеру первой записи: journal_000000000123.log.
+
+Компакция: главный поток закрывает текущий сегмент (rotate) и делает
+снимок авто-сохранения с номером последней записи в заголовке. После
+записи снимка на диск сегменты, полностью покрытые снимком, удаляются.
+При загрузке применяется снимок и затем записи журнала с большими номерами.
+"""
+import json
+import os
+import threading
+
+SEGMENT_PREFIX = "journal_"
+SEGMENT_EXTENSION = ".log"
+
+
+class ActionJournal:
+    """Сегментированный журнал действий в каталоге directory"""
+    def __init__(self, directory, fsync=False):
+        """
+        directory - каталог сегментов журнала
+        fsync - вызывать fsync после каждой записи (иначе только flush в ОС)
+        """
+        self.directory = directory
+        self.fsync = fsync
+        self.seq = 0                # номер последней записанной записи
+        self.records_since_compaction = 0
+        self.replaying = False      # во время воспроизведения действия не пишутся
+        self._file = None
+        self._lock = threading.Lock()  # сегменты удаляются с рабочего потока сохранений
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def segment_name(first_seq):
+        return f"{SEGMENT_PREFIX}{first_seq:012d}{SEGMENT_EXTENSION}"
+
+    def segments(self):
+        """Сегменты журнала: список (номер первой записи, путь) по возрастанию"""
+        result = []
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return result
+        for name in names:
+            if not (name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_EXTENSION)):
+                continue
+            try:
+                first_seq = int(name[len(SEGMENT_PREFIX):-len(SEGMENT_EXTENSION)])
+            except ValueError:
+                continue
+            result.append((first_seq, os.path.join(self.directory, name)))
+        return sorted(result)
+
+    def append(self, op, game, *args):
+        """Записать действие op с аргументами args и состоянием после него"""
+        if self.replaying:
+            return
+        record = {
+            "seq": self.seq + 1,
+            "op": op,
+            "args": list(args),
+            "money": game.money,
+            "day": game.day,
+            "ts": game.wall_clock()
+        }
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with self._lock:
+            if self._file is None:
+                path = os.path.join(self.directory, self.segment_name(record["seq"]))
+                self._file = open(path, 'a', encoding='utf-8')
+            self._file.write(line)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+            self.seq = record["seq"]
+            self.records_since_compaction += 1
+
+    def rotate(self):
+        """Закрыть текущий сегмент перед снимком, вернуть номер последней записи"""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self._file.close()
+                self._file = None
+            self.records_since_compaction = 0
+            return self.seq
+
+    def discard_through(self, seq):
+        """Удалить закрытые сегменты, все записи которых не новее seq"""
+        with self._lock:
+            segments = self.segments()
+            current = None
+            if self._file is not None:
+                current = os.path.abspath(self._file.name)
+            for position, (first_seq, path) in enumerate(segments):
+                # Последняя запись сегмента - перед первой записью следующего
+                if position + 1 < len(segments):
+                    last_seq = segments[position + 1][0] - 1
+                else:
+                    last_seq = self.seq
+                if last_seq > seq or os.path.abspath(path) == current:
+                    continue
+                try:
+                    os.remove(path)
+                except OSError as e:
+                    print(f"⚠️ Не удалось удалить сегмент журнала {path}: {e}")
+
+    def reset(self, seq=0):
+        """Удалить весь журнал и продолжить нумерацию с seq"""
+        self.rotate()
+        with self._lock:
+            for _, path in self.segments():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self.seq = seq
+
+    def read_after(self, seq):
+        """Записи с номером больше seq по порядку.
+
+        Оборванная последняя строка (сбой во время записи) пропускается.
+        """
+        records = []
+        for _, path in self.segments():
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                        except ValueError:
+                            break
+                        if record.get("seq", 0) > seq:
+                            records.append(record)
+            except OSError as e:
+                print(f"⚠️ Не удалось прочитать сегмент журнала {path}: {e}")
+        records.sort(key=lambda record: record["seq"])
+        return records
+
+    def starts_from_new_game(self):
+        """Журнал начинается с первой записи новой игры (без снимка)"""
+        segments = self.segments()
+        return bool(segments) and segments[0][0] == 1
+
+    def replay(self, game, records):
+        """Воспроизвести записи журнала на игре, вернуть количество примененных"""
+        # Во время воспроизведения окно не показывает сообщений действий
+        window = game.__dict__.pop('window', None)
+        self.replaying = True
+        applied = 0
+        try:
+            for record in records:
+                self.apply_record(game, record)
+                self.seq = record["seq"]
+                applied += 1
+        finally:
+            self.replaying = False
+            if window is not None:
+                game.window = window
+        return applied
+
+    @staticmethod
+    def apply_record(game, record):
+        """Применить одну запись журнала"""
+        op = record["op"]
+        args = record.get("args", [])
+        if op == "day":
+            game.accrue_days(args[0])
+        elif op == "event":
+            game.random_events.apply_event(*args)
+        elif op == "buy_floor":
+            game.buy_floor(*args)
+        elif op == "buy_floors_bulk":
+            game.buy_floors_bulk(*args)
+        elif op == "hire_manager":
+            game.hire_manager(*args)
+        elif op == "repair_floor":
+            game.repair_floor(*args)
+        elif op == "buy_global_upgrade":
+            game.buy_global_upgrade(*args)
+        elif op == "collect_floor_income":
+            game.collect_floor_income(*args)
+        else:
+            print(f"⚠️ Неизвестное действие в журнале: {op}")
+
+        # Деньги и день после действия записаны в журнале и считаются точными
+        # (учитывают случайные события, которые не воспроизводятся)
+        game.money = record["money"]
+        game.day = record["day"]
+
+    def close(self):
+        self.rotate()
@@ -0,0 +1,106 @@
+import heapq
+
+# Виды модификаторов: множитель дохода и множитель операционных расходов
+INCOME = "income"
+MAINTENANCE = "maintenance"
+KINDS = (INCOME, MAINTENANCE)
+
+
+class Modifier:
+    """Временная надбавка к множителю дохода или расходов"""
+    __slots__ = ('kind', 'value', 'expires_day', 'name')
+
+    def __init__(self, kind, value, expires_day, name=""):
+        self.kind = kind
+        self.value = value
+        self.expires_day = expires_day  # последний день, доход которого затрагивает модификатор
+        self.name = name
+
+    def to_list(self):
+        return [self.kind, self.value, self.expires_day, self.name]
+
+
+class ModifierStack:
+    """Стек временных модификаторов дохода и расходов.
+
+    Множитель вида равен 1 + сумма надбавок активных модификаторов и
+    хранится готовым: добавление и снятие модификатора меняют сумму, а
+    не пересчитывают её по всем активным. Модификаторы лежат в min-куче
+    по дню окончания, поэтому проверка окончания за день - O(1), а снятие
+    каждого истекшего модификатора - O(log k).
+    """
+    def __init__(self):
+        self.heap = []     # (последний день действия, порядковый номер, Modifier)
+        self.counter = 0   # порядковый номер для устойчивого порядка в куче
+        self.sums = {kind: 0.0 for kind in KINDS}
+        self.counts = {kind: 0 for kind in KINDS}
+        self.version = 0   # меняется при каждом изменении множителей
+
+    def __len__(self):
+        return len(self.heap)
+
+    def add(self, kind, value, day, duration, name=""):
+        """Модификатор на доход дней day + 1 .. day + duration"""
+        if kind not in self.sums:
+            raise ValueError(f"Неизвестный вид модификатора: {kind}")
+        modifier = Modifier(kind, value, day + duration, name)
+        heapq.heappush(self.heap, (modifier.expires_day, self.counter, modifier))
+        self.counter += 1
+        self.sums[kind] += value
+        self.counts[kind] += 1
+        self.version += 1
+        return modifier
+
+    def expire(self, day):
+        """Снять модификаторы, не действующие на доход дня day; вернуть снятые"""
+        expired = []
+        heap = self.heap
+        while heap and heap[0][0] < day:
+            modifier = heapq.heappop(heap)[2]
+            kind = modifier.kind
+            self.counts[kind] -= 1
+            # Без активных модификаторов сумма сбрасывается точно (без накопленной погрешности)
+            self.sums[kind] = self.sums[kind] - modifier.value if self.counts[kind] else 0.0
+            expired.append(modifier)
+        if expired:
+            self.version += 1
+        return expired
+
+    def days_active(self, day, days):
+        """Сколько дней из day .. day + days - 1 множители не меняются (после expire(day))"""
+        if not self.heap:
+            return days
+        return min(days, self.heap[0][0] - day + 1)
+
+    def multiplier(self, kind):
+        return max(0.0, 1.0 + self.sums[kind])
+
+    @property
+    def income_multiplier(self):
+        return self.multiplier(INCOME)
+
+    @property
+    def maintenance_multiplier(self):
+        return self.multiplier(MAINTENANCE)
+
+    def active(self):
+        """Активные модификаторы в порядке окончания"""
+        return [entry[2] for entry in sorted(self.heap)]
+
+    def clear(self):
+        self.__init__()
+
+    def to_list(self):
+        """Активные модификаторы для сохранения"""
+        return [modifier.to_list() for modifier in self.active()]
+
+    def restore(self, items):
+        """Восстановить модификаторы из сохранения"""
+        self.clear()
+        for kind, value, expires_day, name in items:
+            modifier = Modifier(kind, value, expires_day, name)
+            heapq.heappush(self.heap, (expires_day, self.counter, modifier))
+            self.counter += 1
+            self.sums[kind] += value
+            self.counts[kind] += 1
+        self.version += 1
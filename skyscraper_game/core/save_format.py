@@ -0,0 +1,250 @@
+"""Колоночный формат этажей и бинарный формат сохранений.
+
+Бинарный файл (.sky):
+    заголовок  <4sHHI>  magic, версия формата, флаги, длина полезной части
+    полезная часть (при FLAG_COMPRESSED сжата zlib):
+        <I> длина JSON-заголовка, JSON-заголовок (дополнен до 8 байт)
+        <II> всего этажей в здании, количество записей n
+        колонки по n элементов: income_collected <i8, floor_index <u4,
+        owned u1, floor_type u1, repair_level u1, manager u1
+
+Сохраняются только этажи, отличающиеся от состояния по умолчанию.
+Индексы типов, ремонта и менеджеров ссылаются на списки ключей из
+JSON-заголовка, поэтому перестановка ключей в конфиге не ломает сохранения.
+"""
+import json
+import struct
+import zlib
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен: без него колонки читаются через struct
+    np = None
+
+MAGIC = b"SKYS"
+BINARY_VERSION = 1
+FLAG_COMPRESSED = 1
+
+FILE_HEADER = struct.Struct("<4sHHI")
+LENGTH = struct.Struct("<I")
+FLOOR_COUNTS = struct.Struct("<II")
+
+# (имя колонки, формат struct, dtype NumPy)
+COLUMNS = (
+    ("income_collected", "q", "<i8"),
+    ("floor_index", "I", "<u4"),
+    ("owned", "B", "u1"),
+    ("floor_type", "B", "u1"),
+    ("repair_level", "B", "u1"),
+    ("manager", "B", "u1"),
+)
+
+
+class SaveFormatError(Exception):
+    """Файл сохранения поврежден или имеет неизвестный формат"""
+
+
+class FloorRecords:
+    """Колонки этажей, отличающихся от состояния по умолчанию.
+
+    Колонки - массивы NumPy или списки одинаковой длины. Ключи типов,
+    ремонта и менеджеров хранятся вместе с колонками.
+    """
+    def __init__(self, total_floors, columns, keys):
+        self.total_floors = total_floors
+        self.columns = columns
+        self.keys = keys
+
+    def __len__(self):
+        return len(self.columns["floor_index"])
+
+    @classmethod
+    def from_store(cls, store):
+        """Снимок нестандартных этажей (копия, не зависит от дальнейших изменений)"""
+        keys = {
+            "types": list(store.type_keys),
+            "repairs": list(store.repair_keys),
+            "managers": list(store.manager_keys),
+        }
+        default_type = store.rates.default_type
+        default_repair = store.rates.default_repair
+
+        if store.use_numpy:
+            mask = (store.owned | (store.type_index != default_type)
+                    | (store.repair_index != default_repair)
+                    | (store.manager_index != 0) | (store.income_collected != 0))
+            indices = np.flatnonzero(mask)
+            columns = {
+                "income_collected": store.income_collected[indices].astype("<i8"),
+                "floor_index": indices.astype("<u4"),
+                "owned": store.owned[indices].astype("u1"),
+                "floor_type": store.type_index[indices].astype("u1"),
+                "repair_level": store.repair_index[indices].astype("u1"),
+                "manager": store.manager_index[indices].astype("u1"),
+            }
+            return cls(store.size, columns, keys)
+
+        columns = {name: [] for name, _, _ in COLUMNS}
+        for i in range(store.size):
+            if (store.owned[i] or store.type_index[i] != default_type
+                    or store.repair_index[i] != default_repair
+                    or store.manager_index[i] != 0 or store.income_collected[i] != 0):
+                columns["income_collected"].append(int(store.income_collected[i]))
+                columns["floor_index"].append(i)
+                columns["owned"].append(1 if store.owned[i] else 0)
+                columns["floor_type"].append(int(store.type_index[i]))
+                columns["repair_level"].append(int(store.repair_index[i]))
+                columns["manager"].append(int(store.manager_index[i]))
+        return cls(store.size, columns, keys)
+
+    def apply_to_store(self, store):
+        """Записывает этажи в хранилище (остальные этажи сбрасываются)"""
+        store.reset()
+        type_map = [store.encode_type(key) for key in self.keys["types"]]
+        repair_map = [store.encode_repair(key) for key in self.keys["repairs"]]
+        manager_map = [store.encode_manager(key) for key in self.keys["managers"]]
+        columns = self.columns
+
+        if store.use_numpy:
+            indices = np.asarray(columns["floor_index"], dtype=np.int64)
+            valid = (indices >= 0) & (indices < store.size)
+            indices = indices[valid]
+
+            def column(name):
+                return np.asarray(columns[name], dtype=np.int64)[valid]
+
+            store.owned[indices] = column("owned").astype(bool)
+            store.type_index[indices] = np.asarray(type_map, dtype=np.int16)[column("floor_type")]
+            store.repair_index[indices] = np.asarray(repair_map, dtype=np.int16)[column("repair_level")]
+            store.manager_index[indices] = np.asarray(manager_map, dtype=np.int16)[column("manager")]
+            store.income_collected[indices] = column("income_collected")
+            return
+
+        for row, index in enumerate(columns["floor_index"]):
+            index = int(index)
+            if not 0 <= index < store.size:
+                continue
+            store.owned[index] = bool(columns["owned"][row])
+            store.type_index[index] = type_map[columns["floor_type"][row]]
+            store.repair_index[index] = repair_map[columns["repair_level"][row]]
+            store.manager_index[index] = manager_map[columns["manager"][row]]
+            store.income_collected[index] = int(columns["income_collected"][row])
+
+    def to_json_floors(self):
+        """Этажи в виде списка словарей (для JSON-сохранений)"""
+        columns = self.columns
+        floors = []
+        for row in range(len(self)):
+            floors.append({
+                "floor_number": int(columns["floor_index"][row]) + 1,
+                "owned": bool(columns["owned"][row]),
+                "floor_type": self.keys["types"][columns["floor_type"][row]],
+                "manager": self.keys["managers"][columns["manager"][row]],
+                "repair_level": self.keys["repairs"][columns["repair_level"][row]],
+                "income_collected": int(columns["income_collected"][row]),
+            })
+        return floors
+
+    @classmethod
+    def from_json_floors(cls, floors, store):
+        """Колонки из списка словарей JSON-сохранения (в ключах текущего конфига)"""
+        keys = {
+            "types": list(store.type_keys),
+            "repairs": list(store.repair_keys),
+            "managers": list(store.manager_keys),
+        }
+        columns = {name: [] for name, _, _ in COLUMNS}
+        for floor_data in floors:
+            columns["income_collected"].append(int(floor_data.get("income_collected", 0)))
+            columns["floor_index"].append(int(floor_data["floor_number"]) - 1)
+            columns["owned"].append(1 if floor_data.get("owned") else 0)
+            columns["floor_type"].append(store.encode_type(floor_data.get("floor_type")))
+            columns["repair_level"].append(store.encode_repair(floor_data.get("repair_level")))
+            columns["manager"].append(store.encode_manager(floor_data.get("manager")))
+        return cls(store.size, columns, keys)
+
+    def owned_count(self):
+        """Количество купленных этажей среди записей"""
+        return int(sum(1 for owned in self.columns["owned"] if owned))
+
+
+def encode_binary(header, records, compress=True):
+    """Собирает бинарное сохранение: JSON-заголовок + колонки этажей"""
+    header = dict(header, keys=records.keys)
+    header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    header_bytes += b" " * (-(LENGTH.size + len(header_bytes)) % 8)
+
+    parts = [LENGTH.pack(len(header_bytes)), header_bytes,
+             FLOOR_COUNTS.pack(records.total_floors, len(records))]
+    count = len(records)
+    for name, code, dtype in COLUMNS:
+        column = records.columns[name]
+        if np is not None and isinstance(column, np.ndarray):
+            parts.append(column.astype(dtype, copy=False).tobytes())
+        else:
+            parts.append(struct.pack(f"<{count}{code}", *column))
+    payload = b"".join(parts)
+
+    flags = 0
+    if compress:
+        payload_out = zlib.compress(payload, 6)
+        flags |= FLAG_COMPRESSED
+    else:
+        payload_out = payload
+    return FILE_HEADER.pack(MAGIC, BINARY_VERSION, flags, len(payload)) + payload_out
+
+
+def _payload_view(data):
+    """Проверяет заголовок файла и возвращает memoryview полезной части"""
+    view = memoryview(data)
+    if len(view) < FILE_HEADER.size:
+        raise SaveFormatError("файл слишком короткий")
+    magic, version, flags, payload_length = FILE_HEADER.unpack_from(view, 0)
+    if magic != MAGIC:
+        raise SaveFormatError("неизвестный формат файла")
+    if version > BINARY_VERSION:
+        raise SaveFormatError(f"версия формата {version} новее поддерживаемой {BINARY_VERSION}")
+
+    payload = view[FILE_HEADER.size:]
+    if flags & FLAG_COMPRESSED:
+        payload = memoryview(zlib.decompress(payload))
+    if len(payload) != payload_length:
+        raise SaveFormatError("длина данных не совпадает с заголовком")
+    return payload
+
+
+def decode_header(data):
+    """Читает только JSON-заголовок бинарного сохранения"""
+    payload = _payload_view(data)
+    (header_length,) = LENGTH.unpack_from(payload, 0)
+    return json.loads(bytes(payload[LENGTH.size:LENGTH.size + header_length]).decode("utf-8"))
+
+
+def decode_binary(data):
+    """Разбирает бинарное сохранение, возвращает (заголовок, FloorRecords).
+
+    Колонки читаются из memoryview без копирования (np.frombuffer),
+    без NumPy - через struct.unpack_from.
+    """
+    payload = _payload_view(data)
+    (header_length,) = LENGTH.unpack_from(payload, 0)
+    offset = LENGTH.size
+    header = json.loads(bytes(payload[offset:offset + header_length]).decode("utf-8"))
+    offset += header_length
+
+    total_floors, count = FLOOR_COUNTS.unpack_from(payload, offset)
+    offset += FLOOR_COUNTS.size
+
+    columns = {}
+    for name, code, dtype in COLUMNS:
+        size = struct.calcsize(code) * count
+        if offset + size > len(payload):
+            raise SaveFormatError("данные этажей обрезаны")
+        if np is not None:
+            columns[name] = np.frombuffer(payload, dtype=dtype, count=count, offset=offset)
+        else:
+            columns[name] = list(struct.unpack_from(f"<{count}{code}", payload, offset))
+        offset += size
+
+    keys = header.pop("keys", {"types": [], "repairs": [], "managers": [None]})
+    return header, FloorRecords(total_floors, columns, keys)
@@ -0,0 +1,120 @@
+import json
+import os
+import threading
+
+INDEX_FILENAME = "saves.index"
+INDEX_VERSION = 1
+
+
+class SaveIndex:
+    """Индекс сохранений каталога: дата, день, деньги, этажи, версия формата.
+
+    Хранится в saves.index (JSON) рядом с сохранениями и обновляется при каждой
+    записи сохранения. Запись индекса сверяется с размером и временем
+    изменения файла; устаревшие и недостающие записи перестраиваются
+    лениво чтением только заголовка сохранения.
+    """
+    def __init__(self, save_dir, read_header, write_atomic, extensions):
+        """
+        read_header(filename) - читает заголовок сохранения (dict с metadata/player)
+        write_atomic(path, data) - атомарная запись файла
+        extensions - расширения файлов сохранений
+        """
+        self.save_dir = save_dir
+        self.path = os.path.join(save_dir, INDEX_FILENAME)
+        self.read_header = read_header
+        self.write_atomic = write_atomic
+        self.extensions = extensions
+        self.entries = None  # загружаются при первом обращении
+        self._lock = threading.Lock()  # сохранения пишутся и с рабочего потока
+
+    @staticmethod
+    def file_signature(path):
+        """Размер и время изменения файла для проверки актуальности записи"""
+        stat = os.stat(path)
+        return [stat.st_size, stat.st_mtime_ns]
+
+    @staticmethod
+    def make_entry(filename, header, signature):
+        metadata = header.get("metadata", {})
+        player = header.get("player", {})
+        return {
+            "date": metadata.get("save_date", ""),
+            "day": player.get("day", 0),
+            "money": player.get("money", 0),
+            "floors_owned": metadata.get("floors_owned", 0),
+            "version": metadata.get("version", "1.0"),
+            "format": "json" if filename.endswith(".json") else "binary",
+            "signature": signature
+        }
+
+    def _load(self):
+        if self.entries is not None:
+            return
+        self.entries = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == INDEX_VERSION:
+                self.entries = data.get("saves", {})
+        except (OSError, ValueError):
+            pass
+
+    def _write(self):
+        data = {"version": INDEX_VERSION, "saves": self.entries}
+        try:
+            self.write_atomic(self.path, json.dumps(data, ensure_ascii=False).encode('utf-8'))
+        except OSError as e:
+            print(f"⚠️ Не удалось записать индекс сохранений: {e}")
+
+    def update(self, filename, header):
+        """Обновить запись после записи сохранения"""
+        with self._lock:
+            self._load()
+            path = os.path.join(self.save_dir, filename)
+            self.entries[filename] = self.make_entry(filename, header, self.file_signature(path))
+            self._write()
+
+    def refresh(self):
+        """Сверить индекс с файлами каталога, перестроить устаревшие записи"""
+        with self._lock:
+            self._load()
+            try:
+                filenames = [f for f in os.listdir(self.save_dir) if f.endswith(self.extensions)]
+            except OSError:
+                filenames = []
+
+            changed = False
+            for filename in list(self.entries):
+                if filename not in filenames:
+                    del self.entries[filename]
+                    changed = True
+
+            for filename in filenames:
+                path = os.path.join(self.save_dir, filename)
+                try:
+                    signature = self.file_signature(path)
+                except OSError:
+                    continue
+                entry = self.entries.get(filename)
+                if entry is not None and entry.get("signature") == signature:
+                    continue
+                try:
+                    header = self.read_header(filename)
+                except Exception as e:
+                    print(f"⚠️ Не удалось прочитать заголовок {filename}: {e}")
+                    self.entries.pop(filename, None)
+                    continue
+                self.entries[filename] = self.make_entry(filename, header, signature)
+                changed = True
+
+            if changed:
+                self._write()
+            return dict(self.entries)
+
+    def newest(self):
+        """Имя самого нового сохранения по дате сохранения"""
+        entries = [(entry["date"], filename) for filename, entry in self.refresh().items()]
+        if not entries:
+            return None
+        return max(entries)[1]
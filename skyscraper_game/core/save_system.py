@@ -1,25 +1,51 @@
-import json, os, time
+import json, os, tempfile, time
 from datetime import datetime
+from .background_save import BackgroundSaver
+from .save_format import FloorRecords, encode_binary, decode_binary, decode_header
+from .save_index import SaveIndex
+
+JSON_EXTENSION = ".json"
+BINARY_EXTENSION = ".sky"
+SAVE_EXTENSIONS = (JSON_EXTENSION, BINARY_EXTENSION)
+
+# Старое авто-сохранение в JSON, переносится в бинарный формат при загрузке
+LEGACY_AUTOSAVE = "autosave.json"
+
 
 class SaveSystem:
-    def __init__(self, save_dir="data/saves"):
+    def __init__(self, save_dir="data/saves", save_format="binary", compress=True):
+        """
+        save_format - "binary" (компактный .sky) или "json" (для экспорта и отладки)
+        compress - сжимать бинарные сохранения zlib
+        """
         self.save_dir = save_dir
+        self.save_format = save_format
+        self.compress = compress
+        self.last_loaded_metadata = {}
+        self.last_loaded_journal_seq = None
+        self.background = None
         os.makedirs(save_dir, exist_ok=True)
-    
-    def save_game(self, game, filename=None):
-        """Сохраняет игру в файл"""
-        if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"save_{timestamp}.json"
-        
-        save_path = os.path.join(self.save_dir, filename)
-        
-        save_data = {
+        self.index = SaveIndex(save_dir, self.read_header, self.write_atomic, SAVE_EXTENSIONS)
+
+    def filename_for(self, name):
+        """Имя файла сохранения с расширением текущего формата"""
+        extension = BINARY_EXTENSION if self.save_format == "binary" else JSON_EXTENSION
+        return name + extension
+
+    def autosave_filename(self):
+        """Имя файла авто-сохранения"""
+        return self.filename_for("autosave")
+
+    def capture_state(self, game):
+        """Снимок состояния игры: заголовок и колонки нестандартных этажей"""
+        header = {
             "metadata": {
                 "version": "1.1",
                 "save_date": datetime.now().isoformat(),
+                "save_time": game.wall_clock(),
                 "game_days": game.day,
-                "play_time": game.stats.get_play_time()
+                "play_time": game.stats.get_play_time(),
+                "floors_owned": game.get_owned_floor_count()
             },
             "player": {
                 "money": game.money,
@@ -33,51 +59,154 @@ class SaveSystem:
                 "upgrades_bought": game.stats.upgrades_bought,
                 "start_time": game.stats.start_time
             },
-            "building": {
-                "floors": []
-            },
             "upgrades": {
                 "elevator_system_level": getattr(game, 'elevator_system_level', 0),
                 "facade_renovation_level": getattr(game, 'facade_renovation_level', 0),
                 "infrastructure_level": getattr(game, 'infrastructure_level', 0)
+            },
+            "events": {
+                "modifiers": game.modifiers.to_list()
             }
         }
-        
-        # Сохраняем данные по каждому этажу
-        for floor in game.building.floors:
-            floor_data = {
-                "floor_number": floor.floor_number,
-                "owned": floor.owned,
-                "floor_type": floor.floor_type,
-                "manager": floor.manager,
-                "repair_level": floor.repair_level,
-                "income_collected": floor.income_collected
-            }
-            save_data["building"]["floors"].append(floor_data)
-        
+        # Номер последней записи журнала, вошедшей в снимок
+        journal = getattr(game, 'journal', None)
+        if journal is not None:
+            header["journal"] = {"seq": journal.seq}
+        return header, FloorRecords.from_store(game.building.store)
+
+    def encode_state(self, header, records, filename):
+        """Сериализует снимок в байты по расширению файла"""
+        if filename.endswith(JSON_EXTENSION):
+            save_data = dict(header)
+            save_data["building"] = {"floors": records.to_json_floors()}
+            return json.dumps(save_data, indent=2, ensure_ascii=False).encode('utf-8')
+        return encode_binary(header, records, self.compress)
+
+    def write_state(self, header, records, filename):
+        """Сериализует снимок и атомарно записывает его в файл"""
+        save_path = os.path.join(self.save_dir, filename)
         try:
-            with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, indent=2, ensure_ascii=False)
-            print(f"💾 Игра сохранена: {filename}")
-            return True
+            self.write_atomic(save_path, self.encode_state(header, records, filename))
         except Exception as e:
             print(f"❌ Ошибка сохранения: {e}")
             return False
-    
-    def load_game(self, game, filename):
-        """Загружает игру из файла"""
-        save_path = os.path.join(self.save_dir, filename)
-        
+
+        self.index.update(filename, header)
+        return True
+
+    @staticmethod
+    def write_atomic(path, data):
+        """Запись через временный файл + fsync + os.replace (файл не обрезается при сбое).
+
+        Временный файл уникален для каждой записи, поэтому одновременные
+        записи одного файла (ручное сохранение и фоновое авто-сохранение)
+        не пишут в один и тот же временный файл: побеждает последний
+        os.replace, и файл всегда цельный.
+        """
+        directory = os.path.dirname(path) or "."
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp")
         try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+
+        # Фиксируем переименование в каталоге (где это поддерживается)
+        if hasattr(os, 'O_DIRECTORY'):
+            try:
+                dir_fd = os.open(directory, os.O_DIRECTORY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+            except OSError:
+                pass
+
+    def save_game(self, game, filename=None):
+        """Сохраняет игру в файл"""
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = self.filename_for(f"save_{timestamp}")
+
+        try:
+            header, records = self.capture_state(game)
+        except Exception as e:
+            print(f"❌ Ошибка сохранения: {e}")
+            return False
+
+        if self.write_state(header, records, filename):
+            print(f"💾 Игра сохранена: {filename}")
+            return True
+        return False
+
+    def save_game_async(self, game, filename, on_saved=None):
+        """Сохранение в фоне: снимок сейчас, запись на рабочем потоке.
+
+        on_saved вызывается на рабочем потоке после успешной записи.
+        """
+        if self.background is None:
+            self.background = BackgroundSaver(self)
+        self.background.request(game, filename, on_saved)
+
+    def flush(self, timeout=None):
+        """Дождаться завершения фоновых сохранений"""
+        if self.background is None:
+            return True
+        return self.background.flush(timeout)
+
+    def background_result(self, filename):
+        """Удалась ли последняя фоновая запись файла filename (None - записи не было)"""
+        if self.background is None:
+            return None
+        return self.background.result(filename)
+
+    def read_state(self, game, filename):
+        """Читает файл сохранения, возвращает (заголовок, FloorRecords)"""
+        save_path = os.path.join(self.save_dir, filename)
+        if filename.endswith(JSON_EXTENSION):
+            with open(save_path, 'r', encoding='utf-8') as f:
+                save_data = json.load(f)
+            floors = save_data.pop("building", {}).get("floors", [])
+            return save_data, FloorRecords.from_json_floors(floors, game.building.store)
+
+        with open(save_path, 'rb') as f:
+            return decode_binary(f.read())
+
+    def read_header(self, filename):
+        """Читает только заголовок сохранения (без колонок этажей)"""
+        save_path = os.path.join(self.save_dir, filename)
+        if filename.endswith(JSON_EXTENSION):
             with open(save_path, 'r', encoding='utf-8') as f:
                 save_data = json.load(f)
-            
+            # В старых JSON-сохранениях нет количества этажей в метаданных
+            floors = save_data.pop("building", {}).get("floors", [])
+            metadata = save_data.setdefault("metadata", {})
+            metadata.setdefault("floors_owned", len([f for f in floors if f.get('owned')]))
+            return save_data
+
+        with open(save_path, 'rb') as f:
+            return decode_header(f.read())
+
+    def load_game(self, game, filename):
+        """Загружает игру из файла"""
+        try:
+            save_data, records = self.read_state(game, filename)
+
             print(f"💾 Загрузка игры: {filename}")
-            
+            self.last_loaded_metadata = save_data.get("metadata", {})
+            self.last_loaded_journal_seq = save_data.get("journal", {}).get("seq")
+
             # Загружаем данные игрока
             game.money = save_data["player"]["money"]
             game.day = save_data["player"]["day"]
-            
+
             # Загружаем статистику
             if "statistics" in save_data:
                 stats = save_data["statistics"]
@@ -86,61 +215,167 @@ class SaveSystem:
                 game.stats.floors_purchased = stats.get("floors_purchased", 0)
                 game.stats.managers_hired = stats.get("managers_hired", 0)
                 game.stats.upgrades_bought = stats.get("upgrades_bought", 0)
-                game.stats.start_time = stats.get("start_time", time.time())
-            
+                game.stats.start_time = stats.get("start_time", game.stats.clock())
+
             # Загружаем улучшения
             game.elevator_system_level = save_data["upgrades"].get("elevator_system_level", 0)
             game.facade_renovation_level = save_data["upgrades"].get("facade_renovation_level", 0)
             game.infrastructure_level = save_data["upgrades"].get("infrastructure_level", 0)
-            
+
+            # Загружаем модификаторы событий
+            game.modifiers.restore(save_data.get("events", {}).get("modifiers", []))
+            game.sync_modifiers()
+
             # Загружаем этажи
-            for floor_data in save_data["building"]["floors"]:
-                floor_num = floor_data["floor_number"]
-                if 1 <= floor_num <= len(game.building.floors):
-                    floor = game.building.floors[floor_num - 1]
-                    floor.owned = floor_data["owned"]
-                    floor.floor_type = floor_data["floor_type"]
-                    floor.manager = floor_data["manager"]
-                    floor.repair_level = floor_data["repair_level"]
-                    floor.income_collected = floor_data["income_collected"]
-            
+            records.apply_to_store(game.building.store)
+
+            # Применяем улучшения и пересчитываем итоги по загруженным этажам
+            game.sync_upgrades()
+
             print("✅ Игра успешно загружена")
             return True
         except Exception as e:
             print(f"❌ Ошибка загрузки: {e}")
             return False
-    
+
     def auto_load(self, game):
         """Автоматическая загрузка последнего сохранения"""
         save_files = self.get_save_files()
-        if save_files:
-            if "autosave.json" in save_files:
-                return self.load_game(game, "autosave.json")
-            elif save_files:
-                return self.load_game(game, save_files[-1])
-        return False
-    
+        autosave = self.autosave_filename()
+        journal = getattr(game, 'journal', None)
+
+        # Снимка еще нет, но журнал ведется с начала новой игры
+        if autosave not in save_files and journal is not None and journal.starts_from_new_game():
+            metadata = self.replay_journal(game, 0, {})
+            self.apply_offline_progress(game, metadata)
+            return True
+
+        if not save_files:
+            return False
+
+        if autosave in save_files and journal is not None and journal.segments():
+            # Журнал продолжает авто-сохранение, вместе они новее любого файла
+            filename = autosave
+        else:
+            # Самое новое сохранение по дате из индекса (без чтения остальных файлов)
+            filename = self.index.newest() or save_files[-1]
+        if filename == LEGACY_AUTOSAVE:
+            return self.migrate_legacy_autosave(game)
+
+        if not self.load_game(game, filename):
+            return False
+
+        metadata = self.last_loaded_metadata
+        if journal is not None:
+            if filename == autosave:
+                # Снимок + хвост журнала после него
+                metadata = self.replay_journal(game, self.last_loaded_journal_seq or 0, metadata)
+            else:
+                # Журнал относится к другой игре: начинаем его заново от загруженного снимка
+                journal.reset()
+                self.save_game(game, autosave)
+        self.apply_offline_progress(game, metadata)
+        return True
+
+    def replay_journal(self, game, snapshot_seq, metadata):
+        """Применяет записи журнала после снимка, возвращает метаданные на момент последней записи"""
+        journal = game.journal
+        records = journal.read_after(snapshot_seq)
+        journal.seq = snapshot_seq
+        if not records:
+            return metadata
+
+        applied = journal.replay(game, records)
+        print(f"📜 Журнал: применено действий после снимка: {applied}")
+
+        # Оффлайн-прогресс считается от последней записи журнала, а не от снимка
+        metadata = dict(metadata)
+        metadata["save_date"] = datetime.fromtimestamp(records[-1]["ts"]).isoformat()
+        metadata["save_time"] = records[-1]["ts"]
+        return metadata
+
+    def migrate_legacy_autosave(self, game):
+        """Переносит старый autosave.json в текущий формат сохранений"""
+        if not self.load_game(game, LEGACY_AUTOSAVE):
+            return False
+
+        metadata = self.last_loaded_metadata
+        autosave = self.autosave_filename()
+        journal = getattr(game, 'journal', None)
+        if journal is not None:
+            journal.reset()
+        if autosave != LEGACY_AUTOSAVE and self.save_game(game, autosave):
+            legacy_path = os.path.join(self.save_dir, LEGACY_AUTOSAVE)
+            os.replace(legacy_path, legacy_path + ".bak")
+            print(f"🔁 {LEGACY_AUTOSAVE} перенесен в {autosave}")
+
+        self.apply_offline_progress(game, metadata)
+        return True
+
+    def apply_offline_progress(self, game, metadata):
+        """Начисляет доход за время, пока игра была закрыта.
+
+        Время отсутствия считается по часам реального времени игры
+        (game.wall_clock): часы симуляции отстают от реального времени на
+        остановки цикла, и по ним отброшенное время засчитывалось бы
+        повторно как оффлайн. В тестах часы можно подменить. Оффлайн-дни проходят
+        через Game.advance_days - без случайных событий.
+        """
+        game.offline_days = 0
+        game.offline_income = 0
+        if not getattr(game.config, 'OFFLINE_PROGRESS', False):
+            return 0
+
+        try:
+            if "save_time" in metadata:
+                save_time = float(metadata["save_time"])
+            else:
+                # Сохранения до появления save_time: время по дате сохранения
+                save_time = datetime.fromisoformat(metadata["save_date"]).timestamp()
+            offline_seconds = game.wall_clock() - save_time
+        except Exception as e:
+            print(f"⚠️ Не удалось определить время сохранения: {e}")
+            return 0
+
+        days = int(offline_seconds // game.config.DAY_DURATION)
+        days = min(days, game.config.OFFLINE_MAX_DAYS)
+        if days <= 0:
+            return 0
+
+        game.offline_days = days
+        game.offline_income = game.advance_days(days)
+        print(f"⏰ Оффлайн-прогресс: {days} дн., +{game.offline_income} руб.")
+        return days
+
     def get_save_files(self):
         """Возвращает список файлов сохранений"""
         try:
-            files = [f for f in os.listdir(self.save_dir) if f.endswith('.json')]
+            files = [f for f in os.listdir(self.save_dir) if f.endswith(SAVE_EXTENSIONS)]
             return sorted(files)
         except:
             return []
-    
+
     def get_save_info(self, filename):
-        """Получить информацию о сохранении"""
-        save_path = os.path.join(self.save_dir, filename)
-        try:
-            with open(save_path, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
-            
-            return {
-                'filename': filename,
-                'date': save_data['metadata']['save_date'],
-                'day': save_data['player']['day'],
-                'money': save_data['player']['money'],
-                'floors_owned': len([f for f in save_data['building']['floors'] if f['owned']])
-            }
-        except:
-            return None
\ No newline at end of file
+        """Получить информацию о сохранении (из индекса)"""
+        entry = self.index.refresh().get(filename)
+        if entry is None:
+            return None
+        return self._save_info(filename, entry)
+
+    def get_save_list(self):
+        """Информация обо всех сохранениях, от новых к старым"""
+        entries = self.index.refresh()
+        infos = [self._save_info(filename, entry) for filename, entry in entries.items()]
+        return sorted(infos, key=lambda info: info['date'], reverse=True)
+
+    @staticmethod
+    def _save_info(filename, entry):
+        return {
+            'filename': filename,
+            'date': entry['date'],
+            'day': entry['day'],
+            'money': entry['money'],
+            'floors_owned': entry['floors_owned'],
+            'version': entry['version'],
+            'format': entry['format']
+        }
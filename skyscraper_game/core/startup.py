@@ -0,0 +1,57 @@
+import json
+import os
+import threading
+from contextlib import contextmanager
+from time import perf_counter, strftime
+
+STARTUP_LOG = "data/startup_times.jsonl"
+
+
+class StartupTimer:
+    """Замеры этапов запуска игры.
+
+    Этапы могут идти в разных потоках; для каждого записываются начало
+    (от старта процесса), длительность и поток. finish() печатает сводку
+    и дописывает строку JSON в журнал запусков.
+    """
+    def __init__(self, log_path=STARTUP_LOG):
+        self.log_path = log_path
+        self.started = perf_counter()
+        self.stages = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name):
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            end = perf_counter()
+            with self._lock:
+                self.stages.append({
+                    "stage": name,
+                    "start_ms": round((start - self.started) * 1000, 2),
+                    "duration_ms": round((end - start) * 1000, 2),
+                    "thread": threading.current_thread().name
+                })
+
+    def timed(self, name, func, *args):
+        """Вызвать func(*args) как этап name (для запуска в пуле потоков)"""
+        with self.stage(name):
+            return func(*args)
+
+    def finish(self):
+        """Итог запуска: сводка в консоль и запись в журнал запусков"""
+        total_ms = round((perf_counter() - self.started) * 1000, 2)
+        stages = sorted(self.stages, key=lambda stage: stage["start_ms"])
+        print(f"⏱️ Запуск за {total_ms} мс: " +
+              ", ".join(f"{stage['stage']} {stage['duration_ms']}" for stage in stages))
+
+        record = {"date": strftime("%Y-%m-%d %H:%M:%S"), "total_ms": total_ms, "stages": stages}
+        try:
+            os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+            with open(self.log_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError as e:
+            print(f"⚠️ Не удалось записать время запуска: {e}")
+        return record
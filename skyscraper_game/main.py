@@ -1,7 +1,9 @@
 import pygame
 import sys
 import os
+import time
 import atexit
+from concurrent.futures import ThreadPoolExecutor
 
 # Добавляем пути для импорта
 sys.path.append('config')
@@ -9,8 +11,12 @@ sys.path.append('core')
 sys.path.append('ui')
 
 from config.game_config import GameConfig
+from core.clock import ManualClock, SystemClock
 from core.game import Game
+from core.startup import StartupTimer
+from ui.fonts import preload_fonts
 from ui.main_window import GameWindow
+from ui.splash import SplashScreen
 
 def cleanup(game):
     """Функция очистки при выходе"""
@@ -23,6 +29,102 @@ def setup_directories():
     for directory in directories:
         os.makedirs(directory, exist_ok=True)
     
+def run_game_loop(game_window, sim_clock):
+    """Главный игровой цикл.
+
+    Симуляция идет фиксированными шагами: реальное время кадра копится
+    и расходуется шагами по 1/SIMULATION_RATE секунды, на каждом шаге
+    часы игры сдвигаются ровно на шаг. Если кадр затянулся, выполняется
+    не больше MAX_CATCH_UP_STEPS шагов, а лишнее время отбрасывается.
+    Поэтому часы симуляции отстают от реального времени на каждую такую
+    остановку (и на время запуска) и годятся только для симуляции: время
+    сохранений и журнала игра берет из отдельных часов реального времени.
+    Отрисовка идет отдельно с частотой RENDER_FPS; когда на экране ничего
+    не меняется, кадр не рисуется и цикл замедляется до IDLE_FPS.
+    """
+    config = game_window.config
+    profiler = game_window.profiler
+    step = 1.0 / config.SIMULATION_RATE
+    frame_clock = pygame.time.Clock()
+    accumulator = 0.0
+    previous = time.perf_counter()
+    
+    running = True
+    while running:
+        now = time.perf_counter()
+        accumulator += now - previous
+        previous = now
+        
+        profiler.begin_frame()
+        running = profiler.measure("events", game_window.handle_events)
+        
+        steps = 0
+        while accumulator >= step and steps < config.MAX_CATCH_UP_STEPS:
+            sim_clock.advance(step)
+            game_window.update()
+            accumulator -= step
+            steps += 1
+        if accumulator >= step:
+            # Долгая остановка (перетаскивание окна, сон системы) - не догоняем
+            accumulator = 0.0
+        
+        if game_window.needs_render():
+            game_window.render()
+            profiler.end_frame()
+            frame_clock.tick(config.RENDER_FPS)
+        else:
+            profiler.end_frame()
+            frame_clock.tick(config.IDLE_FPS)
+
+def load_game(timer, sim_clock):
+    """Фоновая загрузка: конфигурации, игра и авто-сохранение"""
+    with timer.stage("config"):
+        config = GameConfig()
+    with timer.stage("game_init"):
+        game = Game(config=config, clock=sim_clock, wall_clock=SystemClock())
+    with timer.stage("autosave"):
+        loaded = game.save_system.auto_load(game)
+    return game, loaded
+
+def start_game(timer, sim_clock):
+    """Поэтапный запуск.
+
+    Сразу после создания окна рисуется заставка, а шрифты (поиск
+    системных шрифтов медленный) и конфигурации с авто-сохранением
+    загружаются в двух фоновых потоках. Пока они работают, главный
+    поток обрабатывает события окна и обновляет заставку.
+    Возвращает (game, loaded) или None, если окно закрыли во время загрузки.
+    """
+    # Надписи заставки рендерятся до запуска потоков: шрифты грузятся в фоне,
+    # а SDL_ttf нельзя использовать из двух потоков одновременно
+    statuses = ("Загрузка...", "Загрузка шрифтов...", "Загрузка сохранения...")
+    with timer.stage("first_frame"):
+        splash = SplashScreen((GameConfig.SCREEN_WIDTH, GameConfig.SCREEN_HEIGHT), statuses)
+        splash.draw(statuses[0], 0.0)
+    
+    frame_clock = pygame.time.Clock()
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="startup") as pool:
+        fonts = pool.submit(timer.timed, "fonts", preload_fonts)
+        game = pool.submit(load_game, timer, sim_clock)
+        
+        quit_requested = False
+        started = time.perf_counter()
+        while not (fonts.done() and game.done()):
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    quit_requested = True
+            status = statuses[1] if not fonts.done() else statuses[2]
+            splash.draw(status, time.perf_counter() - started)
+            frame_clock.tick(30)
+        
+        # Ошибки фоновых потоков передаются сюда
+        fonts.result()
+        result = game.result()
+    
+    if quit_requested:
+        return None
+    return result
+
 def main():
     """Главная функция запуска игры"""
     game = None
@@ -30,18 +132,35 @@ def main():
         # Создание директорий
         setup_directories()
         
+        timer = StartupTimer()
+        
         # Инициализация Pygame
-        pygame.init()
+        with timer.stage("pygame_init"):
+            pygame.init()
         
-        # Создаем экземпляр игры и окно
-        game = Game()
-        game_window = GameWindow(game)
-        game.window = game_window  # Ссылка на окно для доступа из игры
+        # Игра и авто-сохранение загружаются в фоне, пока показана заставка.
+        # Часы симуляции идут только шагами главного цикла и не догоняют
+        # отброшенное время; сохраняемые отметки времени идут по time.time
+        sim_clock = ManualClock(time.time())
+        started = start_game(timer, sim_clock)
+        if started is None:
+            pygame.quit()
+            sys.exit()
+        game, loaded = started
         
-        # Пробуем загрузить авто-сохранение
-        if game.save_system.auto_load(game):
+        with timer.stage("window_init"):
+            game_window = GameWindow(game)
+            game.window = game_window  # Ссылка на окно для доступа из игры
+        
+        # Сообщение о загрузке авто-сохранения
+        if loaded:
             print("✅ Авто-загрузка выполнена")
             game_window.show_message("🎮 Игра загружена из авто-сохранения!", game_window.colors['success'])
+            if getattr(game, 'offline_days', 0) > 0:
+                game_window.show_message(
+                    f"⏰ Пока вас не было: {game.offline_days} дн., +{game.offline_income} руб.",
+                    game_window.colors['success']
+                )
         else:
             print("ℹ️  Авто-сохранение не найдено, начинаем новую игру")
             game_window.show_message("🚀 Новая игра начата! Удачи!", game_window.colors['success'])
@@ -49,12 +168,13 @@ def main():
         # Регистрируем функцию очистки при выходе
         atexit.register(cleanup, game)
         
-        # Главный игровой цикл
-        running = True
-        while running:
-            running = game_window.handle_events()
-            game_window.update()
+        # Первый настоящий кадр
+        with timer.stage("first_game_frame"):
             game_window.render()
+        timer.finish()
+        
+        # Главный игровой цикл
+        run_game_loop(game_window, sim_clock)
             
         # Корректный выход
         pygame.quit()
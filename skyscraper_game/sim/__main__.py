@@ -0,0 +1,37 @@
+"""Симуляция игры без окна.
+
+Запуск из каталога skyscraper_game:
+    python -m sim --days 1000 --strategy greedy --seed 42
+    python -m sim --days 365 --strategy my_script.json --json
+"""
+import argparse
+import json
+import sys
+
+from .headless import run_simulation, format_summary
+from .strategies import STRATEGIES, make_strategy
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m sim", description="Симуляция небоскрёба без окна")
+    parser.add_argument("--days", type=int, default=365, help="количество игровых дней")
+    parser.add_argument("--strategy", default="greedy",
+                        help=f"стратегия: {', '.join(STRATEGIES)} или путь к JSON-сценарию")
+    parser.add_argument("--seed", type=int, default=0, help="зерно генератора случайных событий")
+    parser.add_argument("--json", action="store_true", help="вывести сводку в формате JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    game, summary = run_simulation(args.days, make_strategy(args.strategy), seed=args.seed)
+    if args.json:
+        print(json.dumps(summary, ensure_ascii=False, indent=2))
+    else:
+        print(format_summary(summary))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
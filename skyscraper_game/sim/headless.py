@@ -0,0 +1,67 @@
+import time
+from core.clock import ManualClock
+from core.game import Game
+
+
+def run_simulation(days, strategy, seed=None, config=None, observer=None):
+    """Прогоняет игру без окна на days игровых дней.
+
+    Время идет по ManualClock, поэтому результат зависит только от
+    стратегии, зерна и конфигурации. observer(game) вызывается после
+    каждого дня. Возвращает (game, summary).
+    """
+    clock = ManualClock()
+    game = Game(config=config, clock=clock, seed=seed, autosave=False)
+    day_duration = game.config.DAY_DURATION
+
+    started = time.perf_counter()
+    for _ in range(days):
+        strategy.act(game)
+        clock.advance(day_duration)
+        game.tick_day()
+        if observer is not None:
+            observer(game)
+    elapsed = time.perf_counter() - started
+
+    return game, summarize(game, days, strategy, seed, elapsed)
+
+
+def summarize(game, days, strategy, seed, elapsed):
+    """Итоговая сводка по симуляции"""
+    return {
+        "strategy": getattr(strategy, "name", type(strategy).__name__),
+        "seed": seed,
+        "days": days,
+        "final_day": game.day,
+        "money": int(game.money),
+        "floors_owned": game.get_owned_floor_count(),
+        "income_per_day": game.get_total_income_per_day(),
+        "maintenance_per_day": game.calculate_operational_costs(),
+        "pending_income": game.get_pending_income(),
+        "total_earned": int(game.stats.total_earned),
+        "total_spent": int(game.stats.total_spent),
+        "floors_purchased": game.stats.floors_purchased,
+        "managers_hired": game.stats.managers_hired,
+        "upgrades_bought": game.stats.upgrades_bought,
+        "elevator_system_level": game.elevator_system_level,
+        "facade_renovation_level": game.facade_renovation_level,
+        "infrastructure_level": game.infrastructure_level,
+        "wall_time": round(elapsed, 3),
+        "days_per_second": round(days / elapsed) if elapsed > 0 else None,
+    }
+
+
+def format_summary(summary):
+    """Текстовая сводка для консоли"""
+    lines = [
+        f"🏁 Симуляция: {summary['days']} дн., стратегия '{summary['strategy']}', seed={summary['seed']}",
+        f"💰 Деньги: {summary['money']} руб.",
+        f"🏢 Этажи: {summary['floors_owned']}",
+        f"💵 Доход/день: {summary['income_per_day']} руб.",
+        f"💸 Расходы/день: {summary['maintenance_per_day']} руб.",
+        f"📦 Несобрано: {summary['pending_income']} руб.",
+        f"📈 Заработано: {summary['total_earned']} руб., потрачено: {summary['total_spent']} руб.",
+        f"👨‍💼 Менеджеров нанято: {summary['managers_hired']}, улучшений: {summary['upgrades_bought']}",
+        f"⏱️ {summary['wall_time']} с ({summary['days_per_second']} дн./с)",
+    ]
+    return "\n".join(lines)
@@ -0,0 +1,278 @@
+"""Монте-Карло прогон стратегий для балансировки конфигураций.
+
+Запуск из каталога skyscraper_game:
+    python -m sim.monte_carlo --runs 200 --days 1000 --strategy greedy --strategy idle
+    python -m sim.monte_carlo --variant balance/cheap_floors --workers 8
+
+Вариант конфигурации - каталог с любыми из файлов floor_prices.json,
+manager_prices.json и upgrade_costs.json; недостающие файлы берутся
+из базовой конфигурации. Каждая комбинация (вариант, стратегия) идет
+на одних и тех же зернах, поэтому варианты сравниваются на одинаковых
+последовательностях случайных событий.
+
+Конфигурации проверяются и компилируются один раз в главном процессе
+и передаются процессам пула при их запуске, а не с каждым прогоном.
+Результаты пишутся в сжатый JSONL: заголовок, строка на прогон
+(вехи по этажам, кривая денег, окупаемость улучшений) и сводка.
+"""
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from config.config_loader import ConfigError, ConfigLoader
+from config.game_config import GameConfig
+
+from .headless import run_simulation
+from .strategies import STRATEGIES, make_strategy, trial_upgrade_income
+
+BASE_VARIANT = "base"
+DEFAULT_MILESTONES = (10, 25, 50, 75, 100)
+DEFAULT_OUT_DIR = "data/monte_carlo"
+
+# Конфигурации вариантов в процессе пула (заполняются init_worker)
+_worker_configs = {}
+
+
+class RunRecorder:
+    """Наблюдатель прогона: вехи по этажам, кривая денег и окупаемость улучшений"""
+    def __init__(self, config, milestones, sample_every):
+        self.milestones = sorted(milestones)
+        self.sample_every = sample_every
+        self.milestone_days = {}
+        self.first_day = None   # первый день, который увидел наблюдатель (с него идет кривая денег)
+        self.money_curve = []
+        self.upgrades = []
+        self.upgrade_types = list(config.UPGRADE_CONFIG.get("global_upgrades", {}))
+        self.levels = None
+
+    def __call__(self, game):
+        day = game.day
+
+        # Первый день, когда в здании не меньше N этажей
+        owned = game.get_owned_floor_count()
+        for milestone in self.milestones[len(self.milestone_days):]:
+            if owned < milestone:
+                break
+            self.milestone_days[milestone] = day
+
+        # Кривая денег: первый увиденный день и далее каждые sample_every дней
+        if self.first_day is None:
+            self.first_day = day
+        if (day - self.first_day) % self.sample_every == 0:
+            self.money_curve.append(int(game.money))
+
+        levels = [getattr(game, f"{upgrade_type}_level", 0) for upgrade_type in self.upgrade_types]
+        if self.levels is not None and levels != self.levels:
+            for upgrade_type, old_level, level in zip(self.upgrade_types, self.levels, levels):
+                if level > old_level:
+                    self.record_upgrade(game, upgrade_type, old_level, level)
+        self.levels = levels
+
+    def record_upgrade(self, game, upgrade_type, old_level, level):
+        """Прирост дохода от купленных уровней улучшения и их окупаемость"""
+        upgrade_levels = game.config.UPGRADE_CONFIG["global_upgrades"][upgrade_type]["levels"]
+        cost = sum(upgrade_levels[i]["cost"] for i in range(old_level, level))
+        gain = game.get_total_income_per_day() - trial_upgrade_income(game, upgrade_type, old_level)
+        self.upgrades.append({
+            "upgrade": upgrade_type,
+            "level": level,
+            "day": game.day,
+            "cost": cost,
+            "gain_per_day": gain,
+            "payback_days": round(cost / gain, 1) if gain > 0 else None
+        })
+
+    def result(self):
+        return {
+            "milestones": {str(milestone): day for milestone, day in self.milestone_days.items()},
+            "money_curve_start": self.first_day,
+            "money_curve": self.money_curve,
+            "upgrades": self.upgrades
+        }
+
+
+def compile_variants(directories):
+    """Проверенные и скомпилированные конфигурации: имя варианта -> CompiledConfig"""
+    loader = ConfigLoader()
+    variants = {BASE_VARIANT: loader.load()}
+    for directory in directories:
+        name = os.path.basename(os.path.normpath(directory))
+        if name in variants:
+            raise ValueError(f"Повторяющееся имя варианта: {name}")
+        variants[name] = loader.compile_overlay(directory)
+    return variants
+
+
+def init_worker(variants):
+    """Запуск процесса пула: конфигурации приходят один раз на процесс"""
+    for name, compiled in variants.items():
+        _worker_configs[name] = GameConfig(compiled)
+
+
+def run_job(job):
+    """Один прогон в процессе пула"""
+    run, variant, strategy_name, seed, days, milestones, sample_every = job
+    config = _worker_configs[variant]
+    recorder = RunRecorder(config, milestones, sample_every)
+    _, summary = run_simulation(days, make_strategy(strategy_name), seed=seed,
+                                config=config, observer=recorder)
+    result = {"type": "run", "run": run, "variant": variant, "strategy": strategy_name}
+    result.update(summary)
+    result.update(recorder.result())
+    return result
+
+
+def make_jobs(variants, strategies, runs, seed, days, milestones, sample_every):
+    jobs = []
+    for variant in variants:
+        for strategy_name in strategies:
+            for offset in range(runs):
+                jobs.append((len(jobs), variant, strategy_name, seed + offset, days,
+                             tuple(milestones), sample_every))
+    return jobs
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[int((len(values) - 1) * fraction)]
+
+
+def summarize_runs(results, milestones):
+    """Сводка по группам (вариант, стратегия)"""
+    groups = {}
+    for result in results:
+        groups.setdefault((result["variant"], result["strategy"]), []).append(result)
+
+    summary = []
+    for (variant, strategy_name), group in groups.items():
+        money = [result["money"] for result in group]
+        entry = {
+            "variant": variant,
+            "strategy": strategy_name,
+            "runs": len(group),
+            "money_p50": percentile(money, 0.5),
+            "money_mean": round(sum(money) / len(money)),
+            "floors_p50": percentile([result["floors_owned"] for result in group], 0.5),
+            "milestones": {},
+            "upgrades": {}
+        }
+        for milestone in milestones:
+            days = [result["milestones"][str(milestone)] for result in group
+                    if str(milestone) in result["milestones"]]
+            entry["milestones"][str(milestone)] = {
+                "reached": round(len(days) / len(group), 3),
+                "day_p50": percentile(days, 0.5) if days else None,
+                "day_p90": percentile(days, 0.9) if days else None
+            }
+        paybacks = {}
+        for result in group:
+            for upgrade in result["upgrades"]:
+                key = f"{upgrade['upgrade']}:{upgrade['level']}"
+                paybacks.setdefault(key, []).append(upgrade["payback_days"])
+        for key, values in sorted(paybacks.items()):
+            known = [value for value in values if value is not None]
+            entry["upgrades"][key] = {
+                "bought": len(values),
+                "payback_p50": percentile(known, 0.5) if known else None
+            }
+        summary.append(entry)
+    return summary
+
+
+def run_monte_carlo(jobs, variants, workers, out_path, header):
+    """Прогнать задания на пуле процессов и записать результаты, вернуть их"""
+    chunksize = max(1, len(jobs) // (workers * 4))
+    results = []
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    with gzip.open(out_path, 'wt', encoding='utf-8') as f:
+        f.write(json.dumps(header, ensure_ascii=False, separators=(",", ":")) + "\n")
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                                 initargs=(variants,)) as pool:
+            for result in pool.map(run_job, jobs, chunksize=chunksize):
+                f.write(json.dumps(result, ensure_ascii=False, separators=(",", ":")) + "\n")
+                results.append(result)
+                if len(results) % 50 == 0:
+                    print(f"🎲 {len(results)}/{len(jobs)}")
+        summary = summarize_runs(results, header["milestones"])
+        f.write(json.dumps({"type": "summary", "groups": summary},
+                           ensure_ascii=False, separators=(",", ":")) + "\n")
+    return results, summary
+
+
+def format_summary(summary):
+    """Текстовая сводка для консоли"""
+    lines = []
+    for entry in summary:
+        lines.append(f"🏁 {entry['variant']} / {entry['strategy']}: {entry['runs']} прогонов, "
+                     f"деньги p50 {entry['money_p50']} руб., этажей p50 {entry['floors_p50']}")
+        for milestone, data in entry["milestones"].items():
+            if data["day_p50"] is None:
+                lines.append(f"   🏢 {milestone} этажей: не достигнуто")
+            else:
+                lines.append(f"   🏢 {milestone} этажей: день p50 {data['day_p50']}, p90 {data['day_p90']} "
+                             f"(достигнуто в {data['reached']:.0%})")
+        for upgrade, data in entry["upgrades"].items():
+            lines.append(f"   🚀 {upgrade}: куплено {data['bought']}, окупаемость p50 {data['payback_p50']} дн.")
+    return "\n".join(lines)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m sim.monte_carlo",
+                                     description="Монте-Карло прогон стратегий по вариантам конфигурации")
+    parser.add_argument("--runs", type=int, default=100, help="прогонов на пару (вариант, стратегия)")
+    parser.add_argument("--days", type=int, default=1000, help="игровых дней в прогоне")
+    parser.add_argument("--strategy", action="append",
+                        help=f"стратегия: {', '.join(STRATEGIES)} или путь к JSON-сценарию (можно несколько)")
+    parser.add_argument("--variant", action="append", default=[],
+                        help="каталог с вариантом JSON-конфигураций (можно несколько)")
+    parser.add_argument("--seed", type=int, default=0, help="зерно первого прогона")
+    parser.add_argument("--milestone", type=int, action="append",
+                        help="веха по количеству этажей (можно несколько)")
+    parser.add_argument("--sample-every", type=int, default=10, help="шаг кривой денег в днях")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="процессов в пуле")
+    parser.add_argument("--out", help="файл результатов (.jsonl.gz)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    strategies = args.strategy or ["greedy"]
+    milestones = sorted(set(args.milestone or DEFAULT_MILESTONES))
+
+    out_path = args.out
+    if out_path is None:
+        out_path = os.path.join(DEFAULT_OUT_DIR, f"results_{time.strftime('%Y%m%d_%H%M%S')}.jsonl.gz")
+
+    try:
+        variants = compile_variants(args.variant)
+    except ConfigError as e:
+        for error in e.errors:
+            print(f"❌ Ошибка конфигурации: {error}")
+        return 1
+
+    jobs = make_jobs(variants, strategies, args.runs, args.seed, args.days, milestones, args.sample_every)
+    header = {
+        "type": "header",
+        "variants": list(variants),
+        "strategies": strategies,
+        "runs": args.runs,
+        "days": args.days,
+        "seed": args.seed,
+        "milestones": milestones,
+        "sample_every": args.sample_every
+    }
+
+    print(f"🎲 Прогонов: {len(jobs)}, процессов: {args.workers}")
+    started = time.perf_counter()
+    _, summary = run_monte_carlo(jobs, variants, args.workers, out_path, header)
+    print(format_summary(summary))
+    print(f"⏱️ {time.perf_counter() - started:.1f} с, результаты: {out_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
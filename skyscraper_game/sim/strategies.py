@@ -0,0 +1,187 @@
+import json
+
+
+def trial_floor_income(store, index, **columns):
+    """Доход этажа при временно измененных колонках (состояние восстанавливается)"""
+    saved = {name: getattr(store, name)[index] for name in columns}
+    for name, value in columns.items():
+        getattr(store, name)[index] = value
+    income = store.floor_income(index)
+    for name, value in saved.items():
+        getattr(store, name)[index] = value
+    return income
+
+
+def trial_upgrade_income(game, upgrade_type, level):
+    """Чистый доход здания при другом уровне улучшения (состояние игры не меняется).
+
+    На доход этажей влияет только уровень лифтов (Game.sync_upgrades):
+    для него доход считается с вектором бонусов высоты нужного уровня,
+    без сброса кэшированных итогов экономики.
+    """
+    if upgrade_type != "elevator_system" or level == game.elevator_system_level:
+        return game.get_total_income_per_day()
+    store = game.building.store
+    return store.total_income(store.rates.height_bonus(level))
+
+
+class IdleStrategy:
+    """Ничего не покупает, только собирает доход"""
+    name = "idle"
+
+    def act(self, game):
+        collect_all(game)
+
+
+class GreedyStrategy:
+    """Жадная стратегия: каждый раз выбирает действие с самой быстрой окупаемостью.
+
+    Кандидаты: покупка следующего этажа, найм менеджера и улучшение
+    ремонта на купленных этажах, следующий уровень глобальных улучшений. Если лучшее действие пока не по карману,
+    стратегия копит деньги на него.
+    """
+    name = "greedy"
+
+    def __init__(self, max_payback_days=None, max_actions_per_day=50):
+        self.max_payback_days = max_payback_days
+        self.max_actions_per_day = max_actions_per_day
+
+    def act(self, game):
+        collect_all(game)
+        for _ in range(self.max_actions_per_day):
+            best = self.best_action(game)
+            if best is None:
+                return
+            payback, cost, action = best
+            if game.money < cost or not action():
+                return
+
+    def best_action(self, game):
+        """Возвращает (окупаемость в днях, стоимость, действие) или None"""
+        store = game.building.store
+        config = game.config
+        candidates = []
+
+        # Покупка следующего этажа лучшим доступным типом
+        next_floor = next_unowned_floor(store)
+        if next_floor is not None:
+            cost = game.building.get_floor_cost(next_floor + 1)
+            for floor_type, type_data in config.FLOOR_CONFIG["floor_types"].items():
+                if next_floor + 1 < type_data.get("unlock_at_floor", 1):
+                    continue
+                gain = trial_floor_income(store, next_floor, owned=True,
+                                          type_index=store.encode_type(floor_type))
+                candidates.append((cost, gain, lambda n=next_floor + 1, t=floor_type: game.buy_floor(n, t)))
+
+        repair_keys = store.repair_keys
+        for index in store.owned_indices():
+            floor_number = index + 1
+            current = store.floor_income(index)
+            floor = game.building.floors[index]
+
+            # Следующий уровень ремонта
+            repair_index = store.repair_index[index]
+            if repair_index + 1 < len(repair_keys):
+                next_repair = repair_keys[repair_index + 1]
+                cost = floor.calculate_repair_cost(config, next_repair)
+                gain = trial_floor_income(store, index, repair_index=repair_index + 1) - current
+                candidates.append((cost, gain, lambda n=floor_number, r=next_repair: game.repair_floor(n, r)))
+
+            # Лучший менеджер для этажа
+            for manager_id, manager_data in game.get_available_managers(floor_number):
+                if manager_id == floor.manager:
+                    continue
+                gain = trial_floor_income(store, index, manager_index=store.encode_manager(manager_id)) - current
+                candidates.append((manager_data["cost"], gain,
+                                   lambda n=floor_number, m=manager_id: game.hire_manager(n, m)))
+
+        # Следующий уровень глобальных улучшений
+        income = game.get_total_income_per_day()
+        for upgrade_type, upgrade in config.UPGRADE_CONFIG.get("global_upgrades", {}).items():
+            level = getattr(game, f"{upgrade_type}_level", 0)
+            if level >= len(upgrade["levels"]):
+                continue
+            gain = trial_upgrade_income(game, upgrade_type, level + 1) - income
+            candidates.append((upgrade["levels"][level]["cost"], gain,
+                               lambda u=upgrade_type: game.buy_global_upgrade(u)))
+
+        best = None
+        for cost, gain, action in candidates:
+            if gain <= 0:
+                continue
+            payback = cost / gain
+            if self.max_payback_days is not None and payback > self.max_payback_days:
+                continue
+            if best is None or payback < best[0]:
+                best = (payback, cost, action)
+        return best
+
+
+class ScriptedStrategy:
+    """Стратегия по сценарию: список действий с днями выполнения.
+
+    Формат шага: {"day": 3, "action": "buy_floor", "args": [2, "office"]}.
+    Допустимые действия - публичные методы Game (buy_floor, hire_manager,
+    repair_floor, buy_global_upgrade, collect_floor_income).
+    """
+    name = "script"
+    ALLOWED_ACTIONS = ("buy_floor", "hire_manager", "repair_floor",
+                       "buy_global_upgrade", "collect_floor_income")
+
+    def __init__(self, steps, collect=True):
+        self.steps = sorted(steps, key=lambda step: step.get("day", 1))
+        self.position = 0
+        self.collect = collect
+
+    @classmethod
+    def from_file(cls, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            return cls(data.get("steps", []), data.get("collect", True))
+        return cls(data)
+
+    def act(self, game):
+        if self.collect:
+            collect_all(game)
+        while self.position < len(self.steps) and self.steps[self.position].get("day", 1) <= game.day:
+            step = self.steps[self.position]
+            self.position += 1
+            action = step["action"]
+            if action not in self.ALLOWED_ACTIONS:
+                raise ValueError(f"Недопустимое действие в сценарии: {action}")
+            getattr(game, action)(*step.get("args", []))
+
+
+def collect_all(game):
+    """Собрать накопленный доход со всех этажей без авто-сбора"""
+    if game.get_pending_income() <= 0:
+        return
+    store = game.building.store
+    for index in store.owned_indices():
+        if store.income_collected[index] > 0:
+            game.collect_floor_income(index + 1)
+
+
+def next_unowned_floor(store):
+    """Индекс первого некупленного этажа или None"""
+    if store.use_numpy:
+        free = (~store.owned).nonzero()[0]
+        return int(free[0]) if len(free) else None
+    for index, owned in enumerate(store.owned):
+        if not owned:
+            return index
+    return None
+
+
+STRATEGIES = {
+    "idle": IdleStrategy,
+    "greedy": GreedyStrategy,
+}
+
+
+def make_strategy(name):
+    """Создает стратегию по имени или из JSON-сценария (путь к файлу)"""
+    if name in STRATEGIES:
+        return STRATEGIES[name]()
+    return ScriptedStrategy.from_file(name)
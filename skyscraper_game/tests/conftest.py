@@ -0,0 +1,66 @@
+import os
+import sys
+
+import pytest
+
+# Модули игры импортируются как в main.py: из каталога skyscraper_game
+GAME_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if GAME_ROOT not in sys.path:
+    sys.path.insert(0, GAME_ROOT)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path, monkeypatch):
+    """Относительные пути игры (data/...) ведут во временный каталог теста"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def config():
+    from config.game_config import GameConfig
+    return GameConfig()
+
+
+@pytest.fixture(params=["numpy", "list"])
+def backend(request, monkeypatch):
+    """Прогнать тест и с NumPy, и на обычных списках FloorStore"""
+    import core.floor_store as floor_store
+    if request.param == "list":
+        monkeypatch.setattr(floor_store, "np", None)
+    elif floor_store.np is None:
+        pytest.skip("NumPy не установлен")
+    return request.param
+
+
+@pytest.fixture
+def make_game(config):
+    """Фабрика игр для тестов: детерминированные часы и зерно, без сохранений.
+
+    floors первых этажей покупаются сразу (buy_floors_bulk), money -
+    деньги до покупки; остальные аргументы передаются в Game.
+    """
+    from core.clock import ManualClock
+    from core.game import Game
+
+    def make(floors=20, money=10 ** 9, clock=None, seed=1, autosave=False, wall_clock=None):
+        game = Game(config=config, clock=clock or ManualClock(), seed=seed,
+                    autosave=autosave, wall_clock=wall_clock)
+        game.money = money
+        if floors:
+            game.buy_floors_bulk(count=floors)
+        return game
+    return make
+
+
+@pytest.fixture
+def game_state():
+    """Функция, возвращающая сравнимое состояние игры (деньги, день, улучшения, этажи)"""
+    def state(game):
+        floors = [(floor.owned, floor.floor_type, floor.repair_level, floor.manager, floor.income_collected)
+                  for floor in game.building.floors]
+        return (game.money, game.day, game.get_pending_income(),
+                game.elevator_system_level, game.facade_renovation_level, game.infrastructure_level,
+                game.stats.total_earned, game.stats.total_spent, game.stats.floors_purchased,
+                game.modifiers.to_list(), floors, game.building.store.summary())
+    return state
@@ -0,0 +1,24 @@
+import os
+import threading
+
+from config.config_loader import CONFIG_DIR, CompiledConfig, ConfigLoader
+
+
+def test_concurrent_cache_writes_never_tear(tmp_path):
+    cache_path = str(tmp_path / "cache" / "compiled_config.pickle")
+    compiled = ConfigLoader(CONFIG_DIR, cache_path).load()
+
+    def write():
+        loader = ConfigLoader(CONFIG_DIR, cache_path)
+        for _ in range(20):
+            loader.write_cache(compiled)
+
+    threads = [threading.Thread(target=write) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    loader = ConfigLoader(CONFIG_DIR, cache_path)
+    assert isinstance(loader.load_cache(loader.file_stats()), CompiledConfig)
+    assert os.listdir(tmp_path / "cache") == ["compiled_config.pickle"]
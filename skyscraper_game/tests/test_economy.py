@@ -0,0 +1,62 @@
+import random
+
+from core.economy import FloorPriceTable
+
+
+def linear_max_affordable(table, first_floor, money, last_floor):
+    count = 0
+    for floor_number in range(first_floor, last_floor + 1):
+        money -= table.cost(floor_number)
+        if money < 0:
+            break
+        count += 1
+    return count
+
+
+def test_max_affordable_matches_linear_scan(config):
+    table = FloorPriceTable(config.FLOOR_CONFIG)
+    floors = len(table.costs)
+    rng = random.Random(0)
+    for _ in range(2000):
+        first_floor = rng.randint(1, floors)
+        last_floor = rng.randint(first_floor, floors)
+        money = rng.choice([0, table.cost(first_floor) - 1, table.cost(first_floor),
+                            rng.randint(0, table.range_cost(1, floors))])
+        assert (table.max_affordable(first_floor, money, last_floor)
+                == linear_max_affordable(table, first_floor, money, last_floor))
+
+
+def test_range_cost_matches_sum(config):
+    table = FloorPriceTable(config.FLOOR_CONFIG)
+    for first_floor in range(1, len(table.costs) + 1, 7):
+        for last_floor in range(first_floor, len(table.costs) + 1, 11):
+            assert table.range_cost(first_floor, last_floor) == sum(
+                table.cost(n) for n in range(first_floor, last_floor + 1))
+
+
+def test_bulk_buy_matches_buying_one_by_one(make_game, backend):
+    bulk = make_game(floors=0, money=10 ** 7 + 0.5)
+    single = make_game(floors=0, money=10 ** 7 + 0.5)
+    for game in (bulk, single):
+        game.buy_floors_bulk(first_floor=5, count=1)
+        game.buy_floors_bulk(first_floor=9, count=1)
+        # Итоги посчитаны - дальше они обновляются инкрементально
+        game.get_owned_floor_count()
+
+    bought = bulk.buy_floors_bulk(count=30)
+
+    expected = 0
+    for floor_number in range(1, single.building.store.size + 1):
+        if expected == 30:
+            break
+        if single.building.floors[floor_number - 1].owned:
+            continue
+        if not single.buy_floors_bulk(first_floor=floor_number, count=1):
+            break
+        expected += 1
+
+    assert bought == expected
+    assert bulk.money == single.money
+    assert bulk.money % 1 == 0.5
+    assert [floor.owned for floor in bulk.building.floors] == [floor.owned for floor in single.building.floors]
+    assert bulk.totals.verify()
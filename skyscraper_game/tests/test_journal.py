@@ -0,0 +1,47 @@
+import pytest
+
+
+@pytest.fixture
+def journal_config(config, monkeypatch):
+    monkeypatch.setattr(config, "JOURNAL_ENABLED", True, raising=False)
+    monkeypatch.setattr(config, "OFFLINE_PROGRESS", False, raising=False)
+    return config
+
+
+def replayed(make_game):
+    """Новая игра, восстановленная из снимка и журнала, как после аварийного выхода"""
+    game = make_game(floors=0, autosave=True)
+    assert game.save_system.auto_load(game)
+    game.journal.close()
+    return game
+
+
+def play(game):
+    manager = list(game.config.MANAGER_CONFIG["managers"])[0]
+    game.buy_floor(2)
+    game.buy_floors_bulk(count=20)
+    game.hire_manager(2, manager)
+    game.repair_floor(3, "quality")
+    game.buy_global_upgrade("elevator_system")
+    for _ in range(8):
+        game.tick_day()
+    game.collect_floor_income(4)
+    game.advance_days(3)
+
+
+def test_replay_matches_live_game(journal_config, make_game, game_state, backend):
+    game = make_game(floors=0, seed=3, autosave=True)
+    game.random_events.EVENT_CHANCE = 0.5
+    game.autosave()
+    game.save_system.flush(5)
+    play(game)
+    assert game_state(replayed(make_game)) == game_state(game)
+
+    # После компакции состояние собирается из нового снимка и хвоста журнала
+    game.autosave()
+    game.save_system.flush(5)
+    game.buy_floor(30)
+    game.tick_days(12)
+    game.repair_floor(5, "luxury")
+    assert game_state(replayed(make_game)) == game_state(game)
+    game.journal.close()
@@ -0,0 +1,65 @@
+import pytest
+
+from core.modifiers import INCOME, MAINTENANCE, ModifierStack
+
+
+def test_modifiers_expire_in_order():
+    stack = ModifierStack()
+    stack.add(INCOME, 0.5, 0, 5, "a")
+    stack.add(MAINTENANCE, 0.2, 0, 2, "b")
+    stack.add(INCOME, -0.3, 0, 5, "c")
+    stack.add(INCOME, 0.1, 0, 3, "d")
+
+    # Модификатор на duration дней действует на доход дней 1 .. duration
+    assert stack.expire(2) == []
+    assert stack.income_multiplier == pytest.approx(1.3)
+    assert stack.maintenance_multiplier == pytest.approx(1.2)
+    assert stack.days_active(2, 10) == 1
+
+    assert [modifier.name for modifier in stack.expire(4)] == ["b", "d"]
+    assert stack.maintenance_multiplier == 1.0
+    assert stack.income_multiplier == pytest.approx(1.2)
+    assert stack.days_active(4, 10) == 2
+
+    # Одинаковый день окончания - в порядке добавления, сумма сбрасывается точно
+    assert [modifier.name for modifier in stack.expire(6)] == ["a", "c"]
+    assert stack.income_multiplier == 1.0
+    assert len(stack) == 0
+    assert stack.days_active(6, 10) == 10
+
+
+def test_multiplier_is_not_negative():
+    stack = ModifierStack()
+    stack.add(INCOME, -1.5, 0, 3)
+    assert stack.income_multiplier == 0.0
+
+
+def test_restore_keeps_order_and_sums():
+    stack = ModifierStack()
+    for day, (kind, value, duration) in enumerate([(INCOME, 0.4, 9), (MAINTENANCE, 0.1, 2), (INCOME, -0.2, 4)]):
+        stack.add(kind, value, day, duration, f"m{day}")
+
+    restored = ModifierStack()
+    restored.restore(stack.to_list())
+    assert restored.to_list() == stack.to_list()
+    assert restored.income_multiplier == stack.income_multiplier
+    assert restored.maintenance_multiplier == stack.maintenance_multiplier
+    assert [modifier.name for modifier in restored.expire(6)] == [modifier.name for modifier in stack.expire(6)]
+
+
+def make_modified_game(make_game):
+    game = make_game(floors=30)
+    for floor_number in range(2, 12):
+        game.hire_manager(floor_number, list(game.config.MANAGER_CONFIG["managers"])[-1])
+    game.add_modifier(INCOME, 0.5, 3, "boom")
+    game.add_modifier(MAINTENANCE, 0.25, 7, "utility")
+    game.add_modifier(INCOME, -0.2, 7, "crisis")
+    return game
+
+
+def test_accrue_days_matches_single_days(make_game, game_state, backend):
+    batched = make_modified_game(make_game)
+    daily = make_modified_game(make_game)
+    assert batched.accrue_days(12) == tuple(map(sum, zip(*(daily.accrue_days(1) for _ in range(12)))))
+    assert game_state(batched) == game_state(daily)
+    assert len(batched.modifiers) == 0
@@ -0,0 +1,18 @@
+from sim.headless import run_simulation
+from sim.monte_carlo import RunRecorder
+from sim.strategies import make_strategy
+
+
+def test_money_curve_starts_at_first_observed_day(config):
+    recorder = RunRecorder(config, milestones=(5,), sample_every=10)
+    money_by_day = {}
+
+    def observer(game):
+        money_by_day[game.day] = int(game.money)
+        recorder(game)
+
+    run_simulation(35, make_strategy("greedy"), seed=1, config=config, observer=observer)
+    first_day = min(money_by_day)
+    result = recorder.result()
+    assert result["money_curve_start"] == first_day
+    assert result["money_curve"] == [money_by_day[day] for day in range(first_day, first_day + 35, 10)]
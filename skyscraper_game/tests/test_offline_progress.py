@@ -0,0 +1,50 @@
+from core.clock import ManualClock
+from core.save_system import SaveSystem
+
+
+def test_offline_time_comes_from_wall_clock(make_game, tmp_path):
+    saves = SaveSystem(str(tmp_path / "saves"), save_format="json")
+    wall_clock = ManualClock(1000.0)
+    game = make_game(clock=ManualClock(1000.0), wall_clock=wall_clock)
+    # Цикл игры отбросил 500 секунд (сон системы): часы симуляции отстали
+    game.clock.advance(20.0)
+    wall_clock.advance(520.0)
+    assert saves.save_game(game, "autosave.json")
+
+    # Новый запуск заново выставляет часы симуляции по реальному времени.
+    # Игру закрыли на 52 секунды: при DAY_DURATION = 5 это 10 дней
+    restored = make_game(floors=0, clock=ManualClock(1572.0), wall_clock=ManualClock(1572.0))
+    restored.save_system = saves
+    assert saves.auto_load(restored)
+    assert restored.offline_days == 10
+    assert restored.day == game.day + 10
+
+    reference = make_game()
+    assert restored.offline_income == reference.advance_days(10)
+
+
+def test_offline_days_are_event_free(make_game):
+    game = make_game()
+    game.random_events.EVENT_CHANCE = 1.0
+    state = game.rng.getstate()
+    game.advance_days(30)
+    assert len(game.modifiers) == 0
+    assert game.rng.getstate() == state
+
+
+def test_journal_offline_time_comes_from_wall_clock(config, make_game, monkeypatch):
+    monkeypatch.setattr(config, "JOURNAL_ENABLED", True, raising=False)
+    wall_clock = ManualClock(1000.0)
+    game = make_game(floors=0, clock=ManualClock(1000.0), autosave=True, wall_clock=wall_clock)
+    game.autosave()
+    game.save_system.flush(5)
+    wall_clock.advance(300.0)
+    game.buy_floors_bulk(count=20)
+    game.journal.close()
+
+    # Отсчет идет от последней записи журнала по реальному времени
+    restored = make_game(floors=0, clock=ManualClock(1352.0), autosave=True, wall_clock=ManualClock(1352.0))
+    assert restored.save_system.auto_load(restored)
+    restored.journal.close()
+    assert restored.offline_days == 10
+    assert restored.get_owned_floor_count() == game.get_owned_floor_count()
@@ -0,0 +1,51 @@
+import itertools
+
+REPAIR_MAINTENANCE = {"quality": 1.2, "luxury": 1.5}
+
+
+def reference_income(config, floor_type, repair_level, manager, floor_index, elevator_level):
+    """Доход и расходы этажа по формуле до компиляции таблицы ставок"""
+    type_config = config.FLOOR_CONFIG["floor_types"][floor_type]
+    repair_config = config.FLOOR_CONFIG["repair_levels"][repair_level]
+    manager_config = config.MANAGER_CONFIG["managers"].get(manager, {}) if manager else {}
+
+    height_bonus = 1.0
+    if elevator_level > 0 and floor_index >= 10:
+        height_bonus = 1.0 + min(0.5, (floor_index + 1 - 10) * 0.02 * elevator_level)
+    gross_income = int(type_config["base_income"] * repair_config["income_multiplier"]
+                       * (1.0 + manager_config.get("income_bonus", 0)) * height_bonus)
+    maintenance = int(type_config["maintenance_cost"]
+                      * (1.0 - manager_config.get("maintenance_reduction", 0))
+                      * REPAIR_MAINTENANCE.get(repair_level, 1.0))
+    return gross_income, maintenance, max(0, gross_income - maintenance)
+
+
+def test_rate_table_matches_per_floor_formula(config, make_game, backend):
+    game = make_game(floors=0)
+    store = game.building.store
+    floor_types = list(config.FLOOR_CONFIG["floor_types"])
+    repair_levels = list(config.FLOOR_CONFIG["repair_levels"])
+    managers = [None] + list(config.MANAGER_CONFIG["managers"])
+    combos = list(itertools.product(floor_types, repair_levels, managers))
+
+    # Каждому этажу - своя комбинация, чтобы покрыть и бонус высоты
+    floors = game.building.floors
+    for index in range(store.size):
+        floor_type, repair_level, manager = combos[index % len(combos)]
+        floors[index].owned = True
+        floors[index].floor_type = floor_type
+        floors[index].repair_level = repair_level
+        floors[index].manager = manager
+
+    for elevator_level in range(4):
+        game.elevator_system_level = elevator_level
+        game.sync_upgrades()
+        expected_total = [0, 0, 0]
+        for index in range(store.size):
+            floor_type, repair_level, manager = combos[index % len(combos)]
+            expected = reference_income(config, floor_type, repair_level, manager, index, elevator_level)
+            actual = (store.floor_gross_income(index), store.floor_maintenance(index), store.floor_income(index))
+            assert actual == expected, (index, elevator_level)
+            for position, value in enumerate(expected):
+                expected_total[position] += value
+        assert store.summary()[:3] == tuple(expected_total)
@@ -0,0 +1,35 @@
+import os
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+pygame = pytest.importorskip("pygame")
+
+import ui.render_cache as render_cache
+from ui.render_cache import GradientCache
+
+
+def pixels(surface):
+    return pygame.image.tostring(surface, "RGB")
+
+
+@pytest.mark.parametrize("vertical", [True, False])
+@pytest.mark.parametrize("size", [(120, 80), (1, 37), (64, 1)])
+def test_gradient_matches_line_drawing(monkeypatch, size, vertical):
+    if render_cache.np is None:
+        pytest.skip("NumPy не установлен")
+    start, end = (240, 245, 255), (13, 130, 7)
+    built = GradientCache.build(size, start, end, vertical)
+
+    # Эталон - построчная отрисовка без NumPy
+    monkeypatch.setattr(render_cache, "np", None)
+    reference = GradientCache.build(size, start, end, vertical)
+    assert pixels(built) == pixels(reference)
+
+
+def test_gradient_cache_reuses_surface():
+    cache = GradientCache()
+    surface = cache.get((50, 20), (10, 20, 30, 128), (200, 100, 0))
+    # Прозрачность цвета градиент не меняет, ключ по RGB
+    assert cache.get((50, 20), (10, 20, 30), (200, 100, 0)) is surface
+    assert cache.get((50, 20), (10, 20, 30), (200, 100, 0), vertical=False) is not surface
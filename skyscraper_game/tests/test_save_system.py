@@ -0,0 +1,78 @@
+import os
+import random
+import threading
+
+import pytest
+
+from core.save_system import SaveSystem
+
+
+def make_varied_game(config, make_game):
+    game = make_game(floors=0, money=10 ** 12, seed=3)
+    rng = random.Random(7)
+    managers = list(config.MANAGER_CONFIG["managers"])
+    floor_types = list(config.FLOOR_CONFIG["floor_types"])
+    repair_levels = list(config.FLOOR_CONFIG["repair_levels"])
+    for floor_number in rng.sample(range(2, 101), 60):
+        game.buy_floor(floor_number, rng.choice(floor_types))
+        if rng.random() < 0.5:
+            game.hire_manager(floor_number, rng.choice(managers))
+        if rng.random() < 0.5:
+            game.repair_floor(floor_number, rng.choice(repair_levels))
+    for upgrade_type in ("elevator_system", "elevator_system", "facade_renovation"):
+        assert game.buy_global_upgrade(upgrade_type)
+    game.advance_days(3)
+    game.add_modifier("maintenance", 0.3, 4, "test")
+    return game
+
+
+@pytest.mark.parametrize("save_format, compress", [("binary", True), ("binary", False), ("json", True)])
+def test_save_round_trip(config, make_game, game_state, tmp_path, backend, save_format, compress):
+    saves = SaveSystem(str(tmp_path / "saves"), save_format=save_format, compress=compress)
+    game = make_varied_game(config, make_game)
+    filename = saves.filename_for("round_trip")
+    assert saves.save_game(game, filename)
+
+    loaded = make_game(floors=0)
+    assert saves.load_game(loaded, filename)
+    assert game_state(loaded) == game_state(game)
+    assert loaded.get_total_income_per_day() == game.get_total_income_per_day()
+
+
+def test_concurrent_atomic_writes_never_tear(tmp_path):
+    path = str(tmp_path / "autosave.sky")
+    payloads = [bytes([n]) * 200000 for n in range(8)]
+
+    def write(data):
+        for _ in range(5):
+            SaveSystem.write_atomic(path, data)
+
+    threads = [threading.Thread(target=write, args=(data,)) for data in payloads]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    with open(path, 'rb') as f:
+        assert f.read() in payloads
+    assert os.listdir(tmp_path) == ["autosave.sky"]
+
+
+def test_save_on_exit_reports_autosave_result(make_game, monkeypatch):
+    game = make_game(autosave=True)
+    saves = game.save_system
+    write_state = saves.write_state
+    autosave = saves.autosave_filename()
+
+    # Запись авто-сохранения падает, ручное сохранение в другой слот проходит
+    def failing_autosave(header, records, filename):
+        return filename != autosave and write_state(header, records, filename)
+
+    monkeypatch.setattr(saves, "write_state", failing_autosave)
+    saves.save_game_async(game, saves.filename_for("manual"))
+    assert not game.save_on_exit()
+    assert saves.background_result(saves.filename_for("manual")) is True
+    assert saves.background_result(autosave) is False
+
+    monkeypatch.setattr(saves, "write_state", write_state)
+    assert game.save_on_exit()
@@ -0,0 +1,20 @@
+from sim.strategies import trial_upgrade_income
+
+
+def test_trial_upgrade_income_matches_bought_level(config, make_game, backend):
+    game = make_game(floors=60)
+    game.add_modifier("income", 0.3, 5)
+    totals_before = game.get_total_income_per_day()
+    version = game.building.store.version
+
+    levels = config.UPGRADE_CONFIG["global_upgrades"]["elevator_system"]["levels"]
+    trials = [trial_upgrade_income(game, "elevator_system", level) for level in range(1, len(levels) + 1)]
+    assert trial_upgrade_income(game, "facade_renovation", 1) == totals_before
+    # Пробный расчет не трогает хранилище и кэшированные итоги
+    assert game.building.store.version == version
+    assert not game.totals.dirty
+
+    for level, income in enumerate(trials, start=1):
+        assert game.buy_global_upgrade("elevator_system")
+        assert game.elevator_system_level == level
+        assert game.get_total_income_per_day() == income
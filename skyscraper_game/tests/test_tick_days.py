@@ -0,0 +1,34 @@
+import pytest
+
+from core.clock import ManualClock
+
+
+@pytest.mark.parametrize("event_chance", [0.1, 0.6, 1.0])
+def test_tick_days_matches_single_days(make_game, game_state, backend, event_chance):
+    single = make_game(floors=40)
+    batched = make_game(floors=40)
+    for game in (single, batched):
+        game.hire_manager(3, list(game.config.MANAGER_CONFIG["managers"])[0])
+        game.random_events.EVENT_CHANCE = event_chance
+
+    for _ in range(500):
+        single.tick_day()
+    batched.tick_days(500)
+    assert game_state(batched) == game_state(single)
+    assert single.rng.getstate() == batched.rng.getstate()
+
+
+def test_update_processes_all_days_at_high_speed(config, make_game, game_state):
+    clock = ManualClock()
+    game = make_game(floors=40, clock=clock)
+    reference = make_game(floors=40)
+    # Длина дня и шаг часов - двоичные дроби, поэтому время считается точно
+    game.game_speed = config.DAY_DURATION * 64
+    for _ in range(640):
+        clock.advance(1 / 64)
+        game.update()
+
+    # 10 секунд при 64 днях в секунду; дни не теряются между кадрами
+    assert game.day - reference.day == 640
+    reference.tick_days(640)
+    assert game_state(game) == game_state(reference)
@@ -0,0 +1,130 @@
+import math
+import pygame
+from .render_cache import LRUCache, text_cache
+
+# Иконки типов этажей
+FLOOR_TYPE_ICONS = {
+    "office": "💼",
+    "commercial": "🛍️",
+    "residential": "🏠",
+    "premium": "⭐"
+}
+
+
+class FloorListView:
+    """Виртуализированный список этажей.
+
+    Рисуются только этажи, попадающие в окно прокрутки, со сдвигом
+    на любое число пикселей. Карточка каждого этажа рисуется один раз
+    в отдельную поверхность и перерисовывается, только когда меняется
+    то, что на ней изображено. Мигающий накопленный доход рисуется
+    поверх готовой карточки.
+    """
+    def __init__(self, window, card_width, card_height=35, row_height=30, max_cached_cards=256):
+        self.window = window
+        self.game = window.game
+        self.card_width = card_width
+        self.card_height = card_height
+        self.row_height = row_height
+        self.cards = LRUCache(max_cached_cards)  # индекс этажа -> (ключ содержимого, поверхность)
+        self.cards_built = 0
+
+    def total_height(self):
+        """Высота всего списка в пикселях"""
+        return self.game.building.store.size * self.row_height
+
+    def visible_range(self, scroll_offset, viewport_height, margin=0):
+        """Индексы первого и следующего за последним видимого этажа.
+
+        margin - сколько пикселей над первой строкой еще видно (там может
+        выглядывать низ карточки предыдущего этажа).
+        """
+        size = self.game.building.store.size
+        start_index = min(size, max(0, scroll_offset - margin) // self.row_height)
+        end_index = min(size, (scroll_offset + viewport_height - 1) // self.row_height + 1)
+        return start_index, end_index
+
+    def floor_at(self, y, top, scroll_offset):
+        """Индекс этажа под точкой y (None, если этажа нет)"""
+        if y < top:
+            return None
+        index = (y - top + scroll_offset) // self.row_height
+        if 0 <= index < self.game.building.store.size:
+            return index
+        return None
+
+    def card_key(self, index):
+        """Все, что изображено на карточке этажа (кроме мигающего дохода)"""
+        store = self.game.building.store
+        return (bool(store.owned[index]), int(store.type_index[index]),
+                int(store.manager_index[index]) != 0)
+
+    def get_card(self, index):
+        """Карточка этажа из кэша (перерисовывается при изменении этажа)"""
+        key = self.card_key(index)
+        cached = self.cards.get(index)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        card = self.build_card(index, key)
+        self.cards.put(index, (key, card))
+        return card
+
+    def build_card(self, index, key):
+        """Рисует карточку этажа в отдельную поверхность"""
+        owned, type_index, has_manager = key
+        window = self.window
+        colors = window.colors
+        font = window.small_font
+        card = pygame.Surface((self.card_width, self.card_height))
+        rect = card.get_rect()
+
+        window.visual_effects.draw_floor_card(card, rect, {'owned': owned}, colors)
+
+        text_y = rect.centery - font.get_height()//2
+
+        # Номер этажа
+        text_cache.draw_value(card, (rect.x + 10, text_y), font, f"{index + 1}", colors['text'])
+
+        if owned:
+            # Тип этажа с иконкой
+            floor_type = self.game.building.store.type_keys[type_index]
+            icon = FLOOR_TYPE_ICONS.get(floor_type, "🏢")
+            type_text = text_cache.render(font, f"{icon} {floor_type}", colors['text_secondary'])
+            card.blit(type_text, (rect.x + 40, rect.centery - type_text.get_height()//2))
+
+            # Менеджер
+            if has_manager:
+                manager_text = text_cache.render(font, "👨‍💼", colors['manager_indicator'])
+                card.blit(manager_text, (rect.right - 50, rect.centery - manager_text.get_height()//2))
+        else:
+            # Стоимость этажа
+            cost_text = f"{self.game.building.get_floor_cost(index + 1)} руб."
+            cost_width = text_cache.value_width(font, cost_text, colors['text_secondary'])
+            text_cache.draw_value(card, (rect.centerx - cost_width//2, text_y), font, cost_text, colors['text_secondary'])
+
+        self.cards_built += 1
+        return card
+
+    def render(self, surface, x, top, viewport, scroll_offset):
+        """Рисует видимые этажи; viewport - область списка (для отсечения)"""
+        store = self.game.building.store
+        margin = (top - viewport.top) + (self.card_height - self.row_height)
+        start_index, end_index = self.visible_range(scroll_offset, viewport.bottom - top, margin)
+        income_alpha = None
+        font = self.window.small_font
+        income_color = self.window.colors['success']
+
+        previous_clip = surface.get_clip()
+        surface.set_clip(viewport.clip(previous_clip))
+        for index in range(start_index, end_index):
+            y = top + index * self.row_height - scroll_offset
+            surface.blit(self.get_card(index), (x, y))
+
+            # Накопленный доход с анимацией
+            income = int(store.income_collected[index])
+            if store.owned[index] and income > 0:
+                if income_alpha is None:
+                    income_alpha = int(150 + 105 * math.sin(pygame.time.get_ticks() * 0.01))
+                text_cache.draw_value(surface, (x + self.card_width - 100, y + self.card_height//2 - font.get_height()//2),
+                                      font, f"+{income}", income_color, income_alpha)
+        surface.set_clip(previous_clip)
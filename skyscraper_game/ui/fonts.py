@@ -0,0 +1,42 @@
+import threading
+
+import pygame
+
+# Группы шрифтов: (атрибут, файл, размер, жирный для системной замены)
+WINDOW_FONTS = (
+    ("title_font", 'assets/fonts/title.ttf', 36, True),
+    ("font", 'assets/fonts/main.ttf', 22, False),
+    ("small_font", 'assets/fonts/main.ttf', 16, False),
+)
+PANEL_FONTS = (
+    ("title_font", 'assets/fonts/main.ttf', 20, True),
+    ("font", 'assets/fonts/main.ttf', 16, False),
+    ("small_font", 'assets/fonts/main.ttf', 14, False),
+)
+
+_loaded = {}
+_lock = threading.Lock()
+
+
+def load_font_set(specs):
+    """Шрифты группы по имени атрибута (загружаются один раз).
+
+    Шрифты берутся из assets; если какого-то файла нет, вся группа
+    заменяется системным Arial. Поиск системных шрифтов медленный,
+    поэтому при запуске группы загружаются заранее в фоновом потоке.
+    """
+    with _lock:
+        fonts = _loaded.get(specs)
+        if fonts is None:
+            try:
+                fonts = {name: pygame.font.Font(path, size) for name, path, size, _ in specs}
+            except (OSError, pygame.error):
+                fonts = {name: pygame.font.SysFont('Arial', size, bold=bold) for name, _, size, bold in specs}
+            _loaded[specs] = fonts
+        return fonts
+
+
+def preload_fonts():
+    """Загрузить все группы шрифтов интерфейса"""
+    load_font_set(WINDOW_FONTS)
+    load_font_set(PANEL_FONTS)
@@ -4,45 +4,42 @@ import math
 from config.game_config import GameConfig
 from .upgrades_panel import UpgradesPanel
 from .ui_components import Button, UIManager
+from .render_layers import LayeredRenderer
+from .render_cache import GradientCache, panel_cache, text_cache
+from .floor_panel import FloorListView
+from .particles import ParticleSystem
+from .panel_layout import PanelLayout
+from .profiler import FrameProfiler
+from .fonts import WINDOW_FONTS, load_font_set
 
 class VisualEffects:
     """Класс для визуальных эффектов и анимаций"""
+    # Готовые градиенты (шапка, панели, карточки этажей, бегунок прокрутки)
+    gradients = GradientCache(max_entries=64)
+
     @staticmethod
     def draw_gradient_rect(surface, rect, start_color, end_color, vertical=True):
-        """Рисует градиентный прямоугольник"""
-        if vertical:
-            for y in range(rect.height):
-                ratio = y / rect.height
-                color = [
-                    start_color[i] + (end_color[i] - start_color[i]) * ratio
-                    for i in range(3)
-                ]
-                pygame.draw.line(surface, color, 
-                               (rect.x, rect.y + y), 
-                               (rect.x + rect.width, rect.y + y))
-        else:
-            for x in range(rect.width):
-                ratio = x / rect.width
-                color = [
-                    start_color[i] + (end_color[i] - start_color[i]) * ratio
-                    for i in range(3)
-                ]
-                pygame.draw.line(surface, color,
-                               (rect.x + x, rect.y),
-                               (rect.x + x, rect.y + rect.height))
+        """Рисует градиентный прямоугольник (из кэша градиентов)"""
+        rect = pygame.Rect(rect)
+        if rect.width <= 0 or rect.height <= 0:
+            return
+        gradient = VisualEffects.gradients.get(rect.size, start_color, end_color, vertical)
+        surface.blit(gradient, rect.topleft)
 
     @staticmethod
-    def draw_glass_effect(surface, rect, color, alpha=128):
-        """Рисует стеклянный эффект"""
-        glass_surface = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(glass_surface, (*color, alpha), 
-                        (0, 0, rect.width, rect.height), 
-                        border_radius=12)
-        # Добавляем блик
-        pygame.draw.rect(glass_surface, (255, 255, 255, 60),
-                        (0, 0, rect.width, rect.height//3),
-                        border_radius=12)
+    def draw_glass_effect(surface, rect, color, alpha=128, fade=None):
+        """Рисует стеклянный эффект (готовая панель из кэша, блик - верхняя треть).
+
+        fade (0-255) - общая прозрачность при появлении/исчезновении; она
+        применяется при блите и не входит в ключ кэша панелей.
+        """
+        glass_surface = panel_cache.get((rect.width, rect.height), color, alpha, 60, 3)
+        if fade is None or fade >= 255:
+            surface.blit(glass_surface, (rect.x, rect.y))
+            return
+        glass_surface.set_alpha(fade)
         surface.blit(glass_surface, (rect.x, rect.y))
+        glass_surface.set_alpha(255)
 
     @staticmethod
     def draw_modern_button(surface, rect, text, font, colors, hover=False, disabled=False):
@@ -70,10 +67,11 @@ class VisualEffects:
         highlight_rect = pygame.Rect(rect.x, rect.y, rect.width, rect.height//3)
         pygame.draw.rect(surface, (255, 255, 255, 60), highlight_rect, border_radius=8)
         
-        # Текст
-        text_surf = font.render(text, True, text_color)
-        text_rect = text_surf.get_rect(center=rect.center)
-        surface.blit(text_surf, text_rect)
+        # Текст (числа в подписи - из атласа глифов)
+        text_width = text_cache.value_width(font, text, text_color)
+        text_height = font.get_height()
+        text_cache.draw_value(surface, (rect.centerx - text_width // 2, rect.centery - text_height // 2),
+                              font, text, text_color)
         
         return rect
 
@@ -101,62 +99,23 @@ class VisualEffects:
         return rect
     
 
-class ParticleSystem:
-    """Система частиц для визуальных эффектов"""
-    def __init__(self):
-        self.particles = []
-    
-    def add_money_particles(self, pos, amount):
-        """Добавляет частицы денег"""
-        for i in range(10):
-            self.particles.append({
-                'pos': [pos[0], pos[1]],
-                'velocity': [pygame.time.get_ticks() % 5 - 2.5, -2 - (pygame.time.get_ticks() % 3)],
-                'color': (255, 215, 0),
-                'size': 3 + (pygame.time.get_ticks() % 4),
-                'life': 60 + (pygame.time.get_ticks() % 40)
-            })
-    
-    def update(self):
-        """Обновляет частицы"""
-        for particle in self.particles[:]:
-            particle['pos'][0] += particle['velocity'][0]
-            particle['pos'][1] += particle['velocity'][1]
-            particle['life'] -= 1
-            particle['velocity'][1] += 0.1  # гравитация
-            
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
-    
-    def draw(self, surface):
-        """Рисует частицы"""
-        for particle in self.particles:
-            alpha = min(255, particle['life'] * 4)
-            color = (*particle['color'], alpha)
-            pos = (int(particle['pos'][0]), int(particle['pos'][1]))
-            pygame.draw.circle(surface, color, pos, particle['size'])
-
-
 class GameWindow:
     def __init__(self, game):
         self.game = game
         self.config = game.config
         self.screen = pygame.display.set_mode((self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT))
         pygame.display.set_caption("🏢 Небоскрёб Мечты")
+        # Поверхность, на которой рисуют render_* (кэш текущего слоя)
+        self.canvas = self.screen
         
         # Менеджер UI для централизованной обработки событий
         self.ui_manager = UIManager()
 
         # Шрифты
-        try:
-            self.title_font = pygame.font.Font('assets/fonts/title.ttf', 36)
-            self.font = pygame.font.Font('assets/fonts/main.ttf', 22)
-            self.small_font = pygame.font.Font('assets/fonts/main.ttf', 16)
-        except:
-            # Fallback на системные шрифты
-            self.title_font = pygame.font.SysFont('Arial', 36, bold=True)
-            self.font = pygame.font.SysFont('Arial', 22)
-            self.small_font = pygame.font.SysFont('Arial', 16)
+        fonts = load_font_set(WINDOW_FONTS)
+        self.title_font = fonts['title_font']
+        self.font = fonts['font']
+        self.small_font = fonts['small_font']
 
         # Визуальные эффекты
         self.particles = ParticleSystem()
@@ -171,6 +130,7 @@ class GameWindow:
         self.max_visible_floors = 20
         self.floor_height = 30
         self.scroll_sensitivity = 15
+        self.floors_top = 150  # y первого этажа при нулевой прокрутке
         
         # Премиум цветовая схема
         self.colors = {
@@ -198,15 +158,21 @@ class GameWindow:
         self.building_width = 300
         self.info_panel_width = 400
         
+        # Виртуализированный список этажей с кэшем карточек
+        self.floor_list = FloorListView(self, self.building_width - 70, 35, self.floor_height)
+        
         # Состояние UI
         self.message_queue = []
         self.current_message = None
         self.message_timer = 0
         self.last_click_time = 0
-        self.clock = pygame.time.Clock()
         
-        # Кэш для оптимизации
-        self.text_cache = {}
+        # Общий кэш текста (ui/render_cache.py)
+        self.text_cache = text_cache
+
+        # Раскладка кнопок информационной панели (перестраивается при изменении состояния)
+        self.info_layout = None
+        self.info_layout_key = None
 
         # Фоновые текстуры
         self.background_pattern = self.create_background_pattern()
@@ -224,6 +190,13 @@ class GameWindow:
         # Инициализация UI компонентов
         self.setup_ui_components()
 
+        # Профилировщик этапов кадра
+        self.profiler = FrameProfiler(self.config.PROFILER_FRAMES, self.config.PROFILER_ENABLED)
+
+        # Слои кадра: перерисовываются только при изменении своих данных
+        self.renderer = LayeredRenderer(self.screen, self.profiler)
+        self.setup_render_layers()
+
     def setup_ui_components(self):
         """Инициализация UI компонентов"""
         # Кнопка сохранения
@@ -241,6 +214,78 @@ class GameWindow:
         )
         self.ui_manager.add_component(save_button)
 
+    def setup_render_layers(self):
+        """Слои интерфейса снизу вверх"""
+        width, height = self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT
+        self.renderer.add_layer("background", (0, 0, width, height),
+                                self.layer_draw(self.render_background))
+        self.renderer.add_layer("building", (0, 80, self.building_width, height - 80),
+                                self.profiled("building", self.layer_draw(self.render_building)),
+                                self.building_signature)
+        self.renderer.add_layer("info_panel", (self.building_width, 80, self.info_panel_width, height - 80),
+                                self.profiled("info_panel", self.layer_draw(self.render_info_panel)),
+                                self.info_panel_signature)
+        # Карточки улучшений выходят за нижний край панели - слой до низа экрана
+        upgrades_rect = self.upgrades_panel.rect
+        self.renderer.add_layer("upgrades", (upgrades_rect.x, upgrades_rect.y, upgrades_rect.width, height - upgrades_rect.y),
+                                self.profiled("upgrades", self.upgrades_panel.render), self.upgrades_signature)
+        self.renderer.add_layer("top_panel", (0, 0, width, 88),
+                                self.profiled("top_panel", self.layer_draw(self.render_top_layer)),
+                                self.top_panel_signature)
+
+    def layer_draw(self, render):
+        """Обертка: render_* рисует на поверхность слоя через self.canvas"""
+        def draw(surface):
+            self.canvas = surface
+            try:
+                render()
+            finally:
+                self.canvas = self.screen
+        return draw
+
+    def profiled(self, stage, draw):
+        """Обертка: время отрисовки слоя идет в этап stage профилировщика"""
+        def measured(surface):
+            return self.profiler.measure(stage, draw, surface)
+        return measured
+
+    def hovered_info_button(self):
+        """Кнопка панели этажа под мышью (действие и аргумент) - для подписи слоя.
+
+        В подпись идет кнопка, а не координаты мыши, поэтому движение
+        мыши внутри панели не перерисовывает слой.
+        """
+        button = self.get_info_layout().hit(pygame.mouse.get_pos())
+        if button is None or button.disabled:
+            return None
+        return (button.action, button.arg)
+
+    def building_signature(self):
+        store = self.game.building.store
+        start_index, end_index = self.floor_list.visible_range(
+            self.scroll_offset, self.config.SCREEN_HEIGHT - 20 - self.floors_top)
+        # Накопленный доход на видимых этажах мигает - тогда слой обновляется 20 раз в секунду
+        has_income = any(store.owned[i] and store.income_collected[i] > 0 for i in range(start_index, end_index))
+        pulse = pygame.time.get_ticks() // 50 if has_income else None
+        return (store.version, self.scroll_offset, self.game.selected_floor, pulse)
+
+    def info_panel_signature(self):
+        # Без выбранного этажа анимируется стрелка
+        arrow = None if self.game.selected_floor else pygame.time.get_ticks() // 33
+        return (self.game.building.store.version, self.game.selected_floor, int(self.game.money),
+                self.hovered_info_button(), arrow)
+
+    def upgrades_signature(self):
+        return (int(self.game.money), self.game.elevator_system_level,
+                self.game.facade_renovation_level, self.game.infrastructure_level,
+                self.upgrades_panel.button_at(pygame.mouse.get_pos()))
+
+    def top_panel_signature(self):
+        buttons = tuple((getattr(c, 'hovered', False), getattr(c, 'pressed', False), c.visible, c.enabled)
+                        for c in self.ui_manager.components)
+        return (int(self.game.money), self.game.day, self.game.get_total_income_per_day(),
+                self.game.calculate_operational_costs(), self.game.get_owned_floor_count(), buttons)
+
     def create_background_pattern(self):
         """Создает фоновый узор"""
         pattern = pygame.Surface((100, 100), pygame.SRCALPHA)
@@ -280,17 +325,20 @@ class GameWindow:
     
     def get_text_surface(self, text, font, color):
         """Кэширование поверхностей текста для оптимизации"""
-        key = f"{text}_{font}_{color}"
-        if key not in self.text_cache:
-            self.text_cache[key] = font.render(text, True, color)
-        return self.text_cache[key]
+        return self.text_cache.render(font, text, color)
     
     def handle_events(self):
         """Обработка событий через UI менеджер"""
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
+                self.dump_profile()
                 self.game.save_on_exit()
                 return False
+            
+            # Профилировщик кадра
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.profiler.toggle()
+                continue
                 
             # Обрабатываем события через UI менеджер
             if self.ui_manager.handle_event(event):
@@ -305,6 +353,19 @@ class GameWindow:
                     
         return True
     
+    def on_config_reloaded(self):
+        """Конфигурация игры заменена: сбросить все, что построено по старой"""
+        self.floor_list.cards.clear()
+        self.info_layout_key = None
+        self.renderer.invalidate()
+        self.show_message("⚙️ Конфигурация обновлена", self.colors['success'])
+
+    def dump_profile(self):
+        """Сохранить замеры профилировщика (если он что-то записал)"""
+        paths = self.profiler.dump(self.config.PROFILER_DUMP_DIR)
+        if paths:
+            print(f"⏱️ Профиль кадра сохранен: {paths[0]}, {paths[1]}")
+
     def handle_special_click(self, pos):
         """Обработка кликов не связанных с UI компонентами"""
         x, y = pos
@@ -321,16 +382,9 @@ class GameWindow:
     
     def handle_building_click(self, x, y):
         """Обработка кликов по зданию"""
-        start_y = 150
-        floor_height = 30
-        
-        if y >= start_y:
-            start_index = self.scroll_offset // self.floor_height
-            relative_y = y - start_y
-            floor_index = start_index + (relative_y // floor_height)
-            
-            if 0 <= floor_index < len(self.game.building.floors):
-                self.game.selected_floor = floor_index + 1
+        floor_index = self.floor_list.floor_at(y, self.floors_top, self.scroll_offset)
+        if floor_index is not None:
+            self.game.selected_floor = floor_index + 1
                 
     def handle_scroll(self, button):
         """Обработка скролла"""
@@ -343,52 +397,17 @@ class GameWindow:
     def handle_info_panel_click(self, x, y):
         """Обработка кликов в информационной панели"""
         if not self.game.selected_floor:
-            return
+            return False
             
-        floor = self.game.building.floors[self.game.selected_floor - 1]
-        panel_x = self.building_width + 30
-        current_y = 180
+        button = self.get_info_layout().hit((x, y))
+        if button is None:
+            return False
         
-        # Создаем временные кнопки для обработки кликов
-        buttons = []
+        floor = self.game.building.floors[self.game.selected_floor - 1]
+        self.handle_info_panel_action(button.action, floor, button.arg)
+        return True
 
-        if not floor.owned:
-            # Кнопка покупки этажа
-            buy_button_rect = pygame.Rect(panel_x, current_y + 90, self.info_panel_width - 90, 70)
-            buttons.append(("buy", buy_button_rect))
-        else:
-            # Кнопка сбора дохода
-            if floor.income_collected > 0 and not self.has_auto_collect(floor):
-                collect_button_rect = pygame.Rect(panel_x, current_y + 250, self.info_panel_width - 90, 40)
-                buttons.append(("collect", collect_button_rect))
-                current_y += 50
-            
-            # Кнопки улучшения ремонта
-            repair_levels = list(self.config.FLOOR_CONFIG["repair_levels"].keys())
-            if floor.repair_level in repair_levels:
-                current_repair_index = repair_levels.index(floor.repair_level)
-                if current_repair_index < len(repair_levels) - 1:
-                    repair_button_rect = pygame.Rect(panel_x, current_y + 250, self.info_panel_width - 90, 40)
-                    buttons.append(("repair", repair_button_rect))
-                    current_y += 50
-            
-            # Кнопки менеджеров
-            available_managers = self.game.get_available_managers(self.game.selected_floor)
-            for manager_id, manager_data in available_managers:
-                if manager_id != floor.manager:
-                    manager_button_rect = pygame.Rect(panel_x, current_y + 250, self.info_panel_width - 90, 40)
-                    buttons.append((f"manager_{manager_id}", manager_button_rect))
-                    current_y += 50
-        
-        # Проверяем клик по кнопкам
-        for button_type, button_rect in buttons:
-            if button_rect.collidepoint((x, y)):
-                self.handle_info_panel_action(button_type, floor)
-                return True
-        
-        return False
-
-    def handle_info_panel_action(self, action_type, floor):
+    def handle_info_panel_action(self, action_type, floor, arg=None):
         """Обработка действий информационной панели"""
         if action_type == "buy":
             cost = self.game.building.get_floor_cost(self.game.selected_floor)
@@ -397,13 +416,14 @@ class GameWindow:
             else:
                 self.show_message(f"Недостаточно денег! Нужно: {cost} руб.", self.colors['error'])
                 
+        elif action_type == "buy_bulk":
+            self.game.buy_floors_bulk(self.game.selected_floor)
+                
         elif action_type == "collect":
             self.game.collect_floor_income(self.game.selected_floor)
             
         elif action_type == "repair":
-            repair_levels = list(self.config.FLOOR_CONFIG["repair_levels"].keys())
-            current_repair_index = repair_levels.index(floor.repair_level)
-            next_repair = repair_levels[current_repair_index + 1]
+            next_repair = arg
             repair_cost = floor.calculate_repair_cost(self.game.config, next_repair)
             
             if self.game.repair_floor(self.game.selected_floor, next_repair):
@@ -411,8 +431,8 @@ class GameWindow:
             else:
                 self.show_message(f"Недостаточно денег для ремонта! Нужно: {repair_cost} руб.", self.colors['error'])
                 
-        elif action_type.startswith("manager_"):
-            manager_id = action_type.split("_")[1]
+        elif action_type == "manager":
+            manager_id = arg
             manager_data = self.config.MANAGER_CONFIG["managers"][manager_id]
             
             if self.game.hire_manager(self.game.selected_floor, manager_id):
@@ -420,14 +440,90 @@ class GameWindow:
             else:
                 self.show_message(f"Недостаточно денег! Нужно: {manager_data['cost']} руб.", self.colors['error'])
 
+    def get_info_layout(self):
+        """Раскладка кнопок информационной панели (из кэша, пока состояние не изменилось)"""
+        key = (self.game.building.store.version, self.game.selected_floor, int(self.game.money))
+        if key != self.info_layout_key:
+            self.info_layout = self.layout_info_panel()
+            self.info_layout_key = key
+        return self.info_layout
+
+    def layout_info_panel(self):
+        """Раскладка кнопок выбранного этажа и подписей под ними"""
+        layout = PanelLayout()
+        selected = self.game.selected_floor
+        if not selected or selected > len(self.game.building.floors):
+            return layout
+            
+        floor = self.game.building.floors[selected - 1]
+        x = self.building_width + 30
+        y = 180  # под заголовком этажа
+        width = self.info_panel_width - 90
+        
+        if not floor.owned:
+            # Под карточкой стоимости
+            can_afford = self.game.money >= self.game.building.get_floor_cost(selected)
+            layout.add_button((x, y + 100, width, 50), "buy", "🏗️ Купить этаж", self.font, not can_afford)
+            
+            bulk_count, bulk_cost = self.game.get_bulk_buy_preview(selected)
+            if bulk_count > 1:
+                layout.add_button((x, y + 160, width, 40), "buy_bulk",
+                                  f"🏗️ Купить {bulk_count} эт. за {bulk_cost} руб.", self.small_font)
+            return layout
+        
+        # Под пятью карточками статистики (по 45 px) и отступом
+        current_y = y + 5 * 45 + 20
+        
+        # Кнопка сбора дохода
+        if floor.income_collected > 0 and not self.has_auto_collect(floor):
+            layout.add_button((x, current_y, width, 40), "collect",
+                              f"💰 Собрать {floor.income_collected} руб.", self.small_font)
+            current_y += 50
+        
+        # Кнопка улучшения ремонта
+        repair_levels = list(self.config.FLOOR_CONFIG["repair_levels"].keys())
+        if floor.repair_level in repair_levels:
+            current_repair_index = repair_levels.index(floor.repair_level)
+            
+            if current_repair_index < len(repair_levels) - 1:
+                next_repair = repair_levels[current_repair_index + 1]
+                repair_cost = floor.calculate_repair_cost(self.game.config, next_repair)
+                can_afford = self.game.money >= repair_cost
+                
+                layout.add_button((x, current_y, width, 40), "repair", f"🔧 Улучшить до {next_repair}",
+                                  self.small_font, not can_afford, next_repair)
+                layout.add_label((x + 10, current_y + 45), self.small_font, f"Стоимость: {repair_cost} руб.",
+                                 self.colors['text_secondary'] if can_afford else self.colors['error'])
+                current_y += 70
+        
+        # Кнопки менеджеров
+        for manager_id, manager_data in self.game.get_available_managers(selected):
+            if manager_id == floor.manager:
+                continue
+            can_afford = self.game.money >= manager_data["cost"]
+            layout.add_button((x, current_y, width, 40), "manager", f"👨‍💼 Нанять {manager_data['name']}",
+                              self.small_font, not can_afford, manager_id)
+            
+            # Стоимость и бонусы под кнопкой
+            layout.add_label((x + 10, current_y + 45), self.small_font, f"Стоимость: {manager_data['cost']} руб.",
+                             self.colors['text_secondary'] if can_afford else self.colors['error'])
+            bonus_text = self.get_manager_bonus_text(manager_data)
+            if bonus_text:
+                layout.add_label((x + 10, current_y + 65), self.small_font, bonus_text, self.colors['text_secondary'])
+                current_y += 90
+            else:
+                current_y += 70
+        
+        return layout
+
     def has_auto_collect(self, floor):
         """Проверяет, есть ли у этажа авто-сбор"""
         return (floor.manager and 
                 self.config.MANAGER_CONFIG["managers"][floor.manager].get("auto_collect", False))
 
     def update(self):
-        """Обновление анимаций и эффектов"""
-        self.game.update()
+        """Один шаг симуляции: игра, анимации и эффекты (темп задает главный цикл)"""
+        self.profiler.measure("game_update", self.game.update)
         self.ui_manager.update()
         
         # Пульсация для анимаций
@@ -438,7 +534,7 @@ class GameWindow:
             self.pulse_direction = 1
         
         # Обновление частиц
-        self.particles.update()
+        self.profiler.measure("particles", self.particles.update)
         
         # Обновление сообщений
         if self.current_message:
@@ -448,123 +544,81 @@ class GameWindow:
             
             if self.message_timer <= 0:
                 self.next_message()
-        
-        self.clock.tick(60)
+
+    def needs_render(self):
+        """Изменится ли что-нибудь на экране (иначе кадр можно не рисовать)"""
+        overlay_active = (self.current_message is not None or len(self.particles) > 0
+                          or self.profiler.enabled)
+        return self.renderer.needs_render(overlay_active)
 
     def render(self):
-        """Отрисовка всего интерфейса"""
-        # Фон с узором
+        """Отрисовка всего интерфейса (только изменившиеся слои и области)"""
+        self.renderer.render(self.render_overlay)
+
+    def render_background(self):
+        """Статичный фон: узор и градиентный верх"""
+        # Полупрозрачный узор раньше накладывался каждый кадр и за несколько
+        # кадров становился непрозрачным - рисуем сразу итоговый вид
+        pattern = self.background_pattern.copy()
+        pattern.fill((0, 0, 0, 255), special_flags=pygame.BLEND_RGBA_MAX)
         for x in range(0, self.config.SCREEN_WIDTH, 100):
             for y in range(0, self.config.SCREEN_HEIGHT, 100):
-                self.screen.blit(self.background_pattern, (x, y))
+                self.canvas.blit(pattern, (x, y))
         
         # Градиентный верхний фон
         header_rect = pygame.Rect(0, 0, self.config.SCREEN_WIDTH, 200)
         self.visual_effects.draw_gradient_rect(
-            self.screen, header_rect, 
+            self.canvas, header_rect, 
             (220, 230, 255), (240, 245, 255)
         )
-        
-        # Отрисовка основных элементов
-        self.render_building()
-        self.render_info_panel()
-        self.upgrades_panel.render(self.screen)
+
+    def render_top_layer(self):
+        """Верхняя панель и кнопки UI менеджера"""
         self.render_top_panel()
-        self.ui_manager.draw(self.screen)
-        
-        # Сообщения поверх всего
+        self.ui_manager.draw(self.canvas)
+
+    def render_overlay(self, surface):
+        """Сообщения и частицы поверх слоев, возвращает занятые прямоугольники"""
+        self.canvas = surface
+        rects = []
         if self.current_message:
-            self.render_message()
-        
-        # Частицы поверх всего
-        self.particles.draw(self.screen)
-        
-        pygame.display.flip()
+            rects.append(self.render_message())
+        self.canvas = self.screen
+        particles_rect = self.profiler.measure("particles", self.particles.draw, surface)
+        if particles_rect:
+            rects.append(particles_rect)
+        if self.profiler.enabled:
+            rects.append(self.profiler.draw(surface, self.small_font))
+        return rects
     
     def render_building(self):
         """Отрисовка небоскрёба с премиум графикой"""
         # Фон здания с тенью
         building_bg = pygame.Rect(15, 85, self.building_width - 30, self.config.SCREEN_HEIGHT - 100)
-        pygame.draw.rect(self.screen, (0, 0, 0, 30), 
+        pygame.draw.rect(self.canvas, (0, 0, 0, 30), 
                         building_bg.move(3, 3), 
                         border_radius=15)
-        pygame.draw.rect(self.screen, self.colors['panel'], 
+        pygame.draw.rect(self.canvas, self.colors['panel'], 
                         building_bg, border_radius=15)
         
         # Заголовок здания
         title_rect = pygame.Rect(25, 90, self.building_width - 50, 40)
-        self.visual_effects.draw_glass_effect(self.screen, title_rect, self.colors['accent'], 180)
-        title_text = self.font.render("🏢 Ваш Небоскрёб", True, (255, 255, 255))
-        self.screen.blit(title_text, (title_rect.centerx - title_text.get_width()//2, 
+        self.visual_effects.draw_glass_effect(self.canvas, title_rect, self.colors['accent'], 180)
+        title_text = self.get_text_surface("🏢 Ваш Небоскрёб", self.font, (255, 255, 255))
+        self.canvas.blit(title_text, (title_rect.centerx - title_text.get_width()//2, 
                                     title_rect.centery - title_text.get_height()//2))
         
         # Область этажей
         floors_rect = pygame.Rect(25, 140, self.building_width - 50, self.config.SCREEN_HEIGHT - 160)
-        pygame.draw.rect(self.screen, self.colors['panel_secondary'], 
+        pygame.draw.rect(self.canvas, self.colors['panel_secondary'], 
                         floors_rect, border_radius=12)
         
-        # Отрисовка видимых этажей
-        start_index = self.scroll_offset // self.floor_height
-        end_index = min(start_index + self.max_visible_floors, len(self.game.building.floors))
-        
-        for i in range(start_index, end_index):
-            floor = self.game.building.floors[i]
-            y_position = 150 + (i - start_index) * self.floor_height
-            
-            floor_rect = pygame.Rect(35, y_position, self.building_width - 70, 35)
-            
-            # Анимированная карточка этажа
-            floor_data = {
-                'owned': floor.owned,
-                'selected': self.game.selected_floor == i + 1,
-                'has_income': floor.income_collected > 0,
-                'has_manager': floor.manager is not None
-            }
-            
-            self.visual_effects.draw_floor_card(self.screen, floor_rect, floor_data, self.colors)
-            
-            # Иконки и текст этажа
-            self.render_floor_content(floor_rect, floor, i + 1)
+        # Видимые этажи со сдвигом прокрутки до пикселя
+        self.floor_list.render(self.canvas, 35, self.floors_top, floors_rect, self.scroll_offset)
         
         # Полоса прокрутки
         self.render_scrollbar()
 
-    def render_floor_content(self, rect, floor, floor_number):
-        """Отрисовка содержимого карточки этажа"""
-        # Номер этажа
-        number_text = self.small_font.render(f"{floor_number}", True, self.colors['text'])
-        self.screen.blit(number_text, (rect.x + 10, rect.centery - number_text.get_height()//2))
-        
-        if floor.owned:
-            # Тип этажа с иконкой
-            type_icons = {
-                "office": "💼",
-                "commercial": "🛍️", 
-                "residential": "🏠",
-                "premium": "⭐"
-            }
-            icon = type_icons.get(floor.floor_type, "🏢")
-            type_text = self.small_font.render(f"{icon} {floor.floor_type}", True, self.colors['text_secondary'])
-            self.screen.blit(type_text, (rect.x + 40, rect.centery - type_text.get_height()//2))
-            
-            # Менеджер
-            if floor.manager:
-                manager_text = self.small_font.render("👨‍💼", True, self.colors['manager_indicator'])
-                self.screen.blit(manager_text, (rect.right - 50, rect.centery - manager_text.get_height()//2))
-            
-            # Накопленный доход с анимацией
-            if floor.income_collected > 0:
-                income_alpha = int(150 + 105 * math.sin(pygame.time.get_ticks() * 0.01))
-                income_text = self.small_font.render(f"+{floor.income_collected}", True, self.colors['success'])
-                income_text.set_alpha(income_alpha)
-                self.screen.blit(income_text, (rect.right - 100, rect.centery - income_text.get_height()//2))
-        else:
-            # Стоимость этажа
-            cost = self.game.building.get_floor_cost(floor_number)
-            cost_text = self.small_font.render(f"{cost} руб.", True, self.colors['text_secondary'])
-            self.screen.blit(cost_text, (rect.centerx - cost_text.get_width()//2, 
-                                       rect.centery - cost_text.get_height()//2))
-
     def render_scrollbar(self):
         """Отрисовка полосы прокрутки"""
         if len(self.game.building.floors) <= self.max_visible_floors:
@@ -582,12 +636,12 @@ class GameWindow:
         
         # Фон скроллбара
         scrollbar_bg = pygame.Rect(scrollbar_x, 150, scrollbar_width, self.config.SCREEN_HEIGHT - 160)
-        pygame.draw.rect(self.screen, (200, 210, 220), scrollbar_bg, border_radius=6)
+        pygame.draw.rect(self.canvas, (200, 210, 220), scrollbar_bg, border_radius=6)
         
         # Бегунок с градиентом
         scrollbar_thumb = pygame.Rect(scrollbar_x, scrollbar_y, scrollbar_width, scrollbar_height)
         self.visual_effects.draw_gradient_rect(
-            self.screen, scrollbar_thumb,
+            self.canvas, scrollbar_thumb,
             self.colors['accent'], (100, 150, 200)
         )
     
@@ -595,24 +649,24 @@ class GameWindow:
         """Отрисовка информационной панели с премиум дизайном"""
         # Основная панель с тенью
         panel_bg = pygame.Rect(self.building_width + 15, 85, self.info_panel_width - 30, self.config.SCREEN_HEIGHT - 100)
-        pygame.draw.rect(self.screen, (0, 0, 0, 30), 
+        pygame.draw.rect(self.canvas, (0, 0, 0, 30), 
                         panel_bg.move(3, 3), 
                         border_radius=15)
-        pygame.draw.rect(self.screen, self.colors['panel'], 
+        pygame.draw.rect(self.canvas, self.colors['panel'], 
                         panel_bg, border_radius=15)
         
         if self.game.selected_floor:
             self.render_floor_info_details()
         else:
             # Красивое сообщение о выборе этажа
-            text = self.font.render("Выберите этаж для просмотра", True, self.colors['text_secondary'])
-            self.screen.blit(text, (panel_bg.centerx - text.get_width()//2, 
+            text = self.get_text_surface("Выберите этаж для просмотра", self.font, self.colors['text_secondary'])
+            self.canvas.blit(text, (panel_bg.centerx - text.get_width()//2, 
                                   panel_bg.centery - text.get_height()//2))
             
             # Анимированная стрелка
             arrow_y = panel_bg.centery + 30 + math.sin(pygame.time.get_ticks() * 0.005) * 10
-            arrow_text = self.font.render("↓", True, self.colors['accent'])
-            self.screen.blit(arrow_text, (panel_bg.centerx - arrow_text.get_width()//2, arrow_y))
+            arrow_text = self.get_text_surface("↓", self.font, self.colors['accent'])
+            self.canvas.blit(arrow_text, (panel_bg.centerx - arrow_text.get_width()//2, arrow_y))
 
     def render_floor_info_details(self):
         """Детальная информация о выбранном этаже"""
@@ -626,13 +680,15 @@ class GameWindow:
         # Заголовок с градиентом
         title_rect = pygame.Rect(panel_x, current_y, self.info_panel_width - 60, 50)
         self.visual_effects.draw_gradient_rect(
-            self.screen, title_rect, 
+            self.canvas, title_rect, 
             self.colors['accent'], (60, 110, 160)
         )
         
-        title_text = self.font.render(f"Этаж {self.game.selected_floor}", True, (255, 255, 255))
-        self.screen.blit(title_text, (title_rect.centerx - title_text.get_width()//2, 
-                                    title_rect.centery - title_text.get_height()//2))
+        title = f"Этаж {self.game.selected_floor}"
+        title_width = self.text_cache.value_width(self.font, title, (255, 255, 255))
+        self.text_cache.draw_value(self.canvas, (title_rect.centerx - title_width//2,
+                                                 title_rect.centery - self.font.get_height()//2),
+                                   self.font, title, (255, 255, 255))
         
         current_y += 70
         
@@ -656,21 +712,20 @@ class GameWindow:
         
         for label, value in stats:
             stat_rect = pygame.Rect(x, current_y, self.info_panel_width - 90, 35)
-            self.visual_effects.draw_glass_effect(self.screen, stat_rect, (240, 245, 255), 100)
+            self.visual_effects.draw_glass_effect(self.canvas, stat_rect, (240, 245, 255), 100)
             
-            label_text = self.small_font.render(label, True, self.colors['text_secondary'])
-            value_text = self.small_font.render(value, True, self.colors['text'])
+            label_text = self.get_text_surface(label, self.small_font, self.colors['text_secondary'])
+            self.canvas.blit(label_text, (stat_rect.x + 10, stat_rect.centery - label_text.get_height()//2))
             
-            self.screen.blit(label_text, (stat_rect.x + 10, stat_rect.centery - label_text.get_height()//2))
-            self.screen.blit(value_text, (stat_rect.right - value_text.get_width() - 10, 
-                                        stat_rect.centery - value_text.get_height()//2))
+            value_width = self.text_cache.value_width(self.small_font, value, self.colors['text'])
+            self.text_cache.draw_value(self.canvas, (stat_rect.right - value_width - 10,
+                                                     stat_rect.centery - self.small_font.get_height()//2),
+                                       self.small_font, value, self.colors['text'])
             
             current_y += 45
         
-        current_y += 20
-        
         # Интерактивные кнопки
-        self.render_floor_actions(floor, x, current_y)
+        self.render_floor_actions()
 
     def render_unowned_floor_info(self, floor, x, y):
         """Информация о непокупном этаже"""
@@ -679,97 +734,35 @@ class GameWindow:
         
         # Красивое отображение стоимости
         cost_rect = pygame.Rect(x, y, self.info_panel_width - 90, 80)
-        self.visual_effects.draw_glass_effect(self.screen, cost_rect, (250, 250, 255), 150)
-        
-        cost_title = self.small_font.render("Стоимость покупки", True, self.colors['text_secondary'])
-        cost_value = self.font.render(f"{cost} руб.", True, 
-                                    self.colors['success'] if can_afford else self.colors['error'])
+        self.visual_effects.draw_glass_effect(self.canvas, cost_rect, (250, 250, 255), 150)
         
-        self.screen.blit(cost_title, (cost_rect.centerx - cost_title.get_width()//2, cost_rect.y + 15))
-        self.screen.blit(cost_value, (cost_rect.centerx - cost_value.get_width()//2, cost_rect.y + 40))
+        cost_title = self.get_text_surface("Стоимость покупки", self.small_font, self.colors['text_secondary'])
+        self.canvas.blit(cost_title, (cost_rect.centerx - cost_title.get_width()//2, cost_rect.y + 15))
         
-        # Кнопка покупки
-        button_rect = pygame.Rect(x, y + 100, self.info_panel_width - 90, 50)
-        mouse_pos = pygame.mouse.get_pos()
-        hover = button_rect.collidepoint(mouse_pos) and can_afford
+        cost_value = f"{cost} руб."
+        cost_color = self.colors['success'] if can_afford else self.colors['error']
+        cost_width = self.text_cache.value_width(self.font, cost_value, cost_color)
+        self.text_cache.draw_value(self.canvas, (cost_rect.centerx - cost_width//2, cost_rect.y + 40),
+                                   self.font, cost_value, cost_color)
         
-        self.visual_effects.draw_modern_button(
-            self.screen, button_rect,
-            "🏗️ Купить этаж",
-            self.font, self.colors, hover, not can_afford
-        )
+        # Кнопки покупки
+        self.render_floor_actions()
 
-    def render_floor_actions(self, floor, x, y):
-        """Отрисовка действий для этажа"""
-        current_y = y
+    def render_floor_actions(self):
+        """Отрисовка кнопок этажа по готовой раскладке"""
+        layout = self.get_info_layout()
         mouse_pos = pygame.mouse.get_pos()
         
-        # Кнопка сбора дохода
-        if floor.income_collected > 0 and (not floor.manager or not self.config.MANAGER_CONFIG["managers"][floor.manager].get("auto_collect", False)):
-            button_rect = pygame.Rect(x, current_y, self.info_panel_width - 90, 40)
-            hover = button_rect.collidepoint(mouse_pos)
-            
-            # Рисуем кнопку и сохраняем её координаты для обработки кликов
+        for button in layout.buttons:
+            hover = button.rect.collidepoint(mouse_pos) and not button.disabled
             self.visual_effects.draw_modern_button(
-                self.screen, button_rect,
-                f"💰 Собрать {floor.income_collected} руб.",
-                self.small_font, self.colors, hover
+                self.canvas, button.rect, button.text,
+                button.font, self.colors, hover, button.disabled
             )
-            current_y += 50
         
-        # Кнопка улучшения ремонта
-        repair_levels = list(self.config.FLOOR_CONFIG["repair_levels"].keys())
-        if floor.repair_level in repair_levels:
-            current_repair_index = repair_levels.index(floor.repair_level)
-            
-            if current_repair_index < len(repair_levels) - 1:
-                next_repair = repair_levels[current_repair_index + 1]
-                repair_cost = floor.calculate_repair_cost(self.game.config, next_repair)
-                can_afford = self.game.money >= repair_cost
-                
-                button_rect = pygame.Rect(x, current_y, self.info_panel_width - 90, 40)
-                hover = button_rect.collidepoint(mouse_pos) and can_afford
-                
-                self.visual_effects.draw_modern_button(
-                    self.screen, button_rect,
-                    f"🔧 Улучшить до {next_repair}",
-                    self.small_font, self.colors, hover, not can_afford
-                )
-                
-                # Стоимость под кнопкой
-                cost_text = self.small_font.render(f"Стоимость: {repair_cost} руб.", True, 
-                                                 self.colors['text_secondary'] if can_afford else self.colors['error'])
-                self.screen.blit(cost_text, (x + 10, current_y + 45))
-                current_y += 70
-        
-        # Кнопки менеджеров
-        available_managers = self.game.get_available_managers(self.game.selected_floor)
-        for manager_id, manager_data in available_managers:
-            if manager_id != floor.manager:
-                can_afford = self.game.money >= manager_data["cost"]
-                button_rect = pygame.Rect(x, current_y, self.info_panel_width - 90, 40)
-                hover = button_rect.collidepoint(mouse_pos) and can_afford
-                
-                button_text = f"👨‍💼 Нанять {manager_data['name']}"
-                self.visual_effects.draw_modern_button(
-                    self.screen, button_rect, button_text,
-                    self.small_font, self.colors, hover, not can_afford
-                )
-                
-                # Стоимость и бонусы под кнопкой
-                cost_text = self.small_font.render(f"Стоимость: {manager_data['cost']} руб.", True, 
-                                                 self.colors['text_secondary'] if can_afford else self.colors['error'])
-                self.screen.blit(cost_text, (x + 10, current_y + 45))
-                
-                bonus_text = self.get_manager_bonus_text(manager_data)
-                if bonus_text:
-                    bonus_surface = self.small_font.render(bonus_text, True, self.colors['text_secondary'])
-                    self.screen.blit(bonus_surface, (x + 10, current_y + 65))
-                    current_y += 90
-                else:
-                    current_y += 70
-        
-        return current_y
+        # Стоимость и бонусы под кнопками
+        for pos, font, text, color in layout.labels:
+            self.text_cache.draw_value(self.canvas, pos, font, text, color)
 
     def get_manager_bonus_text(self, manager_data):
         """Возвращает текст бонуса менеджера"""
@@ -789,12 +782,12 @@ class GameWindow:
         """Отрисовка верхней панели с общей информацией"""
         # Основная панель с тенью и градиентом
         panel_rect = pygame.Rect(15, 15, self.config.SCREEN_WIDTH - 30, 70)
-        pygame.draw.rect(self.screen, (0, 0, 0, 30), 
+        pygame.draw.rect(self.canvas, (0, 0, 0, 30), 
                         panel_rect.move(2, 2), 
                         border_radius=20)
         
         self.visual_effects.draw_gradient_rect(
-            self.screen, panel_rect,
+            self.canvas, panel_rect,
             (80, 150, 220), (100, 170, 240)
         )
         
@@ -804,17 +797,17 @@ class GameWindow:
             (f"📅 День: {self.game.day}", 200),
             (f"💵 Доход/день: {self.game.get_total_income_per_day()} руб.", 350),
             (f"💸 Расходы/день: {self.game.calculate_operational_costs()} руб.", 550),
-            (f"🏢 Этажи: {len(self.game.building.get_owned_floors())}/{self.config.FLOOR_CONFIG['max_floors']}", 750)
+            (f"🏢 Этажи: {self.game.get_owned_floor_count()}/{self.config.FLOOR_CONFIG['max_floors']}", 750)
         ]
         
+        # Значения меняются каждый игровой день - числа рисуются из атласа глифов
         for text, x_pos in indicators:
-            text_surf = self.small_font.render(text, True, (255, 255, 255))
-            self.screen.blit(text_surf, (x_pos, 40))
+            self.text_cache.draw_value(self.canvas, (x_pos, 40), self.small_font, text, (255, 255, 255))
 
     def render_message(self):
-        """Отрисовка текущего сообщения"""
+        """Отрисовка текущего сообщения, возвращает занятый прямоугольник"""
         if not self.current_message:
-            return
+            return None
             
         # Анимация появления/исчезновения
         alpha = min(255, self.current_message['timer'] * 4)
@@ -825,25 +818,26 @@ class GameWindow:
         message_bg.y = 80 + y_offset
         
         self.visual_effects.draw_glass_effect(
-            self.screen, message_bg, 
+            self.canvas, message_bg, 
             self.current_message['color'], 
-            alpha // 2
+            127, fade=alpha
         )
         
         # Текст сообщения
-        message_surf = self.font.render(
+        message_surf = self.get_text_surface(
             self.current_message['text'], 
-            True, 
+            self.font, 
             self.current_message['color']
         )
-        message_surf.set_alpha(alpha)
         
         message_rect = message_surf.get_rect(center=(self.config.SCREEN_WIDTH // 2, 110 + y_offset))
-        self.screen.blit(message_surf, message_rect)
+        self.text_cache.draw(self.canvas, message_rect.topleft, self.font,
+                             self.current_message['text'], self.current_message['color'], alpha)
+        return message_bg.union(message_rect)
 
     def save_game_action(self):
         """Действие кнопки сохранения"""
-        success = self.game.save_system.save_game(self.game, "manual_save.json")
+        success = self.game.save_system.save_game(self.game, self.game.save_system.filename_for("manual_save"))
         if success:
             self.show_message("💾 Игра сохранена!", self.colors['success'])
         else:
@@ -0,0 +1,53 @@
+import bisect
+import pygame
+
+
+class PanelButton:
+    """Кнопка в раскладке панели: прямоугольник, действие и подпись"""
+    def __init__(self, rect, action, text, font, disabled=False, arg=None):
+        self.rect = pygame.Rect(rect)
+        self.action = action
+        self.arg = arg
+        self.text = text
+        self.font = font
+        self.disabled = disabled
+
+
+class PanelLayout:
+    """Раскладка интерактивных элементов панели.
+
+    Строится один раз при изменении состояния и используется и для
+    отрисовки, и для обработки кликов, поэтому кнопки на экране и
+    области кликов всегда совпадают. Кнопки отсортированы по верхнему
+    краю - поиск кнопки под точкой идет двоичным поиском.
+    """
+    def __init__(self):
+        self.buttons = []
+        self.labels = []  # (позиция, шрифт, текст, цвет) - подписи под кнопками
+        self._tops = None
+        self._max_height = 0
+
+    def add_button(self, rect, action, text, font, disabled=False, arg=None):
+        button = PanelButton(rect, action, text, font, disabled, arg)
+        self.buttons.append(button)
+        self._tops = None
+        return button
+
+    def add_label(self, pos, font, text, color):
+        self.labels.append((pos, font, text, color))
+
+    def hit(self, pos):
+        """Кнопка под точкой pos (None, если ее нет)"""
+        if self._tops is None:
+            self.buttons.sort(key=lambda button: button.rect.y)
+            self._tops = [button.rect.y for button in self.buttons]
+            self._max_height = max((button.rect.height for button in self.buttons), default=0)
+
+        # Кандидаты - кнопки, верхний край которых не ниже точки и не выше ее на максимальную высоту
+        index = bisect.bisect_right(self._tops, pos[1]) - 1
+        while index >= 0 and self._tops[index] > pos[1] - self._max_height:
+            button = self.buttons[index]
+            if button.rect.collidepoint(pos):
+                return button
+            index -= 1
+        return None
@@ -0,0 +1,134 @@
+import random
+
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен: без него частицы считаются в списках
+    np = None
+
+MONEY_COLOR = (255, 215, 0)
+MIN_SIZE = 3
+MAX_SIZE = 6
+GRAVITY = 0.1
+
+
+class ParticleSystem:
+    """Система частиц для визуальных эффектов (struct-of-arrays).
+
+    Частицы хранятся в колонках фиксированной емкости: позиция, скорость,
+    время жизни и размер. Живые частицы всегда лежат в первых count
+    ячейках; умершие заменяются последними живыми (swap-remove), поэтому
+    удаление не сдвигает массивы. Если доступен NumPy, движение считается
+    сразу по всем частицам. Частицы рисуются готовыми спрайтами кругов
+    одним вызовом blits. Случайные скорости берутся из своего генератора
+    с зерном, а не из игрового game.rng.
+    """
+    def __init__(self, capacity=4096, seed=0):
+        self.capacity = capacity
+        self.count = 0
+        self.rng = random.Random(seed)
+        self.use_numpy = np is not None
+
+        if self.use_numpy:
+            self.x = np.zeros(capacity, dtype=np.float64)
+            self.y = np.zeros(capacity, dtype=np.float64)
+            self.vx = np.zeros(capacity, dtype=np.float64)
+            self.vy = np.zeros(capacity, dtype=np.float64)
+            self.life = np.zeros(capacity, dtype=np.int32)
+            self.size = np.zeros(capacity, dtype=np.int32)
+        else:
+            self.x = [0.0] * capacity
+            self.y = [0.0] * capacity
+            self.vx = [0.0] * capacity
+            self.vy = [0.0] * capacity
+            self.life = [0] * capacity
+            self.size = [0] * capacity
+
+        # Спрайт круга на каждый размер (рисуется так же, как pygame.draw.circle)
+        self.sprites = {}
+        for size in range(MIN_SIZE, MAX_SIZE + 1):
+            sprite = pygame.Surface((size * 2, size * 2))
+            sprite.set_colorkey((0, 0, 0))
+            pygame.draw.circle(sprite, MONEY_COLOR, (size, size), size)
+            self.sprites[size] = sprite
+
+    def __len__(self):
+        return self.count
+
+    def add_money_particles(self, pos, amount):
+        """Добавляет частицы денег (лишние при заполненной емкости отбрасываются)"""
+        rng = self.rng
+        for _ in range(min(10, self.capacity - self.count)):
+            i = self.count
+            self.x[i] = pos[0]
+            self.y[i] = pos[1]
+            self.vx[i] = rng.uniform(-2.5, 2.5)
+            self.vy[i] = rng.uniform(-4.0, -2.0)
+            self.size[i] = rng.randint(MIN_SIZE, MAX_SIZE)
+            self.life[i] = rng.randint(60, 99)
+            self.count += 1
+
+    def update(self):
+        """Обновляет частицы"""
+        n = self.count
+        if not n:
+            return
+        if self.use_numpy:
+            self.x[:n] += self.vx[:n]
+            self.y[:n] += self.vy[:n]
+            self.life[:n] -= 1
+            self.vy[:n] += GRAVITY  # гравитация
+
+            dead = np.flatnonzero(self.life[:n] <= 0)
+            if dead.size:
+                # Живые частицы из хвоста переносятся на место умерших в начале
+                keep = n - dead.size
+                holes = dead[dead < keep]
+                movers = np.flatnonzero(self.life[keep:n] > 0) + keep
+                for column in (self.x, self.y, self.vx, self.vy, self.life, self.size):
+                    column[holes] = column[movers]
+                self.count = keep
+            return
+
+        x, y, vx, vy, life, size = self.x, self.y, self.vx, self.vy, self.life, self.size
+        for i in range(n):
+            x[i] += vx[i]
+            y[i] += vy[i]
+            life[i] -= 1
+            vy[i] += GRAVITY
+
+        # swap-remove: последняя живая частица встает на место умершей
+        i = 0
+        while i < n:
+            if life[i] <= 0:
+                n -= 1
+                x[i], y[i], vx[i], vy[i], life[i], size[i] = x[n], y[n], vx[n], vy[n], life[n], size[n]
+            else:
+                i += 1
+        self.count = n
+
+    def draw(self, surface):
+        """Рисует частицы, возвращает прямоугольник, который они заняли"""
+        n = self.count
+        if not n:
+            return None
+        if self.use_numpy:
+            left = self.x[:n].astype(np.int32) - self.size[:n]
+            top = self.y[:n].astype(np.int32) - self.size[:n]
+            sizes = self.size[:n].tolist()
+            lefts = left.tolist()
+            tops = top.tolist()
+        else:
+            sizes = self.size[:n]
+            lefts = [int(self.x[i]) - sizes[i] for i in range(n)]
+            tops = [int(self.y[i]) - sizes[i] for i in range(n)]
+
+        sprites = self.sprites
+        surface.blits([(sprites[s], (l, t)) for s, l, t in zip(sizes, lefts, tops)], doreturn=False)
+
+        right = max(l + 2 * s for l, s in zip(lefts, sizes))
+        bottom = max(t + 2 * s for t, s in zip(tops, sizes))
+        left_edge = min(lefts)
+        top_edge = min(tops)
+        return pygame.Rect(left_edge, top_edge, right - left_edge, bottom - top_edge)
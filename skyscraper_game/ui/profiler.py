@@ -0,0 +1,135 @@
+import csv
+import json
+import os
+import time
+from array import array
+from time import perf_counter
+
+import pygame
+
+from .render_cache import text_cache
+
+
+class FrameProfiler:
+    """Профилировщик кадра по этапам.
+
+    Время каждого этапа за кадр копится в measure(), в end_frame() оно
+    записывается в кольцевой буфер на последние capacity кадров. По
+    буферу считаются перцентили p50/p95/p99. Выключенный профилировщик
+    только вызывает функцию этапа, без замеров.
+    """
+    STAGES = ("events", "game_update", "particles", "building", "info_panel",
+              "upgrades", "top_panel", "display", "frame")
+
+    def __init__(self, capacity=600, enabled=False):
+        self.capacity = capacity
+        self.enabled = enabled
+        self.samples = {stage: array('d', [0.0]) * capacity for stage in self.STAGES}
+        self.position = 0     # следующая ячейка кольцевого буфера
+        self.frames = 0       # сколько кадров записано всего
+        self.current = {}     # время этапов текущего кадра
+        self.frame_start = None
+        self._summary = None
+        self._summary_frame = -1
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.current = {}
+        self.frame_start = None
+        return self.enabled
+
+    def measure(self, stage, func, *args):
+        """Вызвать func(*args), прибавив время вызова к этапу stage"""
+        if not self.enabled:
+            return func(*args)
+        start = perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self.current[stage] = self.current.get(stage, 0.0) + perf_counter() - start
+
+    def begin_frame(self):
+        if self.enabled:
+            self.frame_start = perf_counter()
+
+    def end_frame(self):
+        """Записать этапы кадра в кольцевой буфер"""
+        if not self.enabled or self.frame_start is None:
+            return
+        current = self.current
+        current["frame"] = perf_counter() - self.frame_start
+        position = self.position
+        for stage, samples in self.samples.items():
+            samples[position] = current.get(stage, 0.0)
+        self.position = (position + 1) % self.capacity
+        self.frames += 1
+        self.current = {}
+        self.frame_start = None
+
+    def summary(self):
+        """Перцентили этапов в миллисекундах за последние кадры"""
+        if self._summary_frame == self.frames:
+            return self._summary
+        count = min(self.frames, self.capacity)
+        result = {}
+        for stage, samples in self.samples.items():
+            values = sorted(samples[:count]) if count else [0.0]
+            last = len(values) - 1
+            result[stage] = {
+                "p50": values[int(last * 0.50)] * 1000,
+                "p95": values[int(last * 0.95)] * 1000,
+                "p99": values[int(last * 0.99)] * 1000,
+                "max": values[last] * 1000,
+                "mean": sum(values) / len(values) * 1000
+            }
+        self._summary = result
+        self._summary_frame = self.frames
+        return result
+
+    def draw(self, surface, font, pos=(20, 100), refresh_frames=30):
+        """Оверлей с перцентилями этапов, возвращает занятый прямоугольник"""
+        # Перцентили пересчитываются раз в refresh_frames кадров
+        if self._summary is None or self.frames - self._summary_frame >= refresh_frames:
+            self.summary()
+        summary = self._summary
+
+        line_height = font.get_linesize()
+        rect = pygame.Rect(pos[0], pos[1], 330, line_height * (len(self.STAGES) + 1) + 10)
+        pygame.draw.rect(surface, (20, 25, 40), rect, border_radius=6)
+
+        color = (220, 230, 255)
+        x, y = rect.x + 8, rect.y + 5
+        text_cache.draw_value(surface, (x, y), font, f"мс, кадров: {min(self.frames, self.capacity)}", color)
+        for column, key in enumerate(("p50", "p95", "p99")):
+            text_cache.draw(surface, (x + 120 + column * 65, y), font, key, color)
+        for stage in self.STAGES:
+            y += line_height
+            values = summary[stage]
+            text_cache.draw(surface, (x, y), font, stage, color)
+            for column, key in enumerate(("p50", "p95", "p99")):
+                text_cache.draw_value(surface, (x + 120 + column * 65, y), font, f"{values[key]:.2f}", color)
+        return rect
+
+    def dump(self, directory):
+        """Сохранить перцентили (JSON) и замеры по кадрам (CSV), вернуть пути файлов"""
+        if not self.frames:
+            return None
+        os.makedirs(directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        json_path = os.path.join(directory, f"frame_profile_{stamp}.json")
+        csv_path = os.path.join(directory, f"frame_profile_{stamp}.csv")
+
+        self._summary_frame = -1
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump({"frames": min(self.frames, self.capacity), "stages_ms": self.summary()}, f, indent=2)
+
+        # Кадры в порядке записи (от самого старого в буфере)
+        count = min(self.frames, self.capacity)
+        start = self.position if self.frames >= self.capacity else 0
+        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame"] + [f"{stage}_ms" for stage in self.STAGES])
+            for offset in range(count):
+                index = (start + offset) % self.capacity
+                writer.writerow([offset] + [round(self.samples[stage][index] * 1000, 4) for stage in self.STAGES])
+        return json_path, csv_path
@@ -0,0 +1,261 @@
+from collections import OrderedDict
+
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен: без него градиенты рисуются линиями
+    np = None
+
+
+class LRUCache:
+    """Кэш с вытеснением давно не использованных записей и счетчиками попаданий"""
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        """Значение по ключу (None, если его нет в кэше)"""
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self):
+        """Статистика кэша для отладки"""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0
+        }
+
+
+class GradientCache:
+    """Готовые поверхности градиентов по (размер, цвета, направление).
+
+    Градиент строится один раз (через surfarray, если есть NumPy)
+    и затем только копируется блитом.
+    """
+    def __init__(self, max_entries=64):
+        self.cache = LRUCache(max_entries)
+
+    def get(self, size, start_color, end_color, vertical=True):
+        key = (size, tuple(start_color[:3]), tuple(end_color[:3]), vertical)
+        surface = self.cache.get(key)
+        if surface is None:
+            surface = self.cache.put(key, self.build(size, key[1], key[2], vertical))
+        return surface
+
+    @staticmethod
+    def build(size, start_color, end_color, vertical):
+        """Строит поверхность градиента: цвет меняется линейно от start_color к end_color"""
+        width, height = size
+        surface = pygame.Surface(size)
+        steps = height if vertical else width
+
+        if np is not None:
+            ratio = np.arange(steps, dtype=np.float64) / steps
+            start = np.array(start_color, dtype=np.float64)
+            colors = (start + (np.array(end_color, dtype=np.float64) - start) * ratio[:, None]).astype(np.uint8)
+            # surfarray индексируется как [x, y]
+            if vertical:
+                pixels = np.broadcast_to(colors[None, :, :], (width, height, 3))
+            else:
+                pixels = np.broadcast_to(colors[:, None, :], (width, height, 3))
+            pygame.surfarray.blit_array(surface, np.ascontiguousarray(pixels))
+            return surface
+
+        for step in range(steps):
+            ratio = step / steps
+            color = [int(start_color[i] + (end_color[i] - start_color[i]) * ratio) for i in range(3)]
+            if vertical:
+                pygame.draw.line(surface, color, (0, step), (width - 1, step))
+            else:
+                pygame.draw.line(surface, color, (step, 0), (step, height - 1))
+        return surface
+
+
+class PanelCache:
+    """Готовые полупрозрачные скругленные панели со стеклянным бликом.
+
+    Панель с данным размером, цветом и прозрачностью рисуется в
+    SRCALPHA-поверхность один раз, дальше она только копируется блитом.
+    """
+    def __init__(self, max_entries=128):
+        self.cache = LRUCache(max_entries)
+
+    def get(self, size, color, alpha, highlight_alpha, highlight_fraction, border_radius=12):
+        """Поверхность панели; блик - верхняя 1/highlight_fraction часть высоты"""
+        key = (size, tuple(color[:3]), alpha, highlight_alpha, highlight_fraction, border_radius)
+        surface = self.cache.get(key)
+        if surface is None:
+            surface = self.cache.put(key, self.build(*key))
+        return surface
+
+    @staticmethod
+    def build(size, color, alpha, highlight_alpha, highlight_fraction, border_radius):
+        width, height = size
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(surface, (*color, alpha), (0, 0, width, height), border_radius=border_radius)
+        pygame.draw.rect(surface, (255, 255, 255, highlight_alpha),
+                         (0, 0, width, height // highlight_fraction),
+                         border_radius=border_radius)
+        return surface
+
+    def stats(self):
+        return self.cache.stats()
+
+
+class GlyphAtlas:
+    """Заранее отрисованные символы чисел для одного шрифта и цвета.
+
+    Числа, которые меняются каждый тик (деньги, доход), собираются из
+    готовых глифов, поэтому новое значение не требует font.render.
+    """
+    DIGITS = "0123456789"
+    CHARS = DIGITS + "+-.,%/"
+
+    def __init__(self, font, color):
+        self.glyphs = {char: font.render(char, True, color) for char in self.CHARS}
+        self.height = max(glyph.get_height() for glyph in self.glyphs.values())
+
+    def width(self, text):
+        glyphs = self.glyphs
+        return sum(glyphs[char].get_width() for char in text)
+
+    def draw(self, surface, pos, text, alpha=None):
+        """Рисует строку из глифов, возвращает x после последнего символа"""
+        x, y = pos
+        for char in text:
+            glyph = self.glyphs[char]
+            if alpha is not None:
+                glyph.set_alpha(alpha)
+            surface.blit(glyph, (x, y))
+            if alpha is not None:
+                glyph.set_alpha(255)
+            x += glyph.get_width()
+        return x
+
+
+class TextCache:
+    """Общий кэш отрисованного текста для всего интерфейса.
+
+    Статичные строки хранятся в LRU-кэше по (шрифт, текст, цвет).
+    Строки с часто меняющимися числами (draw_value) делятся на
+    неизменные части из кэша и числа из атласа глифов.
+    """
+    def __init__(self, max_entries=512):
+        self.cache = LRUCache(max_entries)
+        self.atlases = {}
+        self.glyph_texts = 0  # сколько строк собрано из глифов
+
+    def render(self, font, text, color):
+        """Поверхность текста (из кэша или новая)"""
+        key = (font, text, tuple(color))
+        surface = self.cache.get(key)
+        if surface is None:
+            surface = self.cache.put(key, font.render(text, True, color))
+        return surface
+
+    def draw(self, surface, pos, font, text, color, alpha=None):
+        """Рисует текст из кэша, возвращает занятый прямоугольник"""
+        text_surface = self.render(font, text, color)
+        if alpha is not None:
+            # Поверхность общая - прозрачность выставляется только на время блита
+            text_surface.set_alpha(alpha)
+            rect = surface.blit(text_surface, pos)
+            text_surface.set_alpha(255)
+            return rect
+        return surface.blit(text_surface, pos)
+
+    def atlas(self, font, color):
+        key = (font, tuple(color))
+        atlas = self.atlases.get(key)
+        if atlas is None:
+            atlas = self.atlases[key] = GlyphAtlas(font, color)
+        return atlas
+
+    @staticmethod
+    def split_value_text(text):
+        """Делит строку на части: (True, число) и (False, остальной текст)"""
+        parts = []
+        start = 0
+        index = 0
+        length = len(text)
+        chars = GlyphAtlas.CHARS
+        digits = GlyphAtlas.DIGITS
+        while index < length:
+            if text[index] in digits:
+                # Число вместе с соседними знаками, которые есть в атласе
+                begin = index
+                while begin > start and text[begin - 1] in "+-":
+                    begin -= 1
+                end = index
+                while end < length and text[end] in chars:
+                    end += 1
+                if begin > start:
+                    parts.append((False, text[start:begin]))
+                parts.append((True, text[begin:end]))
+                start = index = end
+            else:
+                index += 1
+        if start < length:
+            parts.append((False, text[start:]))
+        return parts
+
+    def value_width(self, font, text, color):
+        """Ширина строки, нарисованной draw_value"""
+        atlas = self.atlas(font, color)
+        width = 0
+        for is_number, part in self.split_value_text(text):
+            width += atlas.width(part) if is_number else self.render(font, part, color).get_width()
+        return width
+
+    def draw_value(self, surface, pos, font, text, color, alpha=None):
+        """Рисует строку с числами: текст из кэша, числа из атласа глифов"""
+        atlas = self.atlas(font, color)
+        x, y = pos
+        for is_number, part in self.split_value_text(text):
+            if is_number:
+                x = atlas.draw(surface, (x, y), part, alpha)
+            else:
+                self.draw(surface, (x, y), font, part, color, alpha)
+                x += self.render(font, part, color).get_width()
+        self.glyph_texts += 1
+        return pygame.Rect(pos[0], y, x - pos[0], atlas.height)
+
+    def stats(self):
+        stats = self.cache.stats()
+        stats["atlases"] = len(self.atlases)
+        stats["glyph_texts"] = self.glyph_texts
+        return stats
+
+
+# Общий кэш текста для GameWindow, UpgradesPanel и ui_components
+text_cache = TextCache()
+
+# Общий кэш стеклянных панелей (VisualEffects.draw_glass_effect, UpgradesPanel.draw_glass_card)
+panel_cache = PanelCache()
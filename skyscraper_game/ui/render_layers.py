@@ -0,0 +1,164 @@
+import pygame
+
+
+class RenderLayer:
+    """Слой интерфейса, кэшированный в отдельной поверхности.
+
+    draw(surface) рисует слой в экранных координатах внутри rect.
+    signature() возвращает значения, от которых зависит картинка слоя;
+    слой перерисовывается только при их изменении или после invalidate().
+    Поверхность слоя непрозрачная: перед отрисовкой в неё копируются
+    нижние слои, поэтому полупрозрачные элементы смешиваются так же,
+    как при рисовании прямо на экран.
+    """
+    def __init__(self, name, rect, draw, signature=None):
+        self.name = name
+        self.rect = pygame.Rect(rect)
+        self.draw = draw
+        self.signature = signature or (lambda: None)
+        self.surface = None
+        self.last_signature = None
+        self.dirty = True
+        self.redraws = 0
+
+    def invalidate(self):
+        self.dirty = True
+
+    def refresh(self, screen_size, lower_layers):
+        """Перерисовать слой, если изменились входные данные. Возвращает True при перерисовке"""
+        signature = self.signature()
+        if not self.dirty and signature == self.last_signature:
+            return False
+
+        if self.surface is None or self.surface.get_size() != screen_size:
+            self.surface = pygame.Surface(screen_size)
+
+        # Основа слоя - то, что под ним на экране
+        self.surface.set_clip(self.rect)
+        self.surface.fill((0, 0, 0), self.rect)
+        for layer in lower_layers:
+            area = self.rect.clip(layer.rect)
+            if layer.surface is not None and area.width and area.height:
+                self.surface.blit(layer.surface, area, area)
+        self.draw(self.surface)
+        self.surface.set_clip(None)
+
+        self.last_signature = signature
+        self.dirty = False
+        self.redraws += 1
+        return True
+
+
+class LayeredRenderer:
+    """Сборка кадра из кэшированных слоев с обновлением только грязных областей.
+
+    Слои складываются снизу вверх в порядке добавления, первый слой
+    должен покрывать весь экран. Поверх слоев
+    рисуется оверлей (сообщения, частицы) - он рисуется каждый кадр прямо
+    на экран, а области, занятые им в прошлом кадре, восстанавливаются
+    из слоев. На экран отправляются только изменившиеся прямоугольники.
+    """
+    def __init__(self, screen, profiler=None):
+        self.screen = screen
+        self.profiler = profiler
+        self.layers = []
+        self.layers_by_name = {}
+        self.overlay_rects = []
+        self.full_redraw = True
+
+        # Статистика последнего кадра
+        self.last_dirty_rects = []
+        self.last_redrawn_layers = []
+
+    def add_layer(self, name, rect, draw, signature=None):
+        layer = RenderLayer(name, rect, draw, signature)
+        self.layers.append(layer)
+        self.layers_by_name[name] = layer
+        return layer
+
+    def invalidate(self, name=None):
+        """Пометить слой (или все слои) для перерисовки"""
+        if name is None:
+            for layer in self.layers:
+                layer.invalidate()
+            self.full_redraw = True
+        else:
+            self.layers_by_name[name].invalidate()
+
+    def compose(self, rect):
+        """Восстановить область экрана из кэшированных слоев"""
+        for layer in self.layers:
+            if layer.surface is None:
+                continue
+            area = rect.clip(layer.rect)
+            if area.width and area.height:
+                self.screen.blit(layer.surface, area, area)
+
+    def needs_render(self, overlay_active=False):
+        """Есть ли что перерисовывать: устаревшие слои, оверлей или его след с прошлого кадра"""
+        if self.full_redraw or overlay_active or self.overlay_rects:
+            return True
+        return any(layer.dirty or layer.signature() != layer.last_signature for layer in self.layers)
+
+    def render(self, draw_overlay=None):
+        """Собрать кадр и обновить дисплей. draw_overlay(screen) возвращает список занятых прямоугольников"""
+        screen_size = self.screen.get_size()
+        screen_rect = self.screen.get_rect()
+        dirty = []
+        self.last_redrawn_layers = []
+
+        for position, layer in enumerate(self.layers):
+            if layer.refresh(screen_size, self.layers[:position]):
+                dirty.append(layer.rect.clip(screen_rect))
+                self.last_redrawn_layers.append(layer.name)
+                # Верхние слои содержат копию этого слоя под собой
+                for upper in self.layers[position + 1:]:
+                    if upper.rect.colliderect(layer.rect):
+                        upper.invalidate()
+
+        # Области прошлого оверлея нужно восстановить из слоев
+        dirty.extend(self.overlay_rects)
+
+        if self.full_redraw:
+            dirty = [screen_rect]
+            self.full_redraw = False
+
+        dirty = self.merge_rects(dirty)
+        for rect in dirty:
+            self.compose(rect)
+
+        self.overlay_rects = []
+        if draw_overlay is not None:
+            for rect in draw_overlay(self.screen) or []:
+                rect = pygame.Rect(rect).clip(screen_rect)
+                if rect.width and rect.height:
+                    self.overlay_rects.append(rect)
+        dirty = self.merge_rects(dirty + self.overlay_rects)
+
+        if dirty:
+            if self.profiler is not None:
+                self.profiler.measure("display", pygame.display.update, dirty)
+            else:
+                pygame.display.update(dirty)
+        self.last_dirty_rects = dirty
+        return dirty
+
+    @staticmethod
+    def merge_rects(rects):
+        """Объединить пересекающиеся прямоугольники (чтобы не рисовать область дважды)"""
+        merged = []
+        for rect in rects:
+            if not rect.width or not rect.height:
+                continue
+            rect = pygame.Rect(rect)
+            changed = True
+            while changed:
+                changed = False
+                for other in merged:
+                    if rect.colliderect(other):
+                        merged.remove(other)
+                        rect.union_ip(other)
+                        changed = True
+                        break
+            merged.append(rect)
+        return merged
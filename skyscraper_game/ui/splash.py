@@ -0,0 +1,35 @@
+import math
+import pygame
+
+
+class SplashScreen:
+    """Легкий первый кадр, пока шрифты, конфигурации и сохранение грузятся в фоне.
+
+    Использует только встроенный шрифт pygame, поэтому рисуется сразу
+    после создания окна. Все надписи (statuses) рендерятся в конструкторе:
+    пока идет загрузка, шрифты создаются в фоновом потоке, а SDL_ttf не
+    потокобезопасен, поэтому draw() только копирует готовые поверхности.
+    """
+    def __init__(self, size, statuses, title="🏢 Небоскрёб Мечты"):
+        self.screen = pygame.display.set_mode(size)
+        pygame.display.set_caption(title)
+        font = pygame.font.Font(None, 42)
+        small_font = pygame.font.Font(None, 24)
+        self.title = font.render("Skyscraper", True, (60, 90, 140))
+        self.status_surfaces = {status: small_font.render(status, True, (100, 110, 140))
+                                for status in statuses}
+
+    def draw(self, status, elapsed):
+        """Кадр заставки: название, текущий этап (из statuses) и бегущая полоска"""
+        status_surface = self.status_surfaces[status]
+
+        width, height = self.screen.get_size()
+        self.screen.fill((230, 238, 255))
+        self.screen.blit(self.title, (width // 2 - self.title.get_width() // 2, height // 2 - 60))
+        self.screen.blit(status_surface, (width // 2 - status_surface.get_width() // 2, height // 2))
+
+        bar = pygame.Rect(width // 2 - 150, height // 2 + 40, 300, 6)
+        pygame.draw.rect(self.screen, (200, 210, 235), bar, border_radius=3)
+        position = (math.sin(elapsed * 3) + 1) / 2 * (bar.width - 60)
+        pygame.draw.rect(self.screen, (80, 150, 220), (bar.x + position, bar.y, 60, bar.height), border_radius=3)
+        pygame.display.flip()
@@ -1,5 +1,6 @@
 # ui_components.py
 import pygame
+from .render_cache import text_cache
 
 class UIComponent:
     """Базовый класс для всех UI компонентов"""
@@ -10,6 +11,14 @@ class UIComponent:
         
     def handle_event(self, event):
         return False
+
+    def on_enter(self):
+        """Курсор вошел в компонент (вызывает UIManager)"""
+        pass
+
+    def on_leave(self):
+        """Курсор покинул компонент (вызывает UIManager)"""
+        pass
         
     def draw(self, surface):
         pass
@@ -32,6 +41,12 @@ class Button(UIComponent):
             'pressed': (200, 200, 200),
             'text': (255, 255, 255)
         }
+
+    def on_enter(self):
+        self.hovered = True
+
+    def on_leave(self):
+        self.hovered = False
         
     def handle_event(self, event):
         if not self.enabled or not self.visible:
@@ -75,44 +90,120 @@ class Button(UIComponent):
         pygame.draw.rect(surface, (0, 0, 0), self.rect, 2, border_radius=8)
         
         # Рисуем текст
-        text_surface = self.font.render(self.text, True, self.colors['text'])
+        text_surface = text_cache.render(self.font, self.text, self.colors['text'])
         text_rect = text_surface.get_rect(center=self.rect.center)
         surface.blit(text_surface, text_rect)
 
 class UIManager:
-    """Централизованный менеджер UI компонентов"""
-    def __init__(self):
+    """Централизованный менеджер UI компонентов.
+
+    Прямоугольники компонентов разложены по ячейкам сетки, поэтому
+    компонент под курсором находится просмотром одной ячейки, а не всего
+    списка. Наведение отслеживается переходами: при движении мыши
+    затрагиваются только прежний и новый компонент под курсором.
+    """
+    MOUSE_EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+
+    def __init__(self, cell_size=64):
         self.components = []
+        self.cell_size = cell_size
+        self.grid = {}           # (столбец, строка) -> компоненты в порядке добавления
+        self.cells = {}          # id(компонента) -> ячейки, в которые он попал
+        self.order = {}          # id(компонента) -> порядок добавления (кто выше)
+        self.hovered = None      # компонент под курсором
+        self.captured = None     # компонент, на котором нажата кнопка мыши
         
     def add_component(self, component):
         """Добавляет компонент в менеджер"""
+        self.order[id(component)] = len(self.components)
         self.components.append(component)
+        self.index_component(component)
+
+    def remove_component(self, component):
+        """Убирает компонент из менеджера"""
+        self.unindex_component(component)
+        self.components.remove(component)
+        self.order = {id(c): position for position, c in enumerate(self.components)}
+        if self.hovered is component:
+            component.on_leave()
+            self.hovered = None
+        if self.captured is component:
+            self.captured = None
+
+    def move_component(self, component, rect):
+        """Меняет прямоугольник компонента и обновляет индекс"""
+        self.unindex_component(component)
+        component.rect = pygame.Rect(rect)
+        self.index_component(component)
+
+    def cells_for(self, rect):
+        size = self.cell_size
+        for column in range(rect.left // size, (rect.right - 1) // size + 1):
+            for row in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                yield column, row
+
+    def index_component(self, component):
+        cells = list(self.cells_for(component.rect))
+        for cell in cells:
+            self.grid.setdefault(cell, []).append(component)
+        self.cells[id(component)] = cells
+
+    def unindex_component(self, component):
+        for cell in self.cells.pop(id(component), []):
+            bucket = self.grid[cell]
+            bucket.remove(component)
+            if not bucket:
+                del self.grid[cell]
+
+    def component_at(self, pos):
+        """Верхний видимый и активный компонент под точкой pos (или None)"""
+        cell = (pos[0] // self.cell_size, pos[1] // self.cell_size)
+        found = None
+        for component in self.grid.get(cell, ()):
+            if component.visible and component.enabled and component.rect.collidepoint(pos):
+                # Добавленный позже рисуется выше
+                if found is None or self.order[id(component)] > self.order[id(found)]:
+                    found = component
+        return found
+
+    def update_hover(self, pos):
+        """Переход наведения: on_leave прежнему компоненту, on_enter новому"""
+        component = self.component_at(pos)
+        if component is self.hovered:
+            return
+        if self.hovered is not None:
+            self.hovered.on_leave()
+        self.hovered = component
+        if component is not None:
+            component.on_enter()
         
     def handle_event(self, event):
         """Обрабатывает события для всех компонентов"""
-        handled = False
-        
-        if event.type == pygame.MOUSEMOTION:
-            # Сбрасываем hover для всех компонентов
-            for component in self.components:
-                if hasattr(component, 'hovered'):
-                    component.hovered = False
-            
-            # Устанавливаем hover для компонента под курсором
+        if event.type not in self.MOUSE_EVENTS:
+            # Остальные события (клавиатура) получают все компоненты
             for component in reversed(self.components):
-                if component.visible and component.enabled and component.rect.collidepoint(event.pos):
-                    if hasattr(component, 'hovered'):
-                        component.hovered = True
-                    break
-                    
-        # Передаем событие всем компонентам
-        for component in reversed(self.components):
-            if component.visible and component.enabled:
-                if component.handle_event(event):
-                    handled = True
-                    break
-                    
-        return handled
+                if component.visible and component.enabled:
+                    if component.handle_event(event):
+                        return True
+            return False
+
+        self.update_hover(event.pos)
+        if event.type == pygame.MOUSEMOTION:
+            return False
+
+        # Событие мыши получает компонент под курсором и компонент, на котором была нажата кнопка
+        targets = [self.hovered] if self.hovered is not None else []
+        if self.captured is not None and self.captured is not self.hovered:
+            targets.append(self.captured)
+        if event.type == pygame.MOUSEBUTTONUP:
+            self.captured = None
+
+        for component in targets:
+            if component.visible and component.enabled and component.handle_event(event):
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    self.captured = component
+                return True
+        return False
     
     def update(self):
         """Обновляет все компоненты"""
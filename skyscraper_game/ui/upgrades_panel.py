@@ -1,5 +1,7 @@
 import pygame
 import math
+from .render_cache import panel_cache, text_cache
+from .fonts import PANEL_FONTS, load_font_set
 
 class UpgradesPanel:
     def __init__(self, game, x, y, width, height):
@@ -7,14 +9,10 @@ class UpgradesPanel:
         self.rect = pygame.Rect(x, y, width, height)
         
         # Загрузка шрифтов
-        try:
-            self.title_font = pygame.font.Font('assets/fonts/main.ttf', 20)
-            self.font = pygame.font.Font('assets/fonts/main.ttf', 16)
-            self.small_font = pygame.font.Font('assets/fonts/main.ttf', 14)
-        except:
-            self.title_font = pygame.font.SysFont('Arial', 20, bold=True)
-            self.font = pygame.font.SysFont('Arial', 16)
-            self.small_font = pygame.font.SysFont('Arial', 14)
+        fonts = load_font_set(PANEL_FONTS)
+        self.title_font = fonts['title_font']
+        self.font = fonts['font']
+        self.small_font = fonts['small_font']
         
         # Цветовая схема
         self.colors = {
@@ -39,14 +37,9 @@ class UpgradesPanel:
 
     def draw_glass_card(self, surface, rect, color):
         """Рисует стеклянную карточку"""
-        card_surface = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(card_surface, color, (0, 0, rect.width, rect.height), border_radius=12)
-        
-        # Блик
-        pygame.draw.rect(card_surface, (255, 255, 255, 40), 
-                        (0, 0, rect.width, rect.height//4), 
-                        border_radius=12)
-        
+        # Готовая карточка из кэша, блик - верхняя четверть
+        alpha = color[3] if len(color) > 3 else 255
+        card_surface = panel_cache.get((rect.width, rect.height), color, alpha, 40, 4)
         surface.blit(card_surface, (rect.x, rect.y))
         return rect
 
@@ -58,18 +51,17 @@ class UpgradesPanel:
         # Иконка и название
         icon = self.upgrade_icons.get(upgrade_data['name'], "⭐")
         title_text = f"{icon} {upgrade_data.get('display_name', upgrade_data['name'])}"
-        title_surface = self.font.render(title_text, True, self.colors['text'])
+        title_surface = text_cache.render(self.font, title_text, self.colors['text'])
         surface.blit(title_surface, (rect.x + 15, rect.y + 12))
         
         # Уровень
         level_text = f"Ур. {upgrade_data['current_level']}/{upgrade_data['max_level']}"
-        level_surface = self.small_font.render(level_text, True, self.colors['text_secondary'])
-        surface.blit(level_surface, (rect.x + 15, rect.y + 35))
+        text_cache.draw_value(surface, (rect.x + 15, rect.y + 35), self.small_font, level_text, self.colors['text_secondary'])
         
         # Эффекты
         if upgrade_data['effects']:
             effects_text = " • ".join(upgrade_data['effects'])
-            effects_surface = self.small_font.render(effects_text, True, self.colors['text_secondary'])
+            effects_surface = text_cache.render(self.small_font, effects_text, self.colors['text_secondary'])
             surface.blit(effects_surface, (rect.x + 15, rect.y + 55))
         
         # Кнопка улучшения
@@ -102,9 +94,9 @@ class UpgradesPanel:
         
         # Текст стоимости
         cost_text = f"{upgrade_data['next_cost']} руб."
-        text_surface = self.small_font.render(cost_text, True, self.colors['text'])
-        surface.blit(text_surface, (rect.centerx - text_surface.get_width()//2, 
-                                  rect.centery - text_surface.get_height()//2))
+        text_width = text_cache.value_width(self.small_font, cost_text, self.colors['text'])
+        text_cache.draw_value(surface, (rect.centerx - text_width//2, rect.centery - self.small_font.get_height()//2),
+                              self.small_font, cost_text, self.colors['text'])
 
     def render(self, surface):
         """Отрисовка панели улучшений"""
@@ -112,7 +104,7 @@ class UpgradesPanel:
         self.draw_glass_card(surface, self.rect, self.colors['background'])
         
         # Заголовок
-        title = self.title_font.render("🚀 Глобальные улучшения", True, self.colors['text'])
+        title = text_cache.render(self.title_font, "🚀 Глобальные улучшения", self.colors['text'])
         surface.blit(title, (self.rect.x + 15, self.rect.y + 15))
         
         y_offset = 50
@@ -142,12 +134,11 @@ class UpgradesPanel:
             self.draw_upgrade_card(surface, card_rect, info, can_afford)
             y_offset += card_height + 10
 
-    def handle_click(self, pos):
-        """Обработка кликов по панели улучшений"""
+    def button_at(self, pos):
+        """Тип улучшения, на кнопку которого указывает pos (None, если ни на какую)"""
         if not self.rect.collidepoint(pos):
-            return False
+            return None
         
-        x, y = pos
         y_offset = 50
         card_height = 100
         
@@ -156,13 +147,15 @@ class UpgradesPanel:
         for upgrade_type in upgrades:
             card_rect = pygame.Rect(self.rect.x + 10, self.rect.y + y_offset, 
                                   self.rect.width - 20, card_height)
-            
-            if card_rect.collidepoint(x, y):
-                # Проверяем клик по кнопке улучшения
-                button_rect = pygame.Rect(card_rect.right - 130, card_rect.y + 15, 115, 50)
-                if button_rect.collidepoint(x, y):
-                    return self.game.buy_global_upgrade(upgrade_type)
-            
+            button_rect = pygame.Rect(card_rect.right - 130, card_rect.y + 15, 115, 50)
+            if button_rect.collidepoint(pos):
+                return upgrade_type
             y_offset += card_height + 10
-        
-        return False
\ No newline at end of file
+        return None
+
+    def handle_click(self, pos):
+        """Обработка кликов по панели улучшений"""
+        upgrade_type = self.button_at(pos)
+        if upgrade_type is None:
+            return False
+        return self.game.buy_global_upgrade(upgrade_type)